@@ -1,10 +1,11 @@
 """공통 API 의존성"""
 import logging
+import secrets
 import threading
 from datetime import datetime, timezone, timedelta
 from typing import Optional
 
-from fastapi import Cookie, HTTPException
+from fastapi import Cookie, Header, HTTPException
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
@@ -93,3 +94,19 @@ def require_admin(admin_token: Optional[str] = Cookie(None)):
     if valid_tokens[admin_token] < datetime.now(timezone.utc):
         del valid_tokens[admin_token]
         raise HTTPException(status_code=403, detail="토큰이 만료되었습니다")
+
+
+def require_metrics_access(
+    authorization: Optional[str] = Header(None),
+    admin_token: Optional[str] = Cookie(None),
+):
+    """메트릭 조회 인증 의존성
+
+    METRICS_TOKEN이 설정되어 있으면 `Authorization: Bearer <토큰>`(Prometheus 스크레이퍼용)을 허용하고,
+    그 외에는 관리자 쿠키를 요구한다.
+    """
+    if settings.metrics_token and authorization:
+        scheme, _, token = authorization.partition(" ")
+        if scheme.lower() == "bearer" and secrets.compare_digest(token.strip(), settings.metrics_token):
+            return
+    require_admin(admin_token)
@@ -1,6 +1,5 @@
 """뉴스 크롤링 API 라우트 (RSS 기반)"""
 import asyncio
-import json
 import logging
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
@@ -13,6 +12,9 @@ from app.core.news_crawler import (
     group_by_phishing_type,
     format_articles_as_seed,
 )
+from app.config import settings
+from app.core import json_codec, metrics
+from app.core.atomic_io import run_io
 from app.models.news import PhishingArticle
 from app.pipeline.tree_builder import ScenarioTreeBuilder
 from app.api.routes.scenario import _save_scenario
@@ -44,20 +46,19 @@ def _save_articles_to_file(articles: list[PhishingArticle]) -> str:
     data = {
         "crawled_at": now.isoformat(),
         "total_count": len(articles),
-        "articles": [a.model_dump() for a in articles]
+        "articles": [a.model_dump(mode="json") for a in articles]
     }
+    body = json_codec.dumps(data, pretty=settings.json_pretty)
     
     # 날짜별 파일 저장
     date_str = now.strftime("%Y-%m-%d")
     date_file = NEWS_CACHE_DIR / f"articles_{date_str}.json"
     
-    with open(date_file, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2, default=str)
+    json_codec.write_bytes(date_file, body)
     
     # 최신 파일도 저장 (덮어쓰기)
     latest_file = NEWS_CACHE_DIR / "articles_latest.json"
-    with open(latest_file, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2, default=str)
+    json_codec.write_bytes(latest_file, body)
     
     logger.info("기사 저장 완료: %s (%d개)", date_file.name, len(articles))
     return str(date_file)
@@ -76,8 +77,7 @@ def _load_articles_from_file() -> dict[str, PhishingArticle]:
         return {}
     
     try:
-        with open(latest_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = json_codec.read_json(latest_file)
         
         articles = {}
         for item in data.get("articles", []):
@@ -155,6 +155,12 @@ class GenerateScenariosRequest(BaseModel):
     )
 
 
+async def _run_in_task_scope(task_id: str, runner, *args):
+    """작업별 메트릭(crawler_tasks[task_id]["metrics"]) 범위 안에서 백그라운드 작업 실행"""
+    with metrics.task_scope(crawler_tasks[task_id]["metrics"]):
+        await runner(task_id, *args)
+
+
 async def _run_refresh(task_id: str, keywords: list[str] | None):
     """백그라운드에서 크롤링 + 필터링 실행"""
     global analyzed_articles
@@ -169,7 +175,7 @@ async def _run_refresh(task_id: str, keywords: list[str] | None):
         analyzed_articles = {a.id: a for a in articles}
         
         # JSON 파일로 저장
-        _save_articles_to_file(articles)
+        await run_io(_save_articles_to_file, articles)
 
         crawler_tasks[task_id]["articles_count"] = len(articles)
         crawler_tasks[task_id]["status"] = "completed"
@@ -211,9 +217,10 @@ async def refresh_articles(
     crawler_tasks[task_id] = {
         "status": "pending",
         "keywords": body.keywords,
+        "metrics": metrics.Metrics(),
     }
 
-    background_tasks.add_task(_run_refresh, task_id, body.keywords)
+    background_tasks.add_task(_run_in_task_scope, task_id, _run_refresh, body.keywords)
 
     logger.info("[%s] 크롤링 새로고침 시작", task_id)
 
@@ -231,7 +238,11 @@ async def get_crawl_status(request: Request, task_id: str) -> dict:
     if task_id not in crawler_tasks:
         raise HTTPException(status_code=404, detail="Task not found")
 
-    return crawler_tasks[task_id]
+    task = crawler_tasks[task_id]
+    task_metrics = task.get("metrics")
+    if task_metrics is None:
+        return task
+    return {**task, "metrics": task_metrics.summary()}
 
 
 @router.get("/articles")
@@ -290,10 +301,11 @@ async def generate_from_article(
         "article_id": body.article_id,
         "article_title": article.title,
         "difficulty": body.difficulty,
+        "metrics": metrics.Metrics(),
     }
 
     background_tasks.add_task(
-        _run_generate_from_article, task_id, article, body.difficulty
+        _run_in_task_scope, task_id, _run_generate_from_article, article, body.difficulty
     )
 
     logger.info("[%s] 기사 기반 시나리오 생성 시작: %s", task_id, article.title)
@@ -324,7 +336,7 @@ async def _run_generate_from_article(
             seed_info=seed_info,
         )
 
-        _save_scenario(scenario)
+        await _save_scenario(scenario)
 
         crawler_tasks[task_id]["status"] = "completed"
         crawler_tasks[task_id]["scenario_id"] = scenario.id
@@ -420,7 +432,7 @@ async def _run_generate_scenarios(task_id: str, request: GenerateScenariosReques
         analyzed_articles = {a.id: a for a in articles}
         
         # JSON 파일로 저장
-        _save_articles_to_file(articles)
+        await run_io(_save_articles_to_file, articles)
 
         crawler_tasks[task_id]["articles_count"] = len(articles)
         logger.info("[%s] 분석 완료: %d개 기사", task_id, len(articles))
@@ -468,7 +480,7 @@ async def _run_generate_scenarios(task_id: str, request: GenerateScenariosReques
                 seed_info=seed_info,
             )
 
-            _save_scenario(scenario)
+            await _save_scenario(scenario)
             scenario_ids.append(scenario.id)
             scenarios_generated += 1
 
@@ -512,9 +524,10 @@ async def generate_scenarios_from_news(
         "phishing_type": body.phishing_type,
         "difficulty": body.difficulty,
         "max_scenarios": body.max_scenarios,
+        "metrics": metrics.Metrics(),
     }
 
-    background_tasks.add_task(_run_generate_scenarios, task_id, body)
+    background_tasks.add_task(_run_in_task_scope, task_id, _run_generate_scenarios, body)
 
     logger.info("[%s] 시나리오 생성 요청 시작", task_id)
 
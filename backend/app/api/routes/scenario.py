@@ -1,13 +1,25 @@
 """시나리오 API 라우트"""
-import json
 import asyncio
 import logging
+import time
+from datetime import datetime
 from pathlib import Path
+from typing import Literal
 from uuid import uuid4
 from pydantic import BaseModel, Field
-from fastapi import APIRouter, HTTPException, BackgroundTasks, Depends, Request
-
-from app.models.scenario import ScenarioTree
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Depends, Query, Request, Response
+
+from app.config import settings
+from app.models.scenario import ScenarioTree, ScenarioNode, ProtagonistProfile
+from app.core.http_cache import select_encoding
+from app.core.scenario_catalog import ScenarioCatalog
+from app.core.scenario_storage import create_storage
+from app.core.scenario_query import (
+    ScenarioQuery, InvalidCursorError, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE,
+    encode_cursor, decode_cursor, to_utc_iso,
+)
+from app.core import metrics
+from app.core.atomic_io import run_io
 from app.pipeline.tree_builder import ScenarioTreeBuilder
 from app.api.deps import require_admin, limiter, acquire_task_slot, release_task_slot, cleanup_task_dict, sanitize_error
 
@@ -29,71 +41,197 @@ class GenerateRequest(BaseModel):
     seed_info: str | None = Field(default=None, max_length=2000)
 
 
-def _load_scenario(file_path: Path) -> ScenarioTree:
-    """JSON 파일에서 시나리오 로드"""
-    with open(file_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    return ScenarioTree.model_validate(data)
+class ScenarioNodesResponse(BaseModel):
+    """노드 단위 조회 응답 (시나리오 헤더 + 요청 노드와 하위 노드)"""
+    scenario_id: str
+    title: str
+    root_node_id: str
+    protagonist: ProtagonistProfile | None = None
+    prologue: str | None = None
+    node_id: str
+    nodes: dict[str, ScenarioNode]
+
 
+# 시나리오 저장소 (settings.scenario_storage: json | sqlite)
+scenario_storage = create_storage(
+    settings.scenario_storage,
+    directories=[SEED_SCENARIOS_DIR, SCENARIOS_DIR],
+    db_path=Path(settings.scenario_db_path) if settings.scenario_db_path else None,
+    pretty=settings.json_pretty,
+)
 
-def _save_scenario(scenario: ScenarioTree):
-    """시나리오를 JSON 파일로 저장"""
-    SCENARIOS_DIR.mkdir(parents=True, exist_ok=True)
-    file_path = SCENARIOS_DIR / f"{scenario.id}.json"
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(scenario.model_dump(mode="json"), f, ensure_ascii=False, indent=2)
+# 시나리오 카탈로그 (요약 목록 + 파싱 트리 LRU)
+scenario_catalog = ScenarioCatalog(
+    scenario_storage,
+    refresh_interval=settings.scenario_refresh_interval,
+    cache_max_entries=settings.scenario_cache_max_entries,
+    cache_max_bytes=settings.scenario_cache_max_bytes,
+)
 
 
-def _get_all_scenarios() -> list[ScenarioTree]:
-    """모든 시나리오 로드 (시드 + 생성된 시나리오)"""
-    scenarios = []
+def _load_scenario(scenario_id: str, writable: bool = False) -> ScenarioTree | None:
+    """저장소에서 시나리오 로드 (writable=True면 수정 가능한 시나리오만, 시드 제외)"""
+    if writable:
+        return scenario_storage.load_writable(scenario_id)
+    return scenario_storage.load(scenario_id)
 
-    # 시드 시나리오 로드
-    if SEED_SCENARIOS_DIR.exists():
-        for file_path in SEED_SCENARIOS_DIR.glob("*.json"):
-            try:
-                scenarios.append(_load_scenario(file_path))
-            except Exception:
-                continue
 
-    # 생성된 시나리오 로드
-    if SCENARIOS_DIR.exists():
-        for file_path in SCENARIOS_DIR.glob("*.json"):
-            try:
-                scenarios.append(_load_scenario(file_path))
-            except Exception:
-                continue
+async def _save_scenario(scenario: ScenarioTree):
+    """시나리오 저장 (I/O 스레드풀에서 원자적 저장 후 카탈로그 갱신)"""
+    await run_io(scenario_storage.save, scenario)
+    scenario_catalog.put(scenario)
 
-    return scenarios
+
+async def _update_nodes(scenario_id: str, nodes: list[ScenarioNode]):
+    """일부 노드만 저장 (SQLite는 해당 행만 갱신)"""
+    await run_io(scenario_storage.update_nodes, scenario_id, nodes)
+    scenario_catalog.invalidate(scenario_id)
 
 
 @router.get("")
 @limiter.limit("60/minute")
-async def list_scenarios(request: Request) -> list[dict]:
-    """시나리오 목록 조회"""
-    scenarios = _get_all_scenarios()
-    return [
-        {
-            "id": s.id,
-            "title": s.title,
-            "description": s.description,
-            "phishing_type": s.phishing_type,
-            "difficulty": s.difficulty,
-            "created_at": s.created_at.isoformat(),
-        }
-        for s in scenarios
-    ]
+async def list_scenarios(
+    request: Request,
+    response: Response,
+    phishing_type: str | None = Query(default=None, max_length=50),
+    difficulty: Literal["easy", "medium", "hard"] | None = None,
+    created_from: datetime | None = Query(default=None, description="이 시각 이후 (포함)"),
+    created_to: datetime | None = Query(default=None, description="이 시각 이전 (미포함)"),
+    sort: Literal["created_at", "title"] = "created_at",
+    order: Literal["asc", "desc"] = "desc",
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(default=None, max_length=512),
+) -> list[dict]:
+    """시나리오 목록 조회 (요약 인덱스 기반, 트리 파싱 없음)
+
+    다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 내려준다.
+    같은 필터/정렬로 cursor 파라미터에 넣어 다음 페이지를 조회한다.
+    """
+    query = ScenarioQuery(
+        phishing_type=phishing_type,
+        difficulty=difficulty,
+        created_from=to_utc_iso(created_from) if created_from else None,
+        created_to=to_utc_iso(created_to) if created_to else None,
+        sort=sort,
+        descending=order == "desc",
+        limit=limit,
+    )
+    if cursor:
+        try:
+            query.cursor = decode_cursor(query, cursor)
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    scenario_catalog.refresh()
+    page, next_cursor = scenario_catalog.query(query)
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = encode_cursor(query, next_cursor)
+    return page
+
+
+@router.get("/search", dependencies=[Depends(require_admin)])
+@limiter.limit("60/minute")
+async def search_scenarios(
+    request: Request,
+    q: str = Query(min_length=1, max_length=200),
+    limit: int = Query(default=20, ge=1, le=100),
+) -> dict:
+    """시나리오 전문 검색 (관리자 전용)
+
+    제목/설명/노드 본문/선택지/위험 피드백의 문자 bigram 역색인.
+    공백으로 구분한 모든 단어를 포함하는 시나리오만 반환한다.
+    """
+    started = time.perf_counter()
+    results = scenario_catalog.search(q, limit)
+    return {
+        "query": q,
+        "results": results,
+        "indexed": len(scenario_catalog.search_index),
+        "took_ms": round((time.perf_counter() - started) * 1000, 3),
+    }
 
 
-@router.get("/{scenario_id}")
+@router.get("/{scenario_id}", response_model=ScenarioTree)
 @limiter.limit("60/minute")
-async def get_scenario(request: Request, scenario_id: str) -> ScenarioTree:
-    """시나리오 상세 조회"""
-    scenarios = _get_all_scenarios()
-    for scenario in scenarios:
-        if scenario.id == scenario_id:
-            return scenario
-    raise HTTPException(status_code=404, detail="Scenario not found")
+async def get_scenario(request: Request, scenario_id: str) -> Response:
+    """시나리오 상세 조회
+
+    ID → 파일 경로 직접 조회 + 파싱 트리 LRU. 직렬화/압축된 바이트를 캐시하여
+    If-None-Match(304)와 Accept-Encoding(br/gzip)을 처리한다.
+    """
+    encoding = select_encoding(request.headers.get("accept-encoding"))
+    payload = scenario_catalog.get_payload(scenario_id, encoding)
+    if payload is None:
+        raise HTTPException(status_code=404, detail="Scenario not found")
+
+    headers = {
+        "ETag": payload.etag_for(encoding),
+        "Vary": "Accept-Encoding",
+        "Cache-Control": "no-cache",
+    }
+    if payload.matches(request.headers.get("if-none-match")):
+        return Response(status_code=304, headers=headers)
+
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(
+        content=payload.encoded(encoding),
+        media_type="application/json",
+        headers=headers,
+    )
+
+
+def _collect_subtree(scenario: ScenarioTree, node_id: str, depth: int) -> dict[str, ScenarioNode]:
+    """node_id부터 depth 단계 아래까지의 노드 수집 (nodes dict + 선택지 링크로 BFS)"""
+    collected = {node_id: scenario.nodes[node_id]}
+    level = [node_id]
+    for _ in range(depth):
+        next_level = []
+        for current_id in level:
+            for choice in scenario.nodes[current_id].choices:
+                child_id = choice.next_node_id
+                if child_id and child_id not in collected and child_id in scenario.nodes:
+                    collected[child_id] = scenario.nodes[child_id]
+                    next_level.append(child_id)
+        if not next_level:
+            break
+        level = next_level
+    return collected
+
+
+@router.get("/{scenario_id}/nodes/{node_id}")
+@limiter.limit("120/minute")
+async def get_scenario_nodes(
+    request: Request,
+    scenario_id: str,
+    node_id: str,
+    prefetch_depth: int = Query(default=1, ge=0, le=5),
+) -> ScenarioNodesResponse:
+    """노드 단위 조회 (지연 로딩용)
+
+    요청 노드와 prefetch_depth 단계까지의 하위 노드, 시나리오 헤더(주인공, 프롤로그, 루트 ID)만 반환한다.
+    """
+    scenario = scenario_catalog.get(scenario_id)
+    if scenario is None:
+        raise HTTPException(status_code=404, detail="Scenario not found")
+    if node_id not in scenario.nodes:
+        raise HTTPException(status_code=404, detail="Node not found")
+
+    return ScenarioNodesResponse(
+        scenario_id=scenario.id,
+        title=scenario.title,
+        root_node_id=scenario.root_node_id,
+        protagonist=scenario.protagonist,
+        prologue=scenario.prologue,
+        node_id=node_id,
+        nodes=_collect_subtree(scenario, node_id, prefetch_depth),
+    )
+
+
+async def _run_in_task_scope(task_id: str, runner, *args):
+    """작업별 메트릭(generation_tasks[task_id]["metrics"]) 범위 안에서 백그라운드 작업 실행"""
+    with metrics.task_scope(generation_tasks[task_id]["metrics"]):
+        await runner(task_id, *args)
 
 
 async def _run_generation(task_id: str, request: GenerateRequest):
@@ -109,7 +247,7 @@ async def _run_generation(task_id: str, request: GenerateRequest):
             seed_info=request.seed_info,
         )
 
-        _save_scenario(scenario)
+        await _save_scenario(scenario)
 
         generation_tasks[task_id]["status"] = "completed"
         generation_tasks[task_id]["scenario_id"] = scenario.id
@@ -141,9 +279,10 @@ async def generate_scenario(
         "status": "pending",
         "phishing_type": body.phishing_type,
         "difficulty": body.difficulty,
+        "metrics": metrics.Metrics(),
     }
 
-    background_tasks.add_task(_run_generation, task_id, body)
+    background_tasks.add_task(_run_in_task_scope, task_id, _run_generation, body)
 
     return {"task_id": task_id, "status": "started"}
 
@@ -156,7 +295,10 @@ async def get_generation_status(request: Request, scenario_id: str) -> dict:
         raise HTTPException(status_code=404, detail="Task not found")
 
     task = generation_tasks[scenario_id]
-    return task
+    task_metrics = task.get("metrics")
+    if task_metrics is None:
+        return task
+    return {**task, "metrics": task_metrics.summary()}
 
 
 @router.post("/{scenario_id}/regenerate-images", dependencies=[Depends(require_admin)])
@@ -171,13 +313,11 @@ async def regenerate_failed_images(
     
     image_url이 null인 노드만 대상으로 이미지를 다시 생성합니다.
     """
-    # 시나리오 로드
-    scenario_file = SCENARIOS_DIR / f"{scenario_id}.json"
-    if not scenario_file.exists():
+    # 시나리오 로드 (시드 시나리오는 수정 대상이 아님)
+    scenario = _load_scenario(scenario_id, writable=True)
+    if scenario is None:
         raise HTTPException(status_code=404, detail="Scenario not found")
     
-    scenario = _load_scenario(scenario_file)
-    
     # 실패한 노드 확인
     failed_nodes = [
         node_id for node_id, node in scenario.nodes.items()
@@ -201,9 +341,10 @@ async def regenerate_failed_images(
         "scenario_id": scenario_id,
         "failed_count": len(failed_nodes),
         "failed_nodes": failed_nodes,
+        "metrics": metrics.Metrics(),
     }
     
-    background_tasks.add_task(_run_image_regeneration, task_id, scenario_id)
+    background_tasks.add_task(_run_in_task_scope, task_id, _run_image_regeneration, scenario_id)
     
     return {
         "task_id": task_id,
@@ -214,17 +355,17 @@ async def regenerate_failed_images(
 
 
 async def _run_image_regeneration(task_id: str, scenario_id: str):
-    """백그라운드에서 실패한 이미지 재생성 (배치 병렬 처리)"""
-    from app.core.image_generator import generate_image
-    from app.config import settings
+    """백그라운드에서 실패한 이미지 재생성 (병렬 처리, 공유 속도 제한)"""
+    from app.core.image_generator import generate_image, image_limiter
     
     try:
         generation_tasks[task_id]["status"] = "regenerating"
         logger.info(f"이미지 재생성 시작: scenario={scenario_id}")
         
         # 시나리오 로드
-        scenario_file = SCENARIOS_DIR / f"{scenario_id}.json"
-        scenario = _load_scenario(scenario_file)
+        scenario = _load_scenario(scenario_id, writable=True)
+        if scenario is None:
+            raise RuntimeError("Scenario not found")
         
         # 실패한 노드 추출
         failed_nodes = [
@@ -233,38 +374,24 @@ async def _run_image_regeneration(task_id: str, scenario_id: str):
         ]
         
         total = len(failed_nodes)
-        success_count = 0
-        batch_size = settings.image_batch_size  # 기본 25개
-        
-        # 배치 병렬 처리
-        for i in range(0, total, batch_size):
-            batch = failed_nodes[i:i + batch_size]
-            batch_num = i // batch_size + 1
-            total_batches = (total + batch_size - 1) // batch_size
-            
-            logger.info(f"재생성 배치 {batch_num}/{total_batches}: {len(batch)}개 처리 중...")
-            
-            # 배치 내 병렬 생성
-            async def generate_single(node_id: str, node):
-                url = await generate_image(node.image_prompt, node_id, scenario_id)
-                if url:
-                    node.image_url = url
-                    return True
-                return False
-            
-            tasks = [generate_single(node_id, node) for node_id, node in batch]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            batch_success = sum(1 for r in results if r is True)
-            success_count += batch_success
-            logger.info(f"배치 {batch_num} 완료: {batch_success}/{len(batch)} 성공")
-            
-            # 다음 배치 전 대기 (API 할당량 관리)
-            if i + batch_size < total:
-                await asyncio.sleep(settings.image_batch_wait)
-        
-        # 시나리오 저장
-        _save_scenario(scenario)
+        logger.info(f"재생성 대상: {total}개 (속도 제한 대기열 {image_limiter.queued}개)")
+
+        # 병렬 생성 (Imagen 분당 제한은 공유 image_limiter가 적용)
+        async def generate_single(node_id: str, node):
+            url = await generate_image(node.image_prompt, node_id, scenario_id)
+            if url:
+                node.image_url = url
+                return True
+            return False
+
+        tasks = [generate_single(node_id, node) for node_id, node in failed_nodes]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        success_count = sum(1 for r in results if r is True)
+
+        # 변경된 노드만 저장
+        updated_nodes = [node for _, node in failed_nodes if node.image_url]
+        if updated_nodes:
+            await _update_nodes(scenario_id, updated_nodes)
         
         generation_tasks[task_id]["status"] = "completed"
         generation_tasks[task_id]["success_count"] = success_count
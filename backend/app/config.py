@@ -26,21 +26,63 @@ class Settings(BaseSettings):
 
     # 관리자 인증
     admin_password: str = ""
+    metrics_token: str = ""  # /metrics 스크레이프용 Bearer 토큰 (비어 있으면 관리자 쿠키만 허용)
 
     # 파이프라인 설정
     max_depth: int = 5
     max_choices: int = 3
-    semaphore_limit: int = 5
+    semaphore_limit: int = 5  # 빌드당 이미지 생성 동시 실행 수 (LLM 호출은 아래 적응형 한도 사용)
+    llm_concurrency_initial: int = 5   # LLM 동시 호출 시작 한도 (프로세스 전역, AIMD로 조정)
+    llm_concurrency_max: int = 16      # 동시 빌드/크롤링 전체의 LLM 동시 호출 상한
+    llm_latency_target: float = 20.0   # 이보다 느린 응답은 한도를 늘리지 않음 (초)
+    llm_circuit_failure_threshold: int = 5  # 연속 실패(오류/타임아웃) 시 회로 open
+    llm_circuit_reset_timeout: float = 30.0  # open 유지 시간 (초), 이후 시험 호출 1회
     retry_count: int = 2
     llm_timeout: int = 60
     pipeline_timeout: int = 3000
+    context_token_budget: int = 1500  # 프롬프트당 스토리 경로 토큰 예산 (넘치면 초기 경로 요약)
+    context_summary_mode: str = "rolling"  # rolling (부모 요약 + 새 노드 1개) | full (초기 경로 전체 재요약)
+    expansion_mode: str = "per_choice"  # per_choice (선택지별 호출) | sibling (부모별 1회 호출, 실패한 자식만 선택지별)
+
+    # LLM 응답 캐시 (호출부: root, node, siblings, summary, rolling_summary, education, article)
+    llm_cache_enabled: bool = True
+    llm_cache_path: str = ""  # 비우면 app/data/llm_cache.db
+    llm_cache_ttl: float = 7 * 24 * 3600  # 초
+    llm_cache_max_bytes: int = 64 * 1024 * 1024  # 초과 시 LRU 축출
+    llm_cache_disabled: list[str] = []  # 조회/저장 모두 하지 않을 호출부
+    llm_cache_bypass: list[str] = ["root", "node", "siblings"]  # 조회 없이 저장만 (재실행 시 []로 두면 재사용)
 
     # 이미지 생성 설정 (Imagen 4.0 Fast: 분당 150 요청 제한)
     image_max_concurrent: int = 5   # 병렬 처리 수 (5개 동시)
     image_retry_count: int = 2      # 재시도 횟수
     image_retry_delay: float = 2.0  # 재시도 간격 (초)
-    image_batch_size: int = 10      # 배치 크기
-    image_batch_wait: float = 12.0  # 배치 간 대기 (초)
+    image_requests_per_minute: float = 150  # 프로세스 전역 토큰 버킷 속도
+    image_burst: int = 10           # 유휴 후 즉시 보낼 수 있는 요청 수
+
+    # 외부 제공자 선택 (fake: 네트워크 없이 오프라인 부하 테스트, app/core/fake_provider.py)
+    llm_provider: str = "litellm"   # litellm | fake
+    image_provider: str = "imagen"  # imagen | fake
+    news_provider: str = "google"   # google | fake
+    fake_llm_latency: float = 1.5   # 가짜 응답 지연 중앙값 (초)
+    fake_image_latency: float = 3.0
+    fake_latency_sigma: float = 0.5  # 로그정규 분포 sigma (0: 고정 지연)
+    fake_error_rate: float = 0.0     # 일반 오류 비율
+    fake_rate_limit_rate: float = 0.0  # 429 오류 비율
+    fake_seed: int | None = None
+
+    # 빌드 호출 기록/재생 (app/data/cassettes, app/core/cassette.py)
+    cassette_mode: str = "off"          # off | record | replay
+    cassette_file: str = ""             # replay할 파일 (이름만 쓰면 app/data/cassettes 아래)
+    cassette_latency_scale: float = 1.0  # 재생 지연 배율 (0: 지연 없이)
+
+    # 시나리오 저장소 설정
+    scenario_storage: str = "json"   # json | sqlite
+    scenario_db_path: str = ""       # sqlite 경로 (비우면 app/data/scenarios.db)
+    scenario_refresh_interval: float = 2.0  # 디렉토리 재스캔 최소 간격 (초)
+    scenario_cache_max_entries: int = 64    # 파싱된 트리 LRU 최대 항목 수
+    scenario_cache_max_bytes: int = 64 * 1024 * 1024  # 파싱된 트리 LRU 최대 크기 (파일 크기 기준)
+    scenario_watch: str = "auto"  # auto | inotify | poll | off (파일 저장소 외부 변경 감시)
+    json_pretty: bool = False  # True면 저장 파일을 들여쓰기 (기본: compact)
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
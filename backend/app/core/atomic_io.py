@@ -0,0 +1,124 @@
+"""원자적 파일 쓰기 + 전용 I/O 스레드풀
+
+- atomic_write_bytes: 같은 디렉토리의 임시 파일에 쓰고 fsync 후 rename.
+  쓰기 도중 프로세스가 죽어도 기존 파일 또는 새 파일 중 하나만 남는다.
+- run_io: 블로킹 파일 I/O를 이벤트 루프 밖(전용 스레드풀)에서 실행.
+- CoalescingWriter: 같은 키에 대한 연속 쓰기를 합쳐 가장 최근 스냅샷만 기록.
+
+app.config를 import하지 않으므로 표준 라이브러리 전용 스크립트에서도 쓸 수 있다.
+"""
+import asyncio
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from uuid import uuid4
+
+logger = logging.getLogger("core.atomic_io")
+
+IO_WORKERS = 4
+
+# 파일 쓰기 전용 스레드풀 (이미지 생성 등 기본 executor 작업과 분리)
+_io_executor = ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix="scenario-io")
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """임시 파일 + fsync + rename으로 원자적 저장
+
+    임시 파일명은 `.{파일명}.{난수}.tmp`로, 인덱스/목록 스캔 대상(.json)에서 제외된다.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{uuid4().hex[:8]}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    _fsync_dir(path.parent)
+
+
+def _fsync_dir(directory: Path) -> None:
+    """rename 결과를 디스크에 반영 (디렉토리 fsync 미지원 플랫폼은 무시)"""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+async def run_io(fn, *args, **kwargs):
+    """블로킹 I/O 함수를 전용 스레드풀에서 실행"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_io_executor, partial(fn, *args, **kwargs))
+
+
+class CoalescingWriter:
+    """키별 최신 스냅샷만 기록하는 백그라운드 쓰기
+
+    쓰기가 진행 중일 때 들어온 요청은 대기열의 이전 스냅샷을 덮어쓰므로,
+    빠르게 연속 호출되어도 디스크에는 마지막 스냅샷만 (최대 한 번 더) 기록된다.
+    """
+
+    def __init__(self):
+        self.written = 0
+        self.coalesced = 0
+        self._pending: dict[str, tuple[Path, bytes]] = {}
+        self._running: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, key: str, path: Path, data: bytes) -> Future:
+        """쓰기 예약. 같은 키의 미기록 스냅샷은 버려진다."""
+        with self._lock:
+            if key in self._pending:
+                self.coalesced += 1
+            self._pending[key] = (path, data)
+            future = self._running.get(key)
+            if future is None:
+                future = _io_executor.submit(self._drain, key)
+                self._running[key] = future
+            return future
+
+    def _drain(self, key: str):
+        """대기 중인 스냅샷이 없을 때까지 기록 (I/O 스레드에서 실행)"""
+        finished = False
+        try:
+            while True:
+                with self._lock:
+                    item = self._pending.pop(key, None)
+                    if item is None:
+                        self._running.pop(key, None)
+                        finished = True
+                        return
+                path, data = item
+                try:
+                    atomic_write_bytes(path, data)
+                    with self._lock:
+                        self.written += 1
+                except Exception as e:
+                    # 한 스냅샷의 실패가 이후 스냅샷 기록을 막지 않도록 기록하고 계속
+                    logger.warning("파일 저장 실패: %s (%s)", path, e)
+        finally:
+            if not finished:
+                # 예기치 못한 중단: 실행 표시를 지우고, 남은 스냅샷이 있으면 새로 기록 시작
+                with self._lock:
+                    self._running.pop(key, None)
+                    if key in self._pending:
+                        self._running[key] = _io_executor.submit(self._drain, key)
+
+    async def flush(self, key: str) -> None:
+        """해당 키의 예약된 쓰기가 모두 끝날 때까지 대기"""
+        with self._lock:
+            future = self._running.get(key)
+        if future is not None:
+            await asyncio.wrap_future(future)
@@ -0,0 +1,229 @@
+"""LLM / Imagen 호출 기록·재생 (카세트)
+
+실제 생성 세션을 기록해 두었다가 네트워크 없이 같은 작업량으로 재생한다.
+스케줄러/동시 실행 변경을 현실적인 부하로 재현 가능하게 비교하기 위한 용도.
+
+- CASSETTE_MODE=record: ScenarioTreeBuilder.build 동안의 모든 LLM/Imagen 요청과 응답(오류 포함),
+  시작 시각, 지연 시간을 기록해 빌드 1회당 파일 1개(gzip JSON Lines)로 저장
+- CASSETTE_MODE=replay: CASSETTE_FILE의 기록을 재생. 같은 요청(LLM: 메시지/형식/온도, 이미지: 프롬프트)이
+  들어오면 기록된 지연 시간 × CASSETTE_LATENCY_SCALE 만큼 기다린 뒤 기록된 응답을 돌려준다
+  (같은 요청이 여러 번이면 기록 순서대로). 기록에 없는 요청은 CassetteMissError로 실패해 호출부 폴백을 탄다.
+
+이미지는 파일을 크게 만들지 않도록 바이트 수만 기록하고, 재생 시 작은 PNG를 돌려준다.
+세션 중에는 LLM 응답 캐시를 쓰지 않는다 (기록과 재생이 같은 호출 순서를 보도록).
+동시 실행 한도, 회로 차단기, Imagen 토큰 버킷은 재생 중에도 그대로 동작한다.
+"""
+import asyncio
+import gzip
+import json
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from uuid import uuid4
+
+from app.config import settings
+from app.core.fake_provider import tiny_png
+from app.core.llm_cache import cache_key
+
+logger = logging.getLogger("core.cassette")
+
+CASSETTES_DIR = Path(__file__).parent.parent / "data" / "cassettes"
+FORMAT_VERSION = 1
+
+
+class CassetteMissError(RuntimeError):
+    """재생 중 기록에 없는 요청"""
+
+
+def _llm_key(messages: list[dict], kwargs: dict) -> str:
+    # 모델은 카세트 파일 단위로 고정되므로 키에서 제외
+    return cache_key("", messages, kwargs.get("response_format"), kwargs.get("temperature"))
+
+
+def _image_key(prompt: str) -> str:
+    # seed는 시나리오 ID(실행마다 다름)에서 만들어지므로 프롬프트만으로 매칭
+    return cache_key("", [{"role": "image", "content": prompt}], None, None)
+
+
+class Cassette:
+    """빌드 1회 분량의 기록 (record: 추가, replay: 요청별 대기열에서 꺼냄)"""
+
+    def __init__(self, mode: str, path: Path, latency_scale: float = 1.0):
+        self.mode = mode
+        self.path = path
+        self.latency_scale = latency_scale
+        self.header: dict = {}
+        self.entries: list[dict] = []
+        self.hits = 0
+        self.misses = 0
+        self._pending: dict[str, deque[dict]] = defaultdict(deque)
+        self._start = time.monotonic()
+        self._lock = threading.Lock()
+
+    # ── 파일 ──
+
+    @classmethod
+    def load(cls, path: Path, latency_scale: float = 1.0) -> "Cassette":
+        cassette = cls("replay", path, latency_scale)
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            cassette.header = json.loads(f.readline())
+            for line in f:
+                entry = json.loads(line)
+                cassette.entries.append(entry)
+                cassette._pending[entry["key"]].append(entry)
+        logger.info("카세트 재생: %s (%d개 호출, 지연 ×%g)", path.name, len(cassette.entries), latency_scale)
+        return cassette
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            entries = sorted(self.entries, key=lambda e: e["t"])
+        with gzip.open(self.path, "wt", encoding="utf-8") as f:
+            f.write(json.dumps(self.header, ensure_ascii=False, separators=(",", ":")) + "\n")
+            for entry in entries:
+                f.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n")
+        logger.info("카세트 기록 저장: %s (%d개 호출)", self.path, len(entries))
+
+    # ── 기록 ──
+
+    def _record(self, entry: dict, start: float) -> None:
+        entry["t"] = round(start - self._start, 3)
+        entry["latency"] = round(time.monotonic() - start, 3)
+        with self._lock:
+            self.entries.append(entry)
+
+    def record_llm(self, call):
+        """LLM 제공자 호출을 감싸 요청/응답/지연을 기록"""
+        async def recording(purpose: str, messages: list[dict], **kwargs):
+            entry = {"kind": "llm", "purpose": purpose, "key": _llm_key(messages, kwargs)}
+            start = time.monotonic()
+            try:
+                response = await call(purpose, messages, **kwargs)
+            except Exception as e:
+                self._record({**entry, "error": str(e)[:500]}, start)
+                raise
+            usage = getattr(response, "usage", None)
+            self._record({
+                **entry,
+                "content": response.choices[0].message.content,
+                "usage": [getattr(usage, "prompt_tokens", 0) or 0, getattr(usage, "completion_tokens", 0) or 0],
+            }, start)
+            return response
+        return recording
+
+    def record_image(self, call):
+        """Imagen 제공자 호출(스레드에서 실행)을 감싸 결과 크기/지연을 기록"""
+        def recording(prompt: str, seed: int | None):
+            entry = {"kind": "image", "key": _image_key(prompt)}
+            start = time.monotonic()
+            try:
+                image_bytes = call(prompt, seed)
+            except Exception as e:
+                self._record({**entry, "error": str(e)[:500]}, start)
+                raise
+            self._record({**entry, "bytes": len(image_bytes or b"")}, start)
+            return image_bytes
+        return recording
+
+    # ── 재생 ──
+
+    def _take(self, key: str, kind: str) -> dict:
+        with self._lock:
+            queue = self._pending.get(key)
+            if queue:
+                self.hits += 1
+                return queue.popleft()
+            self.misses += 1
+        raise CassetteMissError(f"No recorded {kind} response for this request")
+
+    async def replay_llm(self, purpose: str, messages: list[dict], **kwargs):
+        entry = self._take(_llm_key(messages, kwargs), "LLM")
+        await asyncio.sleep(entry["latency"] * self.latency_scale)
+        if "error" in entry:
+            raise RuntimeError(entry["error"])
+        prompt_tokens, completion_tokens = entry["usage"]
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=entry["content"]))],
+            usage=SimpleNamespace(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens),
+        )
+
+    def replay_image(self, prompt: str, seed: int | None = None) -> bytes | None:
+        entry = self._take(_image_key(prompt), "image")
+        time.sleep(entry["latency"] * self.latency_scale)
+        if "error" in entry:
+            raise RuntimeError(entry["error"])
+        return tiny_png() if entry["bytes"] else None
+
+    def summary(self) -> str:
+        if self.mode == "record":
+            return f"record {self.path.name}: {len(self.entries)} calls"
+        unused = sum(len(queue) for queue in self._pending.values())
+        return f"replay {self.path.name}: hit={self.hits}, miss={self.misses}, unused={unused}"
+
+
+_current: ContextVar[Cassette | None] = ContextVar("cassette", default=None)
+
+
+def current() -> Cassette | None:
+    return _current.get()
+
+
+def wrap_llm(call):
+    """현재 세션에 맞게 LLM 제공자 호출 함수를 감쌈 (세션이 없으면 그대로)"""
+    cassette = _current.get()
+    if cassette is None:
+        return call
+    return cassette.replay_llm if cassette.mode == "replay" else cassette.record_llm(call)
+
+
+def wrap_image(call):
+    """현재 세션에 맞게 Imagen 제공자 호출 함수를 감쌈 (세션이 없으면 그대로)"""
+    cassette = _current.get()
+    if cassette is None:
+        return call
+    return cassette.replay_image if cassette.mode == "replay" else cassette.record_image(call)
+
+
+def _resolve(name: str) -> Path:
+    path = Path(name)
+    return path if path.is_absolute() or path.parent != Path(".") else CASSETTES_DIR / path
+
+
+@asynccontextmanager
+async def session(**header):
+    """settings.cassette_mode에 따라 이 범위의 호출을 기록/재생 (off면 아무것도 하지 않음)
+
+    header: 기록 파일 첫 줄에 남길 실행 정보 (피싱 유형, 난이도 등)
+    """
+    mode = settings.cassette_mode
+    if mode == "off":
+        yield None
+        return
+    if mode == "replay":
+        if not settings.cassette_file:
+            raise ValueError("CASSETTE_FILE is required for replay")
+        cassette = Cassette.load(_resolve(settings.cassette_file), settings.cassette_latency_scale)
+    elif mode == "record":
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
+        cassette = Cassette("record", CASSETTES_DIR / f"{stamp}_{uuid4().hex[:6]}.jsonl.gz")
+        cassette.header = {
+            "version": FORMAT_VERSION, "model": settings.llm_model, "image_model": settings.image_model,
+            "recorded_at": datetime.now(timezone.utc).isoformat(), **header,
+        }
+    else:
+        raise ValueError(f"Unknown cassette mode: {mode}")
+
+    token = _current.set(cassette)
+    try:
+        yield cassette
+    finally:
+        _current.reset(token)
+        if mode == "record":
+            await asyncio.to_thread(cassette.save)
+        logger.info("카세트: %s", cassette.summary())
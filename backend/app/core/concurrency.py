@@ -0,0 +1,311 @@
+"""외부 API 호출 제어: 적응형 동시 실행 제한 (AIMD) + 요청 속도 제한 (토큰 버킷) + 회로 차단기
+
+AIMDLimiter (LLM)
+
+LLM 호출 전체(빌드, 요약, 교육 콘텐츠, 기사 분석)가 프로세스 전역 한도 하나를 공유한다.
+- 증가(additive): 응답이 지연 목표 이내이고 최근 오류율이 낮으면 한도 +1/한도
+  (한도만큼 성공할 때마다 약 +1)
+- 감소(multiplicative): 429/타임아웃이면 한도 × backoff. 한 번의 폭주로 연속 감소하지 않도록
+  cooldown 동안은 한 번만 줄인다.
+- 한도는 [min_limit, max_limit] 범위를 벗어나지 않으며, max_limit이 동시 빌드/크롤링 전체의 상한이다.
+
+이벤트 루프 안에서만 사용한다 (대기열은 각 호출자의 루프에서 만든 Future).
+
+TokenBucket (Imagen 분당 요청 수 등 속도 제한이 있는 API)
+
+CircuitBreaker (LLM 장애 시 재시도/백오프 없이 바로 폴백)
+"""
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+
+logger = logging.getLogger("core.concurrency")
+
+OUTCOMES = ("ok", "error", "overload", "cancelled")
+
+
+class AIMDLimiter:
+    """AIMD 방식으로 동시 실행 한도를 조정하는 세마포어"""
+
+    def __init__(
+        self,
+        initial: int = 5,
+        min_limit: int = 1,
+        max_limit: int = 16,
+        latency_target: float = 20.0,
+        backoff: float = 0.5,
+        window: int = 20,
+        error_threshold: float = 0.1,
+        cooldown: float = 5.0,
+    ):
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError("Invalid concurrency bounds")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.limit = float(max(min_limit, min(max_limit, initial)))
+        self.latency_target = latency_target
+        self.backoff = backoff
+        self.error_threshold = error_threshold
+        self.cooldown = cooldown
+        self.in_flight = 0
+        self.decreases = 0
+        self._recent: deque[bool] = deque(maxlen=window)
+        self._waiters: deque[asyncio.Future] = deque()
+        self._last_decrease = float("-inf")
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for waiter in self._waiters if not waiter.done())
+
+    async def acquire(self) -> None:
+        """빈 슬롯이 생길 때까지 대기 (도착 순서대로, 슬롯은 깨우는 쪽에서 넘겨줌)"""
+        if self.in_flight < int(self.limit) and not self.queued:
+            self.in_flight += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # 슬롯을 넘겨받은 직후 취소됨: 반환하고 다음 대기자에게
+                self.in_flight -= 1
+                self._wake()
+            raise
+
+    def release(self, outcome: str, latency: float = 0.0) -> None:
+        """슬롯 반환 + 결과에 따른 한도 조정"""
+        if outcome not in OUTCOMES:
+            raise ValueError(f"Unknown outcome: {outcome}")
+        self.in_flight -= 1
+        self._adjust(outcome, latency)
+        self._wake()
+
+    def _adjust(self, outcome: str, latency: float):
+        if outcome == "cancelled":
+            return
+        if outcome == "overload":
+            self._recent.append(False)
+            now = time.monotonic()
+            if now - self._last_decrease >= self.cooldown:
+                previous = self.limit
+                self.limit = max(float(self.min_limit), self.limit * self.backoff)
+                self._last_decrease = now
+                self.decreases += 1
+                logger.warning("LLM 동시 실행 한도 감소: %.1f → %.1f (과부하)", previous, self.limit)
+            return
+        if outcome == "error":
+            self._recent.append(False)
+            return
+
+        self._recent.append(True)
+        if latency > self.latency_target or self.error_rate() > self.error_threshold:
+            return
+        if self.limit < self.max_limit:
+            previous = int(self.limit)
+            self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+            if int(self.limit) > previous:
+                logger.debug("LLM 동시 실행 한도 증가: %d", int(self.limit))
+
+    def _wake(self):
+        while self.in_flight < int(self.limit) and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    def error_rate(self) -> float:
+        if not self._recent:
+            return 0.0
+        return self._recent.count(False) / len(self._recent)
+
+    def stats(self) -> dict:
+        return {
+            "limit": int(self.limit),
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "error_rate": round(self.error_rate(), 3),
+            "decreases": self.decreases,
+        }
+
+
+class TokenBucket:
+    """요청 속도 제한 (토큰 버킷, 도착 순서대로 예약)
+
+    rate: 초당 토큰, capacity: 유휴 후 한 번에 보낼 수 있는 최대 요청 수.
+    acquire()는 호출 시점에 토큰을 예약(부족하면 빚)하고 그 차례까지만 잠든다.
+    pause()로 서버가 알려준 Retry-After 동안 모든 호출자를 멈출 수 있다.
+    상태는 스레드 락으로 보호하므로 여러 이벤트 루프/스레드에서 공유해도 된다.
+    """
+
+    def __init__(self, rate: float, capacity: int = 1):
+        if rate <= 0 or capacity < 1:
+            raise ValueError("Invalid token bucket parameters")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._waiting = 0
+        self._lock = threading.Lock()
+
+    @property
+    def queued(self) -> int:
+        """토큰 차례를 기다리는 요청 수"""
+        return self._waiting
+
+    def _refill(self, now: float):
+        # 정지(pause) 중에는 _updated가 재개 시각이라 토큰이 쌓이지 않음
+        if now > self._updated:
+            self._tokens = min(float(self.capacity), self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+    def _reserve(self) -> float:
+        """토큰 1개 예약 후 기다려야 할 초"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            base = max(now, self._updated)
+            ready_at = base if self._tokens >= 0 else base - self._tokens / self.rate
+            return max(ready_at, self._paused_until) - now
+
+    def _pause_remaining(self) -> float:
+        with self._lock:
+            return self._paused_until - time.monotonic()
+
+    async def acquire(self) -> float:
+        """요청 1회 분량의 토큰 획득, 기다린 초를 반환"""
+        start = time.monotonic()
+        wait = self._reserve()
+        if wait <= 0:
+            return 0.0
+        self._waiting += 1
+        try:
+            while wait > 0:
+                await asyncio.sleep(wait)
+                # 기다리는 동안 pause()가 걸렸으면 그만큼 더 대기
+                wait = self._pause_remaining()
+        except asyncio.CancelledError:
+            with self._lock:
+                self._tokens += 1  # 쓰지 않은 예약 반환
+            raise
+        finally:
+            self._waiting -= 1
+        return time.monotonic() - start
+
+    def pause(self, seconds: float) -> None:
+        """Retry-After: seconds 동안 새 요청을 보내지 않음 (기존 정지보다 짧으면 무시)"""
+        with self._lock:
+            now = time.monotonic()
+            self._paused_until = max(self._paused_until, now + seconds)
+            # 정지 중 쌓인 토큰으로 재개 직후 몰아서 보내지 않도록 비움
+            self._refill(now)
+            self._tokens = min(self._tokens, 0.0)
+            self._updated = max(self._updated, self._paused_until)
+
+    def stats(self) -> dict:
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            return {
+                "rate_per_minute": round(self.rate * 60, 1),
+                "tokens": round(self._tokens, 2),
+                "queued": self._waiting,
+                "paused_for": round(max(0.0, self._paused_until - now), 2),
+            }
+
+
+class CircuitOpenError(RuntimeError):
+    """회로 차단기가 열려 있어 호출하지 않고 즉시 실패"""
+
+
+class CircuitBreaker:
+    """연속 실패 시 호출을 차단하는 회로 차단기
+
+    - closed: 정상 호출. failure_threshold번 연속 실패(오류/타임아웃)하면 open
+    - open: reset_timeout 동안 CircuitOpenError로 즉시 실패 (호출부는 바로 폴백)
+    - half_open: reset_timeout이 지나면 half_open_probes개 요청만 시험 호출.
+      시험 호출이 성공하면 closed, 실패하면 다시 open
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0, half_open_probes: int = 1):
+        if failure_threshold < 1 or half_open_probes < 1:
+            raise ValueError("Invalid circuit breaker parameters")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self.opened = 0
+        self.rejected = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._lock = threading.Lock()
+
+    def _current_state(self, now: float) -> str:
+        if self.state == "open" and now - self._opened_at >= self.reset_timeout:
+            self.state = "half_open"
+            self._probes = 0
+            logger.info("LLM 회로 차단기 half-open: 시험 호출 허용")
+        return self.state
+
+    def is_open(self) -> bool:
+        """지금 호출하면 거부되는지 (상태만 확인, 시험 호출 슬롯은 쓰지 않음)"""
+        with self._lock:
+            state = self._current_state(time.monotonic())
+            return state == "open" or (state == "half_open" and self._probes >= self.half_open_probes)
+
+    def before_call(self) -> None:
+        """호출 직전 확인 (거부 시 CircuitOpenError, half-open이면 시험 호출 슬롯 점유)"""
+        with self._lock:
+            state = self._current_state(time.monotonic())
+            if state == "half_open" and self._probes < self.half_open_probes:
+                self._probes += 1
+                return
+            if state != "closed":
+                self.rejected += 1
+                raise CircuitOpenError(f"Circuit open after {self.consecutive_failures} consecutive failures")
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self.state != "closed":
+                logger.info("LLM 회로 차단기 closed: 시험 호출 성공")
+            self.state = "closed"
+            self.consecutive_failures = 0
+            self._probes = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.state == "half_open" or (
+                self.state == "closed" and self.consecutive_failures >= self.failure_threshold
+            ):
+                self.state = "open"
+                self._opened_at = time.monotonic()
+                self.opened += 1
+                logger.warning(
+                    "LLM 회로 차단기 open: 연속 실패 %d회, %.0fs 동안 즉시 폴백",
+                    self.consecutive_failures, self.reset_timeout,
+                )
+
+    def record_cancelled(self) -> None:
+        """결과 없이 끝난 호출 (시험 호출 슬롯만 반환)"""
+        with self._lock:
+            if self.state == "half_open" and self._probes > 0:
+                self._probes -= 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            now = time.monotonic()
+            state = self._current_state(now)
+            retry_in = self.reset_timeout - (now - self._opened_at) if state == "open" else 0.0
+            return {
+                "state": state,
+                "consecutive_failures": self.consecutive_failures,
+                "opened": self.opened,
+                "rejected": self.rejected,
+                "retry_in": round(max(0.0, retry_in), 1),
+            }
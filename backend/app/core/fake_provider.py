@@ -0,0 +1,283 @@
+"""오프라인 부하 테스트용 가짜 LLM / Imagen / 뉴스 제공자
+
+실제 Gemini/Imagen 할당량과 네트워크 없이 파이프라인 처리량을 측정하기 위한 백엔드.
+설정으로 선택한다 (기본값은 실제 제공자).
+- LLM_PROVIDER=fake: purpose별로 스키마에 맞는 JSON/텍스트 응답
+  (root/node/siblings → GenerationResult, summary/rolling_summary → 요약문,
+  education → EducationalContent, article → 기사 분석 JSON)
+- IMAGE_PROVIDER=fake: 작은 PNG
+- NEWS_PROVIDER=fake: 고정된 가짜 기사 목록과 본문
+
+지연 시간은 중앙값 FAKE_*_LATENCY, 분산 FAKE_LATENCY_SIGMA의 로그정규 분포를 따르고,
+FAKE_ERROR_RATE / FAKE_RATE_LIMIT_RATE 비율로 일반 오류 / 429 오류를 낸다.
+node/siblings 응답은 프롬프트의 종료 신호를 따르므로 트리 크기는 실제 빌드와 같은 규칙으로 정해진다.
+"""
+import asyncio
+import json
+import math
+import random
+import re
+import struct
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from types import SimpleNamespace
+
+from app.config import settings
+from app.models.news import RawArticle
+
+_DEPTH_RE = re.compile(r"현재 깊이: (\d+)/(\d+)")
+_END_SIGNAL_RE = re.compile(r"종료 신호: ([^\n]*)")
+_ENDING_HINT_RE = re.compile(r"권장 엔딩 유형: (good|bad)")
+_SIBLING_RE = re.compile(r"\[(choice_\d+)\] 플레이어의 선택[^\n]*\n[^\n]*\n- 종료 신호: ([^\n]*)")
+
+
+@dataclass
+class FakeProfile:
+    """가짜 제공자의 지연/오류 분포"""
+    llm_latency: float = 1.5    # 중앙값 (초)
+    image_latency: float = 3.0  # 중앙값 (초)
+    latency_sigma: float = 0.5  # 로그정규 분포의 sigma (0이면 고정 지연)
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    seed: int | None = None
+
+    @classmethod
+    def from_settings(cls) -> "FakeProfile":
+        return cls(
+            llm_latency=settings.fake_llm_latency,
+            image_latency=settings.fake_image_latency,
+            latency_sigma=settings.fake_latency_sigma,
+            error_rate=settings.fake_error_rate,
+            rate_limit_rate=settings.fake_rate_limit_rate,
+            seed=settings.fake_seed,
+        )
+
+
+class _FakeBackend:
+    """지연/오류 샘플링 공통 부분 (스레드/이벤트 루프 어디서 호출해도 안전)"""
+
+    def __init__(self, profile: FakeProfile):
+        self.profile = profile
+        self.calls = 0
+        self._rng = random.Random(profile.seed)
+        self._lock = threading.Lock()
+
+    def _sample(self, median: float) -> tuple[float, str | None]:
+        """(지연 시간, 오류 종류: None | "error" | "rate_limit")"""
+        with self._lock:
+            self.calls += 1
+            latency = median * math.exp(self._rng.gauss(0, self.profile.latency_sigma)) if median > 0 else 0.0
+            roll = self._rng.random()
+        if roll < self.profile.rate_limit_rate:
+            return latency, "rate_limit"
+        if roll < self.profile.rate_limit_rate + self.profile.error_rate:
+            return latency, "error"
+        return latency, None
+
+    def _pick(self, options: list):
+        with self._lock:
+            return self._rng.choice(options)
+
+    @staticmethod
+    def _raise(kind: str, what: str):
+        if kind == "rate_limit":
+            raise RuntimeError(f"429 RESOURCE_EXHAUSTED: fake {what} quota exceeded")
+        raise RuntimeError(f"503 UNAVAILABLE: fake {what} error")
+
+
+def _choice(text: str, dangerous: bool) -> dict:
+    effect = {"trust": 1, "money": -1, "awareness": 0} if dangerous else {"trust": -1, "money": 0, "awareness": 1}
+    choice = {"text": text, "is_dangerous": dangerous, "resource_effect": effect}
+    if dangerous:
+        choice["danger_feedback"] = {
+            "why_dangerous": "확인되지 않은 상대의 요구에 응했습니다.",
+            "warning_signs": ["급한 결정 요구", "공식 채널이 아닌 연락"],
+            "safe_alternative": "전화를 끊고 공식 번호로 직접 확인합니다.",
+        }
+    return choice
+
+
+def _node(depth: int, end_signal: str, hint_text: str, label: str = "") -> dict:
+    """종료 신호에 맞는 GenerationResult JSON 본문 (권장 엔딩 유형은 hint_text에서 찾음)"""
+    image_prompt = (
+        "A middle-aged Korean woman holding a smartphone, tense expression, "
+        f"modern Korean apartment, scene {depth}{label}, webtoon style illustration, no text, no letters"
+    )
+    if "엔딩" in end_signal:
+        hint = _ENDING_HINT_RE.search(hint_text)
+        ending = hint.group(1) if hint else "good"
+        return {
+            "node_type": f"ending_{ending}",
+            "narrative_text": "의심스러운 연락을 경찰에 신고했습니다." if ending == "good" else "결국 요구한 금액을 송금하고 말았습니다.",
+            "choices": [],
+            "image_prompt": image_prompt,
+            "reasoning": "fake provider: ending",
+        }
+    return {
+        "node_type": "narrative",
+        "narrative_text": f"상대방이 다시 연락해 추가 확인을 요구합니다. (깊이 {depth}{label})",
+        "choices": [
+            _choice("전화를 끊고 공식 번호로 확인한다", False),
+            _choice("요구대로 인증번호를 알려준다", True),
+            _choice("가족에게 먼저 상의한다", False),
+        ],
+        "image_prompt": image_prompt,
+        "reasoning": "fake provider: narrative",
+    }
+
+
+def _root() -> dict:
+    return {
+        "protagonist": {
+            "age_group": "middle-aged",
+            "gender": "woman",
+            "description": "A Korean woman in her 50s working as an office clerk",
+            "appearance": "short black hair, glasses, beige cardigan",
+        },
+        "prologue": "평범한 평일 오후, 사무실에서 업무를 보던 중이었습니다.",
+        **_node(0, "계속 진행", ""),
+    }
+
+
+class FakeLLMProvider(_FakeBackend):
+    """litellm.acompletion 대체 (응답 형식: choices[0].message.content, usage)"""
+
+    async def acompletion(self, purpose: str, messages: list[dict], **kwargs):
+        latency, failure = self._sample(self.profile.llm_latency)
+        await asyncio.sleep(latency)
+        if failure:
+            self._raise(failure, "LLM")
+
+        prompt = messages[-1]["content"]
+        content = self.respond(purpose, prompt)
+        prompt_chars = sum(len(m["content"]) for m in messages)
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+            usage=SimpleNamespace(prompt_tokens=prompt_chars // 3, completion_tokens=len(content) // 3),
+        )
+
+    def respond(self, purpose: str, prompt: str) -> str:
+        """purpose별 응답 본문"""
+        depth_match = _DEPTH_RE.search(prompt)
+        depth = int(depth_match.group(1)) if depth_match else 0
+        if purpose == "root":
+            return json.dumps(_root(), ensure_ascii=False)
+        if purpose == "node":
+            signal = _END_SIGNAL_RE.search(prompt)
+            return json.dumps(_node(depth, signal.group(1) if signal else "", prompt), ensure_ascii=False)
+        if purpose == "siblings":
+            children = {
+                key: _node(depth, signal, signal, f"-{key}")
+                for key, signal in _SIBLING_RE.findall(prompt)
+            }
+            return json.dumps({"children": children}, ensure_ascii=False)
+        if purpose in ("summary", "rolling_summary"):
+            return "주인공은 기관을 사칭한 연락을 받고 의심과 불안 사이에서 대응을 이어가고 있습니다."
+        if purpose == "education":
+            return json.dumps({
+                "title": "기관 사칭에 주의하세요",
+                "explanation": "공공기관은 전화로 금전이나 인증번호를 요구하지 않습니다.",
+                "prevention_tips": ["전화를 끊고 공식 번호로 확인", "인증번호는 누구에게도 알려주지 않기"],
+                "warning_signs": ["급한 결정 요구", "비밀 유지 요구"],
+            }, ensure_ascii=False)
+        if purpose == "article":
+            return json.dumps({
+                "is_phishing_related": True,
+                "phishing_type": self._pick(["검찰사칭 보이스피싱", "택배사칭 스미싱", "코인투자사기"]),
+                "victim_profile": "50대 회사원",
+                "scammer_persona": "검찰 수사관",
+                "initial_contact": "전화",
+                "persuasion_tactics": ["사건 연루 협박", "비밀 유지 요구"],
+                "requested_actions": ["안전계좌 송금", "앱 설치"],
+                "red_flags": ["공식 번호가 아님", "금전 요구"],
+                "damage_amount": "3천만원",
+                "scenario_seed": "검찰을 사칭한 전화로 시작해 안전계좌 송금을 요구하는 이야기.",
+            }, ensure_ascii=False)
+        raise ValueError(f"Unknown LLM purpose: {purpose}")
+
+
+def tiny_png(width: int = 16, height: int = 9, rgb: tuple[int, int, int] = (90, 110, 140)) -> bytes:
+    """단색 PNG (16:9)"""
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF)
+
+    row = b"\x00" + bytes(rgb) * width
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(row * height))
+        + chunk(b"IEND", b"")
+    )
+
+
+class FakeImageProvider(_FakeBackend):
+    """Imagen 대체 (스레드풀에서 호출되는 동기 함수)"""
+
+    def generate(self, prompt: str, seed: int | None = None) -> bytes:
+        latency, failure = self._sample(self.profile.image_latency)
+        time.sleep(latency)
+        if failure:
+            self._raise(failure, "Imagen")
+        return tiny_png()
+
+
+class FakeNewsSource:
+    """Google News RSS / 기사 본문 추출 대체 (GoogleNewsClient.search, ArticleBodyExtractor.extract 인터페이스)"""
+
+    TEMPLATES = [
+        "검찰 사칭 보이스피싱으로 {n}천만원 피해",
+        "택배 배송 문자 스미싱 {n}건 적발",
+        "가상자산 투자 사기 일당 {n}명 검거",
+        "자녀 사칭 메신저 피싱 피해 {n}건 급증",
+    ]
+
+    async def search(self, keyword: str, display: int = 10) -> list[RawArticle]:
+        articles = []
+        for i in range(min(display, 8)):
+            title = f"[{keyword}] " + self.TEMPLATES[i % len(self.TEMPLATES)].format(n=i + 2)
+            articles.append(RawArticle(
+                title=title,
+                url=f"https://fake-news.local/{abs(hash((keyword, i))) % 10**8}",
+                description=f"{title}. 경찰은 유사 수법에 주의를 당부했다.",
+                pub_date=f"Mon, {i + 1:02d} Jan 2024 09:00:00 +0900",
+                source="fake",
+            ))
+        return articles
+
+    async def extract(self, url: str) -> str | None:
+        return (
+            "경찰에 따르면 피해자는 검찰 수사관을 사칭한 전화를 받고 계좌가 범죄에 연루되었다는 말에 속아 "
+            "안전계좌로 예금을 옮기라는 요구에 따랐다. 범인은 원격제어 앱 설치를 유도하고 "
+            "주변에 알리지 말라고 지시한 것으로 조사됐다."
+        )
+
+    async def close(self):
+        pass
+
+
+_llm: FakeLLMProvider | None = None
+_images: FakeImageProvider | None = None
+
+
+def llm() -> FakeLLMProvider:
+    """프로세스 공용 가짜 LLM (첫 사용 시 설정값으로 생성)"""
+    global _llm
+    if _llm is None:
+        _llm = FakeLLMProvider(FakeProfile.from_settings())
+    return _llm
+
+
+def images() -> FakeImageProvider:
+    """프로세스 공용 가짜 Imagen (첫 사용 시 설정값으로 생성)"""
+    global _images
+    if _images is None:
+        _images = FakeImageProvider(FakeProfile.from_settings())
+    return _images
+
+
+def reset() -> None:
+    """설정 변경 후 다음 사용 때 새로 생성되도록 초기화"""
+    global _llm, _images
+    _llm = _images = None
@@ -0,0 +1,92 @@
+"""사전 압축 + ETag 응답 페이로드"""
+import gzip
+import hashlib
+import threading
+
+try:
+    import brotli
+except ImportError:  # brotli 미설치 시 gzip만 사용
+    brotli = None
+
+# 선호 순서 (brotli > gzip > identity)
+SUPPORTED_ENCODINGS = ("br", "gzip") if brotli else ("gzip",)
+
+
+class EncodedPayload:
+    """직렬화된 JSON 바이트와 압축 변형(gzip/br)을 함께 보관
+
+    ETag는 원본 바이트의 SHA-256에서 파생한 강한 ETag이며,
+    압축 변형은 첫 요청 시 한 번만 생성한다.
+    """
+
+    def __init__(self, body: bytes):
+        self.body = body
+        digest = hashlib.sha256(body).hexdigest()[:32]
+        self.etag = f'"{digest}"'
+        self._variants: dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def nbytes(self) -> int:
+        """보관 중인 전체 바이트 수 (원본 + 압축 변형)"""
+        return len(self.body) + sum(len(v) for v in self._variants.values())
+
+    def etag_for(self, encoding: str | None) -> str:
+        """인코딩별 ETag (표현이 다르면 강한 ETag도 달라야 함)"""
+        if encoding is None:
+            return self.etag
+        return f'{self.etag[:-1]}-{encoding}"'
+
+    def matches(self, if_none_match: str | None) -> bool:
+        """If-None-Match 헤더가 이 페이로드의 어떤 표현과도 일치하는지"""
+        if not if_none_match:
+            return False
+        candidates = {tag.strip() for tag in if_none_match.split(",")}
+        if "*" in candidates:
+            return True
+        # 약한 비교: W/ 접두사 및 인코딩 접미사 무시
+        base = self.etag.strip('"')
+        for tag in candidates:
+            tag = tag.removeprefix("W/").strip('"')
+            if tag == base or tag.split("-", 1)[0] == base:
+                return True
+        return False
+
+    def encoded(self, encoding: str | None) -> bytes:
+        """요청된 인코딩의 바이트 (없으면 생성 후 캐시)"""
+        if encoding is None:
+            return self.body
+        with self._lock:
+            data = self._variants.get(encoding)
+            if data is None:
+                if encoding == "br":
+                    data = brotli.compress(self.body, quality=5)
+                else:
+                    data = gzip.compress(self.body, compresslevel=6, mtime=0)
+                self._variants[encoding] = data
+            return data
+
+
+def select_encoding(accept_encoding: str | None) -> str | None:
+    """Accept-Encoding 헤더에서 지원하는 인코딩 선택 (q=0은 제외)"""
+    if not accept_encoding:
+        return None
+    accepted: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+
+    best = None
+    best_quality = 0.0
+    for encoding in SUPPORTED_ENCODINGS:
+        quality = accepted.get(encoding, accepted.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
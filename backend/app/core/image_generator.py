@@ -1,7 +1,9 @@
-"""이미지 생성 모듈 (Google Imagen via Vertex AI)"""
+"""이미지 생성 모듈 (Google Imagen via Vertex AI, settings.image_provider=fake면 오프라인 가짜 PNG)"""
 import asyncio
+import contextvars
 import logging
 import os
+import re
 import time
 from pathlib import Path
 from uuid import uuid4
@@ -11,9 +13,113 @@ from google import genai
 from google.genai import types
 
 from app.config import settings
+from app.core import cassette, fake_provider, metrics
+from app.core.concurrency import TokenBucket
 
 logger = logging.getLogger("core.image_generator")
 IMAGES_DIR = Path(__file__).parent.parent / "data" / "images"
+_RETRY_DELAY_RE = re.compile(r"retry[-_ ]?(?:after|delay)[\"':= ]+(\d+(?:\.\d+)?)\s*s?", re.IGNORECASE)
+
+
+# Imagen 분당 요청 제한을 모든 경로(빌드, 재생성, 배치 스크립트)가 공유
+image_limiter = TokenBucket(
+    rate=settings.image_requests_per_minute / 60,
+    capacity=settings.image_burst,
+)
+metrics.registry.gauge(
+    "phishguard_image_queue_depth", "Imagen requests waiting for a rate-limit token",
+    lambda: image_limiter.queued,
+)
+
+
+def _retry_after(error: Exception) -> float | None:
+    """오류에 담긴 재시도 대기 힌트 (Retry-After 헤더 또는 RetryInfo.retryDelay, 초)"""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if headers:
+        value = headers.get("retry-after") or headers.get("Retry-After")
+        try:
+            return float(value) if value is not None else None
+        except (TypeError, ValueError):
+            pass
+    match = _RETRY_DELAY_RE.search(str(error))
+    return float(match.group(1)) if match else None
+
+
+def _resolve_seed(node_id: str, scenario_id: str | None, seed: int | None) -> int | None:
+    # seed 계산: 시나리오별로 고정된 seed 사용 (인물 일관성 보장)
+    if seed is None and scenario_id:
+        # scenario_id의 해시값을 seed로 사용 (1 ~ 2^31-1 범위)
+        seed = hash(scenario_id) % 2147483647
+        if seed <= 0:
+            seed = abs(seed) + 1
+        logger.debug(f"[{node_id}] Using seed={seed} for scenario {scenario_id}")
+    return seed
+
+
+def _prepare_environment() -> bool:
+    """인증/저장 경로 준비 (불가능하면 False)"""
+    IMAGES_DIR.mkdir(parents=True, exist_ok=True)
+    if settings.image_provider == "fake" or settings.cassette_mode == "replay":
+        return True
+
+    if not settings.gcp_project_id:
+        logger.warning("Image generation skipped: GCP_PROJECT_ID not configured")
+        return False
+
+    # 서비스 계정 인증 설정
+    if settings.google_application_credentials:
+        creds_path = Path(__file__).parent.parent.parent / settings.google_application_credentials
+        if creds_path.exists():
+            os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = str(creds_path)
+        else:
+            logger.error(f"Credentials file not found: {creds_path}")
+            return False
+    return True
+
+
+def _request_imagen(prompt: str, seed: int | None) -> bytes | None:
+    """Imagen 호출 (PNG 바이트, 결과 이미지가 없으면 None)"""
+    # Vertex AI 모드로 클라이언트 생성
+    client = genai.Client(
+        vertexai=True,
+        project=settings.gcp_project_id,
+        location=settings.gcp_location,
+    )
+
+    # seed 사용 시 add_watermark=False, enhance_prompt=False 필수
+    config = types.GenerateImagesConfig(
+        number_of_images=1,
+        aspect_ratio="16:9",
+        person_generation="ALLOW_ADULT",
+        seed=seed,
+        add_watermark=False,
+        enhance_prompt=False,
+    )
+
+    response = client.models.generate_images(
+        model=settings.image_model,
+        prompt=prompt,
+        config=config,
+    )
+
+    if not response.generated_images:
+        return None
+    return response.generated_images[0].image.image_bytes
+
+
+def _provider():
+    """settings.image_provider에 해당하는 호출 함수 (prompt, seed) -> PNG 바이트 | None
+
+    카세트 세션 중이면 기록/재생 함수로 감싼다 (스레드로 넘어온 contextvars로 세션 확인).
+    """
+    if settings.image_provider == "imagen":
+        call = _request_imagen
+    elif settings.image_provider == "fake":
+        call = fake_provider.images().generate
+    else:
+        raise ValueError(f"Unknown image provider: {settings.image_provider}")
+    return cassette.wrap_image(call)
 
 
 def _generate_image_sync(
@@ -23,7 +129,41 @@ def _generate_image_sync(
     seed: int | None = None
 ) -> str | None:
     """
-    동기 이미지 생성 (스레드에서 실행, 지수 백오프 재시도)
+    동기 이미지 생성 1회 시도 (스레드에서 실행, 실패 시 예외)
+
+    Returns:
+        이미지 URL 경로, 결과 이미지가 없으면 None
+    """
+    image_bytes = _provider()(prompt, seed)
+    if not image_bytes:
+        return None
+
+    # 이미지 저장 (경로: images/{scenario_id}/{node_id}.png)
+    if scenario_id:
+        # 시나리오별 폴더 생성
+        scenario_dir = IMAGES_DIR / scenario_id
+        scenario_dir.mkdir(parents=True, exist_ok=True)
+        filename = f"{node_id}.png"
+        filepath = scenario_dir / filename
+        url_path = f"/api/v1/images/{scenario_id}/{filename}"
+    else:
+        filename = f"{node_id}_{uuid4().hex[:8]}.png"
+        filepath = IMAGES_DIR / filename
+        url_path = f"/api/v1/images/{filename}"
+
+    filepath.write_bytes(image_bytes)
+    logger.info(f"[{node_id}] Image saved: {filepath}")
+    return url_path
+
+
+async def generate_image(
+    prompt: str,
+    node_id: str,
+    scenario_id: str | None = None,
+    seed: int | None = None
+) -> str | None:
+    """
+    비동기 이미지 생성 (요청마다 image_limiter 토큰 획득, 스레드풀에서 호출, 지수 백오프 재시도)
     
     Args:
         prompt: 이미지 생성 프롬프트
@@ -31,101 +171,53 @@ def _generate_image_sync(
         scenario_id: 시나리오 ID (파일명 및 seed 생성에 사용)
         seed: 이미지 생성 seed (동일 seed = 동일 스타일). None이면 scenario_id에서 생성
     """
-    if not settings.gcp_project_id:
-        logger.warning("Image generation skipped: GCP_PROJECT_ID not configured")
+    if not _prepare_environment():
         return None
-
-    # 서비스 계정 인증 설정
-    if settings.google_application_credentials:
-        creds_path = Path(__file__).parent.parent.parent / settings.google_application_credentials
-        if creds_path.exists():
-            os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = str(creds_path)
-        else:
-            logger.error(f"Credentials file not found: {creds_path}")
-            return None
-
-    IMAGES_DIR.mkdir(parents=True, exist_ok=True)
-
-    # seed 계산: 시나리오별로 고정된 seed 사용 (인물 일관성 보장)
-    if seed is None and scenario_id:
-        # scenario_id의 해시값을 seed로 사용 (1 ~ 2^31-1 범위)
-        seed = hash(scenario_id) % 2147483647
-        if seed <= 0:
-            seed = abs(seed) + 1
-        logger.debug(f"[{node_id}] Using seed={seed} for scenario {scenario_id}")
+    seed = _resolve_seed(node_id, scenario_id, seed)
 
     max_retries = settings.image_retry_count
     base_delay = settings.image_retry_delay
+    loop = asyncio.get_running_loop()
 
     for attempt in range(max_retries + 1):
+        await image_limiter.acquire()
+        start = time.perf_counter()
         try:
-            # Vertex AI 모드로 클라이언트 생성
-            client = genai.Client(
-                vertexai=True,
-                project=settings.gcp_project_id,
-                location=settings.gcp_location,
-            )
-
-            # seed 사용 시 add_watermark=False, enhance_prompt=False 필수
-            config = types.GenerateImagesConfig(
-                number_of_images=1,
-                aspect_ratio="16:9",
-                person_generation="ALLOW_ADULT",
-                seed=seed,
-                add_watermark=False,
-                enhance_prompt=False,
+            # 작업별 메트릭 범위(contextvars)를 스레드로 전달
+            context = contextvars.copy_context()
+            url = await loop.run_in_executor(
+                None, context.run, partial(_generate_image_sync, prompt, node_id, scenario_id, seed)
             )
-
-            response = client.models.generate_images(
-                model=settings.image_model,
-                prompt=prompt,
-                config=config,
-            )
-
-            if not response.generated_images:
+            if url is None:
                 logger.warning(f"[{node_id}] Image generation returned no images")
+                metrics.record_image_call(time.perf_counter() - start, "empty")
                 return None
-
-            # 이미지 저장 (경로: images/{scenario_id}/{node_id}.png)
-            image = response.generated_images[0].image
-            if scenario_id:
-                # 시나리오별 폴더 생성
-                scenario_dir = IMAGES_DIR / scenario_id
-                scenario_dir.mkdir(parents=True, exist_ok=True)
-                filename = f"{node_id}.png"
-                filepath = scenario_dir / filename
-                url_path = f"/api/v1/images/{scenario_id}/{filename}"
-            else:
-                filename = f"{node_id}_{uuid4().hex[:8]}.png"
-                filepath = IMAGES_DIR / filename
-                url_path = f"/api/v1/images/{filename}"
-
-            # PIL Image를 파일로 저장
-            image.save(str(filepath))
-            logger.info(f"[{node_id}] Image saved: {filepath}")
-
-            return url_path
+            metrics.record_image_call(time.perf_counter() - start, "ok")
+            return url
 
         except Exception as e:
             error_str = str(e)
             is_quota_error = "RESOURCE_EXHAUSTED" in error_str or "429" in error_str
             is_safety_error = "SAFETY" in error_str or "blocked" in error_str.lower()
 
+            metrics.record_image_call(time.perf_counter() - start, "blocked" if is_safety_error else "error")
             if is_safety_error:
                 # 안전 필터 차단은 재시도해도 동일하므로 즉시 실패 처리
                 logger.warning(f"[{node_id}] Image blocked by safety filter, skipping")
                 return None
 
+            if is_quota_error:
+                # 할당량 초과: 서버 힌트(없으면 백오프의 2배) 동안 모든 경로의 요청을 멈춤
+                pause = _retry_after(e) or base_delay * (2 ** attempt) * 2
+                image_limiter.pause(pause)
+                logger.warning(f"[{node_id}] Quota exhausted, pausing image requests {pause:.1f}s...")
+
             if attempt < max_retries:
-                # 지수 백오프: 2s, 4s, 8s
-                delay = base_delay * (2 ** attempt)
-                if is_quota_error:
-                    # 할당량 초과 시 추가 대기
-                    delay = delay * 2
-                    logger.warning(f"[{node_id}] Quota exhausted, waiting {delay:.1f}s...")
-                else:
+                metrics.record_image_retry("quota" if is_quota_error else "error")
+                if not is_quota_error:
+                    # 지수 백오프: 2s, 4s, 8s (할당량 초과는 image_limiter 정지로 대기)
                     logger.warning(f"[{node_id}] Attempt {attempt + 1}/{max_retries + 1} failed: {e}")
-                time.sleep(delay)
+                    await asyncio.sleep(base_delay * (2 ** attempt))
             else:
                 logger.error(f"[{node_id}] Image generation failed after {max_retries + 1} attempts: {e}")
                 return None
@@ -133,35 +225,14 @@ def _generate_image_sync(
     return None
 
 
-async def generate_image(
-    prompt: str,
-    node_id: str,
-    scenario_id: str | None = None,
-    seed: int | None = None
-) -> str | None:
-    """
-    비동기 이미지 생성 (스레드풀 사용)
-    
-    Args:
-        prompt: 이미지 생성 프롬프트
-        node_id: 노드 ID
-        scenario_id: 시나리오 ID (파일명 및 seed 생성에 사용)
-        seed: 이미지 생성 seed (동일 seed = 동일 스타일)
-    """
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(
-        None, partial(_generate_image_sync, prompt, node_id, scenario_id, seed)
-    )
-
-
 async def generate_images_for_nodes(
     nodes: dict, max_concurrent: int | None = None
 ) -> dict[str, str]:
     """
-    여러 노드의 이미지를 순차적으로 생성 (할당량 초과 방지)
+    여러 노드의 이미지를 생성 (할당량 초과 방지)
 
-    - 설정된 max_concurrent 사용 (기본 1 = 순차 처리)
-    - 각 요청 사이에 딜레이 추가
+    - 설정된 max_concurrent 사용 (1 = 순차 처리)
+    - 요청 속도는 image_limiter가 분당 제한에 맞춰 조절
     - 개별 이미지 생성에서 지수 백오프 재시도 적용
     """
     if max_concurrent is None:
@@ -169,7 +240,6 @@ async def generate_images_for_nodes(
 
     semaphore = asyncio.Semaphore(max_concurrent)
     results: dict[str, str] = {}
-    delay_between_requests = settings.image_retry_delay
 
     # 생성할 노드 목록
     nodes_to_generate = [
@@ -183,10 +253,6 @@ async def generate_images_for_nodes(
 
     async def gen_with_limit(index: int, node_id: str, prompt: str):
         async with semaphore:
-            # 첫 번째 요청이 아니면 딜레이 추가
-            if index > 0:
-                await asyncio.sleep(delay_between_requests)
-
             print(f"[{index + 1}/{total}] Generating image for {node_id}...")
             url = await generate_image(prompt, node_id)
             if url:
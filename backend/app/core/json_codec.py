@@ -0,0 +1,59 @@
+"""JSON 직렬화 공용 모듈
+
+시나리오/진행 상황/기사 저장 경로가 모두 이 모듈을 사용한다.
+- orjson이 설치되어 있으면 dict 직렬화에 사용하고, 없으면 표준 json으로 동작한다.
+- Pydantic 모델은 pydantic-core의 model_dump_json / model_validate_json을 직접 사용한다.
+- 기본은 들여쓰기 없는 compact 모드이며, 읽기는 기존 pretty 파일도 그대로 받는다.
+
+app.config를 import하지 않으므로 scenario_index 같은 표준 라이브러리 전용 스크립트에서도 쓸 수 있다.
+"""
+import json
+from pathlib import Path
+from typing import Any, TypeVar
+
+from app.core.atomic_io import atomic_write_bytes
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
+BACKEND = "orjson" if orjson else "json"
+
+ModelT = TypeVar("ModelT")
+
+
+def dumps(obj: Any, pretty: bool = False) -> bytes:
+    """dict/list → UTF-8 JSON 바이트 (한글 그대로 유지)"""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """JSON 바이트/문자열 → 파이썬 객체 (compact/pretty 모두 허용)"""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dump_model(model, pretty: bool = False) -> bytes:
+    """Pydantic 모델 → JSON 바이트 (model_dump + json.dump 이중 변환 없이)"""
+    return model.model_dump_json(indent=2 if pretty else None).encode("utf-8")
+
+
+def read_json(path: Path) -> Any:
+    """JSON 파일 읽기"""
+    return loads(path.read_bytes())
+
+
+def read_model(path: Path, model_cls: type[ModelT]) -> ModelT:
+    """JSON 파일을 Pydantic 모델로 바로 검증 (중간 dict 생성 없음)"""
+    return model_cls.model_validate_json(path.read_bytes())
+
+
+def write_bytes(path: Path, data: bytes) -> None:
+    """직렬화된 JSON 바이트를 파일로 원자적 저장 (임시 파일 + fsync + rename)"""
+    atomic_write_bytes(path, data)
@@ -0,0 +1,201 @@
+"""LLM 호출 공용 진입점 (litellm.acompletion 래퍼)
+
+실제 호출은 settings.llm_provider로 고른 제공자가 한다 (litellm | fake).
+
+모든 호출부는 purpose(호출부 이름)를 붙여 complete()를 거친다.
+응답 캐시는 호출부별로 끌 수 있다.
+- llm_cache_disabled: 조회/저장 모두 하지 않음
+- llm_cache_bypass: 조회는 건너뛰고 새 응답으로 저장만 갱신
+  (기본값: 매번 다른 시나리오가 나와야 하는 root/node/siblings. 중단된 빌드를 재실행할 때는 비워서 재사용)
+"""
+import asyncio
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+import litellm
+
+from app.config import settings
+from app.core import cassette, fake_provider, metrics
+from app.core.atomic_io import run_io
+from app.core.concurrency import AIMDLimiter, CircuitBreaker, CircuitOpenError
+from app.core.llm_cache import LLMResponseCache, cache_key
+
+logger = logging.getLogger("core.llm")
+
+PURPOSES = ("root", "node", "siblings", "summary", "rolling_summary", "education", "article")
+
+DEFAULT_CACHE_PATH = Path(__file__).parent.parent / "data" / "llm_cache.db"
+
+response_cache = LLMResponseCache(
+    Path(settings.llm_cache_path) if settings.llm_cache_path else DEFAULT_CACHE_PATH,
+    ttl=settings.llm_cache_ttl,
+    max_bytes=settings.llm_cache_max_bytes,
+)
+
+# 모든 LLM 호출이 공유하는 동시 실행 한도 (빌드별 세마포어 대체)
+limiter = AIMDLimiter(
+    initial=settings.llm_concurrency_initial,
+    max_limit=settings.llm_concurrency_max,
+    latency_target=settings.llm_latency_target,
+)
+
+# 모든 LLM 호출이 공유하는 회로 차단기 (장애 중에는 재시도 없이 호출부 폴백으로)
+breaker = CircuitBreaker(
+    failure_threshold=settings.llm_circuit_failure_threshold,
+    reset_timeout=settings.llm_circuit_reset_timeout,
+)
+
+
+def is_overload(error: BaseException) -> bool:
+    """429/타임아웃 등 한도를 줄여야 하는 오류인지"""
+    if isinstance(error, (asyncio.TimeoutError, litellm.RateLimitError, litellm.Timeout)):
+        return True
+    text = str(error)
+    return "429" in text or "RESOURCE_EXHAUSTED" in text
+
+
+async def _litellm_acompletion(purpose: str, messages: list[dict], **kwargs):
+    return await litellm.acompletion(
+        model=settings.llm_model,
+        messages=messages,
+        timeout=settings.llm_timeout,
+        api_key=settings.gemini_api_key,
+        **kwargs,
+    )
+
+
+def _provider():
+    """settings.llm_provider에 해당하는 호출 함수 (purpose, messages, **kwargs) -> 응답
+
+    카세트 세션 중이면 기록(record)하거나 기록된 응답을 재생(replay)하는 함수로 감싼다.
+    """
+    if settings.llm_provider == "litellm":
+        call = _litellm_acompletion
+    elif settings.llm_provider == "fake":
+        call = fake_provider.llm().acompletion
+    else:
+        raise ValueError(f"Unknown LLM provider: {settings.llm_provider}")
+    return cassette.wrap_llm(call)
+
+
+async def _acompletion(purpose: str, messages: list[dict], **kwargs):
+    """공유 동시 실행 한도 안에서 제공자 호출 (결과로 한도/회로 차단기 갱신)
+
+    회로가 열려 있으면 대기열에 들어가지 않고 CircuitOpenError로 즉시 실패한다.
+    """
+    if breaker.is_open():
+        breaker.before_call()  # 거부 집계 + CircuitOpenError
+    await limiter.acquire()
+    try:
+        breaker.before_call()
+    except CircuitOpenError:
+        limiter.release("cancelled")
+        raise
+    start = time.perf_counter()
+    outcome = "cancelled"
+    try:
+        response = await _provider()(purpose, messages, **kwargs)
+        outcome = "ok"
+        return response
+    except Exception as e:
+        outcome = "overload" if is_overload(e) else "error"
+        raise
+    finally:
+        limiter.release(outcome, time.perf_counter() - start)
+        if outcome == "ok":
+            breaker.record_success()
+        elif outcome == "cancelled":
+            breaker.record_cancelled()
+        else:
+            breaker.record_failure()
+
+
+def _cache_model() -> str:
+    # 가짜 제공자의 응답이 실제 모델 캐시와 섞이지 않도록 제공자를 키에 포함
+    if settings.llm_provider == "litellm":
+        return settings.llm_model
+    return f"{settings.llm_provider}:{settings.llm_model}"
+
+
+def _cache_mode(purpose: str, cache: bool) -> str:
+    """호출부의 캐시 사용 방식: use | bypass | off"""
+    if not cache or not settings.llm_cache_enabled or purpose in settings.llm_cache_disabled:
+        return "off"
+    if cassette.current() is not None:
+        return "off"  # 기록/재생 중에는 모든 호출이 카세트를 거치도록
+    if purpose in settings.llm_cache_bypass:
+        return "bypass"
+    return "use"
+
+
+async def complete(
+    purpose: str,
+    messages: list[dict],
+    *,
+    response_format: dict | None = None,
+    temperature: float | None = None,
+    parse: Callable[[str], Any] | None = None,
+    cache: bool = True,
+) -> Any:
+    """LLM 호출 후 응답 본문(parse가 있으면 parse 결과) 반환
+
+    parse가 실패한 응답은 캐시에 저장하지 않으므로 호출부의 재시도가 같은 응답을 다시 받지 않는다.
+    캐시에서 꺼낸 응답이 parse에 실패하면 해당 항목을 지우고 LLM을 호출한다.
+    """
+    if purpose not in PURPOSES:
+        raise ValueError(f"Unknown LLM purpose: {purpose}")
+
+    mode = _cache_mode(purpose, cache)
+    key = None
+    if mode == "off":
+        response_cache.bypassed[purpose] += 1
+    else:
+        key = cache_key(_cache_model(), messages, response_format, temperature)
+    if mode == "use":
+        try:
+            content = await run_io(response_cache.get, key)
+        except sqlite3.Error as e:
+            logger.warning("LLM 캐시 조회 실패: %s", e)
+            content = None
+        if content is not None:
+            try:
+                result = parse(content) if parse else content
+                response_cache.hits[purpose] += 1
+                metrics.record_cache_hit(purpose)
+                logger.debug("LLM 캐시 적중: purpose=%s", purpose)
+                return result
+            except Exception as e:
+                logger.warning("캐시된 응답 파싱 실패, 재요청: purpose=%s (%s)", purpose, str(e)[:100])
+                await run_io(response_cache.delete, key)
+        response_cache.misses[purpose] += 1
+    elif mode == "bypass":
+        response_cache.bypassed[purpose] += 1
+
+    kwargs = {}
+    if response_format is not None:
+        kwargs["response_format"] = response_format
+    if temperature is not None:
+        kwargs["temperature"] = temperature
+    start = time.perf_counter()
+    response = None
+    try:
+        response = await _acompletion(purpose, messages, **kwargs)
+        content = response.choices[0].message.content
+        result = parse(content) if parse else content
+    except CircuitOpenError:
+        metrics.record_llm_call(purpose, time.perf_counter() - start, "circuit_open")
+        raise
+    except Exception:
+        # 파싱 실패도 오류로 집계 (응답을 받았으면 토큰은 소비됨)
+        metrics.record_llm_call(purpose, time.perf_counter() - start, "error", getattr(response, "usage", None))
+        raise
+    metrics.record_llm_call(purpose, time.perf_counter() - start, "ok", getattr(response, "usage", None))
+    if key is not None:
+        try:
+            await run_io(response_cache.put, key, purpose, content)
+        except sqlite3.Error as e:
+            logger.warning("LLM 캐시 저장 실패: %s", e)
+    return result
@@ -0,0 +1,159 @@
+"""LLM 응답 캐시 (내용 주소 기반, SQLite)
+
+키는 (모델, 메시지, response_format, temperature)의 SHA-256이므로
+같은 프롬프트를 다시 보내는 경우(중단된 빌드 재실행, 같은 기사 재분석)에만 일치한다.
+TTL이 지난 항목은 조회 시 무시하고 저장 시 정리하며,
+전체 크기가 max_bytes를 넘으면 가장 오래 조회되지 않은 항목부터 축출한다(LRU).
+"""
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+logger = logging.getLogger("core.llm_cache")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    purpose TEXT NOT NULL,
+    content TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at);
+"""
+
+
+def cache_key(model: str, messages: list[dict], response_format: dict | None, temperature: float | None) -> str:
+    """요청 내용의 해시 (dict 키 순서와 무관)"""
+    raw = json.dumps(
+        [model, messages, response_format, temperature],
+        ensure_ascii=False, sort_keys=True, separators=(",", ":"),
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """SQLite 파일 하나에 보관하는 LLM 응답 캐시 + 호출부(purpose)별 적중 카운터
+
+    연결은 첫 사용 시 연다 (import만으로 파일을 만들지 않음).
+    get/put은 블로킹 호출이므로 이벤트 루프에서는 run_io로 실행한다.
+    """
+
+    def __init__(self, db_path: Path, ttl: float = 7 * 24 * 3600, max_bytes: int = 64 * 1024 * 1024):
+        self.db_path = db_path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits: Counter[str] = Counter()
+        self.misses: Counter[str] = Counter()
+        self.bypassed: Counter[str] = Counter()
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """연결 (lock 내부에서 호출)"""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            with self._conn:
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def get(self, key: str) -> str | None:
+        """만료되지 않은 응답 (조회 시각 갱신)"""
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT content, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[1] > self.ttl:
+                return None
+            with conn:
+                conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            return row[0]
+
+    def put(self, key: str, purpose: str, content: str) -> None:
+        """응답 저장 후 만료 항목 정리 + 크기 초과분 축출"""
+        now = time.time()
+        size = len(content.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, purpose, content, size, now, now),
+                )
+                conn.execute("DELETE FROM responses WHERE created_at < ?", (now - self.ttl,))
+                self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection):
+        """max_bytes 초과 시 조회가 오래된 항목부터 삭제 (트랜잭션 내부에서 호출)"""
+        total = conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM responses").fetchone()[0]
+        excess = total - self.max_bytes
+        if excess <= 0:
+            return
+        victims = []
+        for key, size in conn.execute("SELECT key, size_bytes FROM responses ORDER BY accessed_at"):
+            victims.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+        logger.debug("LLM 캐시 축출: %d개", len(victims))
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM responses")
+
+    def usage(self) -> tuple[int, int]:
+        """(항목 수, 전체 바이트)"""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM responses"
+            ).fetchone()
+            return row[0], row[1]
+
+    def stats(self) -> dict[str, dict]:
+        """호출부별 적중 카운터"""
+        purposes = set(self.hits) | set(self.misses) | set(self.bypassed)
+        result = {}
+        for purpose in sorted(purposes):
+            lookups = self.hits[purpose] + self.misses[purpose]
+            result[purpose] = {
+                "hits": self.hits[purpose],
+                "misses": self.misses[purpose],
+                "bypassed": self.bypassed[purpose],
+                "hit_rate": round(self.hits[purpose] / lookups, 3) if lookups else 0.0,
+            }
+        return result
+
+    def summary(self) -> str:
+        """로그용 한 줄 요약"""
+        parts = [
+            f"{purpose}={s['hits']}/{s['hits'] + s['misses']}"
+            for purpose, s in self.stats().items()
+        ]
+        return ", ".join(parts) or "호출 없음"
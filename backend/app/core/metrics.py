@@ -0,0 +1,268 @@
+"""파이프라인 메트릭 (Prometheus 텍스트 형식 + 작업별 요약)
+
+- 빌더 단계별 소요 시간
+- LLM 호출 (purpose별): 지연 시간, 결과, 재시도, 폴백, 토큰
+- Imagen 호출: 지연 시간, 결과, 재시도
+- 게이지: 스크레이프 시점에 읽는 현재 값 (예: Imagen 속도 제한 대기열)
+
+기록은 프로세스 전역 registry와, task_scope()로 묶인 현재 작업의 Metrics에 함께 반영된다.
+작업 범위는 contextvars로 전달되므로 gather로 만든 하위 Task에도 이어진다.
+(스레드풀에서 실행되는 호출은 contextvars.copy_context().run으로 넘겨야 함)
+"""
+import threading
+import time
+from collections.abc import Callable
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# 초 단위 버킷 (LLM 호출 ~ 빌드 단계 50분까지)
+BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120, 300, 600, 1800, 3600)
+
+PHASE_SECONDS = "phishguard_phase_seconds"
+LLM_SECONDS = "phishguard_llm_request_seconds"
+LLM_REQUESTS = "phishguard_llm_requests_total"
+LLM_RETRIES = "phishguard_llm_retries_total"
+LLM_FALLBACKS = "phishguard_llm_fallbacks_total"
+LLM_TOKENS = "phishguard_llm_tokens_total"
+IMAGE_SECONDS = "phishguard_image_request_seconds"
+IMAGE_REQUESTS = "phishguard_image_requests_total"
+IMAGE_RETRIES = "phishguard_image_retries_total"
+
+METRIC_HELP = {
+    PHASE_SECONDS: ("histogram", "Scenario build phase duration"),
+    LLM_SECONDS: ("histogram", "LLM request latency by purpose"),
+    LLM_REQUESTS: ("counter", "LLM requests by purpose and outcome (ok, error, cache_hit, circuit_open)"),
+    LLM_RETRIES: ("counter", "LLM retries by purpose"),
+    LLM_FALLBACKS: ("counter", "Fallback results used instead of LLM output"),
+    LLM_TOKENS: ("counter", "LLM tokens by purpose and kind (prompt, completion)"),
+    IMAGE_SECONDS: ("histogram", "Imagen request latency"),
+    IMAGE_REQUESTS: ("counter", "Imagen requests by outcome (ok, empty, blocked, error)"),
+    IMAGE_RETRIES: ("counter", "Imagen retries by reason (quota, error)"),
+}
+
+Labels = tuple[tuple[str, str], ...]
+
+
+class _Histogram:
+    __slots__ = ("counts", "count", "sum")
+
+    def __init__(self):
+        self.counts = [0] * len(BUCKETS)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(BUCKETS):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+
+
+def _labels(labels: dict) -> Labels:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_labels(labels: Labels, extra: tuple[str, str] | None = None) -> str:
+    pairs = [*labels, extra] if extra else list(labels)
+    if not pairs:
+        return ""
+    escaped = (v.replace("\\", "\\\\").replace('"', '\\"') for _, v in pairs)
+    return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(pairs, escaped)) + "}"
+
+
+class Metrics:
+    """라벨별 카운터/히스토그램 모음"""
+
+    def __init__(self):
+        self._counters: dict[tuple[str, Labels], float] = {}
+        self._histograms: dict[tuple[str, Labels], _Histogram] = {}
+        self._gauges: dict[str, tuple[str, Callable[[], float]]] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, amount: float = 1, **labels) -> None:
+        key = (name, _labels(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        key = (name, _labels(labels))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = _Histogram()
+            histogram.observe(value)
+
+    def gauge(self, name: str, help_text: str, read: Callable[[], float]) -> None:
+        """렌더링할 때마다 read()로 값을 읽는 게이지 등록"""
+        with self._lock:
+            self._gauges[name] = (help_text, read)
+
+    def counter(self, name: str, **labels) -> float:
+        """라벨이 일치하는(지정한 라벨만 비교) 카운터 합계"""
+        wanted = set(_labels(labels))
+        with self._lock:
+            return sum(v for (n, l), v in self._counters.items() if n == name and wanted <= set(l))
+
+    def histogram(self, name: str, **labels) -> tuple[int, float]:
+        """라벨이 일치하는 히스토그램의 (관측 수, 합계)"""
+        wanted = set(_labels(labels))
+        count, total = 0, 0.0
+        with self._lock:
+            for (n, l), h in self._histograms.items():
+                if n == name and wanted <= set(l):
+                    count += h.count
+                    total += h.sum
+        return count, total
+
+    def render(self) -> str:
+        """Prometheus 텍스트 노출 형식"""
+        lines: list[str] = []
+        with self._lock:
+            for name, (kind, help_text) in METRIC_HELP.items():
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+                if kind == "counter":
+                    for (n, labels), value in sorted(self._counters.items()):
+                        if n == name:
+                            lines.append(f"{name}{_format_labels(labels)} {value:g}")
+                    continue
+                for (n, labels), h in sorted(self._histograms.items(), key=lambda item: item[0]):
+                    if n != name:
+                        continue
+                    cumulative = 0
+                    for bound, count in zip(BUCKETS, h.counts):
+                        cumulative += count
+                        lines.append(f"{name}_bucket{_format_labels(labels, ('le', f'{bound:g}'))} {cumulative}")
+                    lines.append(f"{name}_bucket{_format_labels(labels, ('le', '+Inf'))} {h.count}")
+                    lines.append(f"{name}_sum{_format_labels(labels)} {h.sum:.6f}")
+                    lines.append(f"{name}_count{_format_labels(labels)} {h.count}")
+            gauges = dict(self._gauges)
+        for name, (help_text, read) in gauges.items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f"{name} {read():g}")
+        return "\n".join(lines) + "\n"
+
+    def summary(self) -> dict:
+        """작업 상태 응답용 요약 (단계별 초, purpose별 LLM 통계, 이미지 통계)"""
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = {key: (h.count, h.sum) for key, h in self._histograms.items()}
+
+        phases: dict[str, float] = {}
+        llm: dict[str, dict] = {}
+        images = {"calls": 0, "errors": 0, "retries": 0, "seconds": 0.0}
+
+        def llm_entry(labels: Labels) -> dict:
+            purpose = dict(labels)["purpose"]
+            return llm.setdefault(purpose, {
+                "calls": 0, "cache_hits": 0, "circuit_open": 0, "errors": 0, "retries": 0, "fallbacks": 0,
+                "seconds": 0.0, "prompt_tokens": 0, "completion_tokens": 0,
+            })
+
+        for (name, labels), (count, total) in histograms.items():
+            if name == PHASE_SECONDS:
+                phases[dict(labels)["phase"]] = round(phases.get(dict(labels)["phase"], 0) + total, 3)
+            elif name == LLM_SECONDS:
+                llm_entry(labels)["seconds"] = round(llm_entry(labels)["seconds"] + total, 3)
+            elif name == IMAGE_SECONDS:
+                images["seconds"] = round(images["seconds"] + total, 3)
+
+        for (name, labels), value in counters.items():
+            value = int(value)
+            label_map = dict(labels)
+            if name == LLM_REQUESTS:
+                entry = llm_entry(labels)
+                if label_map["outcome"] == "cache_hit":
+                    entry["cache_hits"] += value
+                elif label_map["outcome"] == "circuit_open":
+                    entry["circuit_open"] += value
+                else:
+                    entry["calls"] += value
+                    if label_map["outcome"] == "error":
+                        entry["errors"] += value
+            elif name == LLM_RETRIES:
+                llm_entry(labels)["retries"] += value
+            elif name == LLM_FALLBACKS:
+                llm_entry(labels)["fallbacks"] += value
+            elif name == LLM_TOKENS:
+                llm_entry(labels)[f"{label_map['kind']}_tokens"] += value
+            elif name == IMAGE_REQUESTS:
+                images["calls"] += value
+                if label_map["outcome"] == "error":
+                    images["errors"] += value
+            elif name == IMAGE_RETRIES:
+                images["retries"] += value
+
+        return {"phases": phases, "llm": llm, "images": images}
+
+
+# 프로세스 전역 (/metrics)
+registry = Metrics()
+_task_metrics: ContextVar[Metrics | None] = ContextVar("task_metrics", default=None)
+
+
+def _targets() -> list[Metrics]:
+    task = _task_metrics.get()
+    return [registry, task] if task is not None else [registry]
+
+
+def inc(name: str, amount: float = 1, **labels) -> None:
+    for target in _targets():
+        target.inc(name, amount, **labels)
+
+
+def observe(name: str, value: float, **labels) -> None:
+    for target in _targets():
+        target.observe(name, value, **labels)
+
+
+@contextmanager
+def task_scope(task_metrics: Metrics):
+    """이 범위에서 기록되는 메트릭을 작업별 Metrics에도 반영"""
+    token = _task_metrics.set(task_metrics)
+    try:
+        yield task_metrics
+    finally:
+        _task_metrics.reset(token)
+
+
+@contextmanager
+def phase(name: str):
+    """빌더 단계 소요 시간 기록"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(PHASE_SECONDS, time.perf_counter() - start, phase=name)
+
+
+def record_llm_call(purpose: str, seconds: float, outcome: str, usage=None) -> None:
+    observe(LLM_SECONDS, seconds, purpose=purpose)
+    inc(LLM_REQUESTS, purpose=purpose, outcome=outcome)
+    if usage is not None:
+        inc(LLM_TOKENS, getattr(usage, "prompt_tokens", 0) or 0, purpose=purpose, kind="prompt")
+        inc(LLM_TOKENS, getattr(usage, "completion_tokens", 0) or 0, purpose=purpose, kind="completion")
+
+
+def record_cache_hit(purpose: str) -> None:
+    inc(LLM_REQUESTS, purpose=purpose, outcome="cache_hit")
+
+
+def record_retry(purpose: str) -> None:
+    inc(LLM_RETRIES, purpose=purpose)
+
+
+def record_fallback(purpose: str, count: int = 1) -> None:
+    inc(LLM_FALLBACKS, count, purpose=purpose)
+
+
+def record_image_call(seconds: float, outcome: str) -> None:
+    observe(IMAGE_SECONDS, seconds)
+    inc(IMAGE_REQUESTS, outcome=outcome)
+
+
+def record_image_retry(reason: str) -> None:
+    inc(IMAGE_RETRIES, reason=reason)
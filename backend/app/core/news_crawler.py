@@ -9,10 +9,11 @@ from difflib import SequenceMatcher
 from urllib.parse import urlparse, urlunparse, quote
 import httpx
 import trafilatura
-import litellm
 import feedparser
 
 from app.config import settings
+from app.core import llm, metrics
+from app.core.fake_provider import FakeNewsSource
 from app.models.news import RawArticle, PhishingArticle
 
 logger = logging.getLogger("core.news_crawler")
@@ -140,9 +141,15 @@ class NewsCrawler:
     ]
 
     def __init__(self):
-        """RSS 기반 크롤러 초기화"""
-        self.google_client = GoogleNewsClient()
-        self.body_extractor = ArticleBodyExtractor()
+        """RSS 기반 크롤러 초기화 (settings.news_provider=fake면 네트워크 없이 가짜 기사 사용)"""
+        if settings.news_provider == "fake":
+            source = FakeNewsSource()
+            self.google_client = self.body_extractor = source
+            self.request_interval = 0.0
+        else:
+            self.google_client = GoogleNewsClient()
+            self.body_extractor = ArticleBodyExtractor()
+            self.request_interval = 1.0  # 레이트 리밋 방지
 
     async def crawl(
         self,
@@ -170,7 +177,7 @@ class NewsCrawler:
                 if not is_duplicate(article, articles):
                     articles.append(article)
 
-            await asyncio.sleep(1)  # 레이트 리밋 방지
+            await asyncio.sleep(self.request_interval)
 
         # 최신순 정렬
         articles = self._sort_by_date(articles)
@@ -204,12 +211,13 @@ class NewsCrawler:
         for article in articles:
             body = await self.body_extractor.extract(article.url)
             article.body = body
-            await asyncio.sleep(1)  # 본문 크롤링 간격
+            await asyncio.sleep(self.request_interval)  # 본문 크롤링 간격
         return articles
 
     async def close(self):
         await self.google_client.close()
-        await self.body_extractor.close()
+        if self.body_extractor is not self.google_client:
+            await self.body_extractor.close()
 
 
 async def analyze_article(article: RawArticle) -> PhishingArticle | None:
@@ -255,19 +263,16 @@ async def analyze_article(article: RawArticle) -> PhishingArticle | None:
 
     for attempt in range(settings.retry_count + 1):
         try:
-            response = await litellm.acompletion(
-                model=settings.llm_model,
-                messages=[
+            data = await llm.complete(
+                "article",
+                [
                     {"role": "system", "content": "뉴스 기사를 분석하여 피싱/사기 관련 여부를 판단하고 정보를 JSON으로 추출하세요."},
                     {"role": "user", "content": prompt},
                 ],
                 response_format={"type": "json_object"},
-                timeout=settings.llm_timeout,
-                api_key=settings.gemini_api_key,
+                parse=json.loads,
             )
 
-            data = json.loads(response.choices[0].message.content)
-
             # 피싱 관련 기사가 아니면 None 반환
             if not data.get("is_phishing_related", False):
                 logger.debug("피싱 무관 기사 제외: %s", article.title)
@@ -292,8 +297,11 @@ async def analyze_article(article: RawArticle) -> PhishingArticle | None:
 
         except Exception as e:
             logger.warning("기사 분석 실패 (시도 %d): %s", attempt + 1, str(e))
-            if attempt == settings.retry_count:
+            # 회로 차단 중이면 재시도/백오프 없이 바로 제외
+            if attempt == settings.retry_count or isinstance(e, llm.CircuitOpenError):
+                metrics.record_fallback("article")
                 return None
+            metrics.record_retry("article")
             await asyncio.sleep(1)
 
     return None
@@ -309,15 +317,9 @@ async def crawl_and_analyze(
         # 1. 크롤링
         raw_articles = await crawler.crawl(keywords)
 
-        # 2. 병렬 분석 (세마포어로 동시 호출 제한)
-        semaphore = asyncio.Semaphore(5)
-
-        async def analyze_with_limit(article: RawArticle):
-            async with semaphore:
-                return await analyze_article(article)
-
+        # 2. 병렬 분석 (동시 호출 수는 LLM 공용 적응형 한도가 제한)
         results = await asyncio.gather(
-            *[analyze_with_limit(a) for a in raw_articles],
+            *[analyze_article(a) for a in raw_articles],
             return_exceptions=True
         )
 
@@ -0,0 +1,229 @@
+"""시나리오 카탈로그 (프로세스 전역 인메모리 캐시)"""
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from app.models.scenario import ScenarioTree
+from app.core.http_cache import EncodedPayload
+from app.core.scenario_storage import ScenarioStorage, Version, scenario_summary
+from app.core.scenario_search import ScenarioSearchIndex
+from app.core.scenario_query import ScenarioQuery, Cursor
+
+logger = logging.getLogger("core.scenario_catalog")
+
+
+@dataclass
+class _CachedTree:
+    """파싱된 시나리오 트리 캐시 항목"""
+    version: Version  # 저장소의 변경 감지 토큰
+    size: int  # 원본 크기 (메모리 사용량 근사치)
+    scenario: ScenarioTree
+    payload: EncodedPayload | None = None  # 직렬화/압축된 응답 바이트
+
+    @property
+    def weight(self) -> int:
+        return self.size + (self.payload.nbytes if self.payload else 0)
+
+
+class TreeCache:
+    """파싱된 ScenarioTree의 크기 제한 LRU
+
+    항목 수와 대략적 바이트(원본 크기 + 캐시된 응답 바이트) 두 가지 한도를 모두 지킨다.
+    조회 시 저장소의 변경 감지 토큰이 다르면 해당 항목을 무효화한다.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, _CachedTree] = OrderedDict()
+        self._weights: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str, version: Version) -> _CachedTree | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry.version != version:
+                self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: str, entry: _CachedTree):
+        with self._lock:
+            self._remove(key)
+            if entry.weight > self.max_bytes:
+                return
+            self._entries[key] = entry
+            self._weights[key] = entry.weight
+            self.total_bytes += entry.weight
+            self._evict()
+
+    def reweigh(self, key: str):
+        """항목의 크기가 바뀐 경우 (응답 바이트 추가 등) 합계 갱신 후 초과분 축출"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            self.total_bytes += entry.weight - self._weights[key]
+            self._weights[key] = entry.weight
+            self._evict()
+
+    def _evict(self):
+        """한도 초과 시 가장 오래된 항목부터 제거 (lock 내부에서 호출)"""
+        while self._entries and (
+            len(self._entries) > self.max_entries or self.total_bytes > self.max_bytes
+        ):
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+
+    def discard(self, key: str):
+        with self._lock:
+            self._remove(key)
+
+    def keys(self) -> list[str]:
+        with self._lock:
+            return list(self._entries)
+
+    def _remove(self, key: str):
+        """항목 제거 (lock 내부에서 호출)"""
+        if self._entries.pop(key, None) is not None:
+            self.total_bytes -= self._weights.pop(key)
+
+
+class ScenarioCatalog:
+    """시나리오 저장소 앞단의 인메모리 카탈로그
+
+    목록은 저장소의 요약(JSON: 디렉토리별 _index.json, SQLite: scenarios 테이블)에서
+    제공하여 트리를 파싱하지 않고, 상세 조회 시에만 트리를 로드한다.
+    로드한 트리는 저장소의 변경 감지 토큰과 함께 LRU에 보관한다.
+    """
+
+    def __init__(
+        self,
+        storage: ScenarioStorage,
+        refresh_interval: float = 0.0,
+        cache_max_entries: int = 64,
+        cache_max_bytes: int = 64 * 1024 * 1024,
+    ):
+        self.storage = storage
+        self.refresh_interval = refresh_interval
+        self._trees = TreeCache(cache_max_entries, cache_max_bytes)
+        self.search_index = ScenarioSearchIndex()
+        self._last_refresh: float | None = None
+        self._lock = threading.Lock()
+        # 파일 감시가 켜져 있으면 요청 경로에서 재스캔하지 않음 (scenario_watcher가 변경을 밀어 넣음)
+        self.watched = False
+
+    def refresh(self, force: bool = False) -> bool:
+        """저장소의 외부 변경 사항을 요약 목록에 반영 (refresh_interval 간격으로 제한). 변경이 있었으면 True."""
+        if self.watched and not force:
+            return False
+        with self._lock:
+            now = time.monotonic()
+            if (
+                not force
+                and self._last_refresh is not None
+                and now - self._last_refresh < self.refresh_interval
+            ):
+                return False
+            self._last_refresh = now
+        return self.storage.refresh()
+
+    def put(self, scenario: ScenarioTree) -> None:
+        """저장 직후의 시나리오를 재로드 없이 캐시에 반영"""
+        found = self.storage.version(scenario.id)
+        # 같은 ID의 시드가 우선하면 조회 대상은 방금 저장한 트리가 아니므로 캐시하지 않음
+        if found is None or found != self.storage.writable_version(scenario.id):
+            return
+        version, size = found
+        self._trees.put(scenario.id, _CachedTree(version, size, scenario))
+        self.search_index.add(scenario, scenario_summary(scenario), version)
+
+    def invalidate(self, scenario_id: str) -> None:
+        self._trees.discard(scenario_id)
+
+    def reindex(self, scenario_ids: set[str]) -> None:
+        """외부에서 바뀐 시나리오의 캐시 무효화 + 검색 색인 갱신 (LRU는 채우지 않음)"""
+        for scenario_id in scenario_ids:
+            self._trees.discard(scenario_id)
+            found = self.storage.version(scenario_id)
+            scenario = self.storage.load(scenario_id) if found else None
+            if scenario is None:
+                self.search_index.remove(scenario_id)
+            else:
+                self.search_index.add(scenario, scenario_summary(scenario), found[0])
+
+    def sync_search(self) -> int:
+        """검색 색인을 저장소와 맞춤 (시작 시 초기 색인, polling 변경 반영). 갱신 수 반환."""
+        self.refresh()
+        current = {summary["id"] for summary in self.storage.summaries()}
+        stale = self.search_index.ids() - current
+        for scenario_id in stale:
+            self.search_index.remove(scenario_id)
+        changed = set()
+        for scenario_id in current:
+            found = self.storage.version(scenario_id)
+            if found is None or found[0] != self.search_index.version(scenario_id):
+                changed.add(scenario_id)
+        self.reindex(changed)
+        if stale or changed:
+            logger.info("검색 색인 동기화: 갱신 %d, 제거 %d (총 %d)",
+                        len(changed), len(stale), len(self.search_index))
+        return len(changed) + len(stale)
+
+    def search(self, query: str, limit: int = 20) -> list[dict]:
+        return self.search_index.search(query, limit)
+
+    def query(self, query: ScenarioQuery) -> tuple[list[dict], Cursor | None]:
+        """필터/정렬된 요약 한 페이지 (저장소 인덱스 사용, 전체 스캔 없음)"""
+        return self.storage.query(query)
+
+    def list(self) -> list[dict]:
+        """카탈로그의 모든 시나리오 요약"""
+        return self.storage.summaries()
+
+    def get(self, scenario_id: str) -> ScenarioTree | None:
+        """ID로 시나리오 조회 (변경되지 않았으면 LRU에 캐시된 트리 반환)"""
+        entry = self._get_entry(scenario_id)
+        return entry.scenario if entry else None
+
+    def get_payload(self, scenario_id: str, encoding: str | None = None) -> EncodedPayload | None:
+        """직렬화된 응답 페이로드 조회 (요청 인코딩 변형까지 미리 생성해 둠)"""
+        entry = self._get_entry(scenario_id)
+        if entry is None:
+            return None
+        if entry.payload is None:
+            entry.payload = EncodedPayload(entry.scenario.model_dump_json().encode("utf-8"))
+        entry.payload.encoded(encoding)
+        self._trees.reweigh(scenario_id)
+        return entry.payload
+
+    def _get_entry(self, scenario_id: str) -> _CachedTree | None:
+        found = self.storage.version(scenario_id)
+        if found is None:
+            return None
+        version, size = found
+
+        entry = self._trees.get(scenario_id, version)
+        if entry is not None:
+            return entry
+
+        scenario = self.storage.load(scenario_id)
+        if scenario is None:
+            return None
+        entry = _CachedTree(version, size, scenario)
+        self._trees.put(scenario_id, entry)
+        return entry
@@ -0,0 +1,258 @@
+"""시나리오 요약 인덱스 (_index.json)
+
+목록 조회에 필요한 요약 필드만 디렉토리별 인덱스 파일에 보관하여,
+목록 API가 전체 트리를 파싱하지 않도록 한다.
+표준 라이브러리(+ 선택적 orjson)만 사용하므로 스크립트에서 `python3 -m app.core.scenario_index`로 바로 실행할 수 있다.
+"""
+import logging
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from app.core import json_codec
+from app.core.scenario_query import to_utc_iso
+
+logger = logging.getLogger("core.scenario_index")
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+DEFAULT_DIRECTORIES = [DATA_DIR / "seed_scenarios", DATA_DIR / "scenarios"]
+
+INDEX_FILENAME = "_index.json"
+INDEX_VERSION = 2  # 2: created_at을 UTC로 정규화
+SUMMARY_FIELDS = ("id", "title", "description", "phishing_type", "difficulty", "created_at")
+
+
+def is_scenario_file(file_path: Path) -> bool:
+    """인덱스 등 내부 파일(_ 접두사)을 제외한 시나리오 JSON 여부"""
+    return file_path.suffix == ".json" and not file_path.name.startswith("_")
+
+
+def _normalize_created_at(value) -> str:
+    """created_at을 UTC ISO 문자열로 통일 (조회 경계값/커서와 문자열로 비교하므로)"""
+    if isinstance(value, datetime):
+        return to_utc_iso(value)
+    try:
+        return to_utc_iso(datetime.fromisoformat(str(value)))
+    except ValueError:
+        return str(value)
+
+
+def summarize(data: dict) -> dict:
+    """시나리오 JSON(dict)에서 목록용 요약 추출 (노드는 파싱하지 않음)"""
+    summary = {field: data[field] for field in SUMMARY_FIELDS}
+    summary["created_at"] = _normalize_created_at(summary["created_at"])
+    return summary
+
+
+class ScenarioIndex:
+    """디렉토리 하나에 대한 요약 인덱스
+
+    파일명 → 요약 + (mtime, size)를 유지하고, 디렉토리와 비교하여
+    추가/변경된 파일만 다시 읽는다.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.index_path = directory / INDEX_FILENAME
+        self._entries: dict[str, dict] = {}
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def _load(self):
+        """인덱스 파일 로드 (lock 내부에서 호출)"""
+        self._loaded = True
+        if not self.index_path.exists():
+            return
+        try:
+            data = json_codec.read_json(self.index_path)
+            if data.get("version") == INDEX_VERSION:
+                self._entries = data.get("entries", {})
+        except Exception as e:
+            logger.warning("인덱스 로드 실패, 재생성 예정: %s (%s)", self.index_path, str(e)[:100])
+            self._entries = {}
+
+    def _persist(self):
+        """인덱스 파일 저장 (lock 내부에서 호출, 원자적 교체)"""
+        try:
+            json_codec.write_bytes(
+                self.index_path,
+                json_codec.dumps({"version": INDEX_VERSION, "entries": self._entries}),
+            )
+        except OSError as e:
+            logger.warning("인덱스 저장 실패: %s (%s)", self.index_path, e)
+
+    def sync(self) -> bool:
+        """디렉토리와 인덱스 동기화. 변경이 있었으면 True."""
+        with self._lock:
+            if not self._loaded:
+                self._load()
+
+            if not self.directory.exists():
+                changed = bool(self._entries)
+                self._entries = {}
+                return changed
+
+            seen: set[str] = set()
+            changed = False
+            for file_path in self.directory.iterdir():
+                if not is_scenario_file(file_path):
+                    continue
+                try:
+                    stat = file_path.stat()
+                except OSError:
+                    continue
+                seen.add(file_path.name)
+
+                entry = self._entries.get(file_path.name)
+                if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                    continue
+
+                self._entries[file_path.name] = self._read_entry(file_path, stat)
+                changed = True
+
+            for name in [name for name in self._entries if name not in seen]:
+                del self._entries[name]
+                changed = True
+
+            if changed:
+                self._persist()
+            return changed
+
+    @staticmethod
+    def _read_entry(file_path: Path, stat) -> dict:
+        """파일에서 요약을 추출한 인덱스 항목 (실패 시 summary=None)"""
+        try:
+            summary = summarize(json_codec.read_json(file_path))
+        except Exception as e:
+            logger.warning("요약 추출 실패: %s (%s)", file_path.name, str(e)[:100])
+            summary = None
+        return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "summary": summary}
+
+    def sync_file(self, file_path: Path) -> tuple[dict | None, dict | None] | None:
+        """파일 하나만 동기화 (파일 감시 이벤트용)
+
+        Returns:
+            변경 시 (이전 요약, 새 요약), 변경 없으면 None. 삭제된 파일은 새 요약이 None.
+        """
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            old = self._entries.get(file_path.name)
+            try:
+                stat = file_path.stat()
+            except OSError:
+                if old is None:
+                    return None
+                del self._entries[file_path.name]
+                self._persist()
+                return old["summary"], None
+
+            if old and old["mtime_ns"] == stat.st_mtime_ns and old["size"] == stat.st_size:
+                return None
+            entry = self._read_entry(file_path, stat)
+            self._entries[file_path.name] = entry
+            self._persist()
+            return (old["summary"] if old else None), entry["summary"]
+
+    def lookup(self, scenario_id: str) -> tuple[Path, dict] | None:
+        """ID의 (파일 경로, 요약). `{id}.json`을 먼저 확인하고 없으면 항목을 순회."""
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            entry = self._entries.get(f"{scenario_id}.json")
+            if entry and entry["summary"] and entry["summary"]["id"] == scenario_id:
+                return self.directory / f"{scenario_id}.json", entry["summary"]
+            for name, entry in self._entries.items():
+                if entry["summary"] and entry["summary"]["id"] == scenario_id:
+                    return self.directory / name, entry["summary"]
+            return None
+
+    def upsert(self, file_path: Path, summary: dict):
+        """저장된 시나리오 파일의 요약 반영"""
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            self._entries[file_path.name] = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "summary": summary,
+            }
+            self._persist()
+
+    def remove(self, scenario_id: str) -> bool:
+        """ID에 해당하는 항목 제거. 제거했으면 True."""
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            names = [
+                name for name, entry in self._entries.items()
+                if name == f"{scenario_id}.json"
+                or (entry["summary"] and entry["summary"]["id"] == scenario_id)
+            ]
+            for name in names:
+                del self._entries[name]
+            if names:
+                self._persist()
+            return bool(names)
+
+    def rebuild(self) -> int:
+        """인덱스를 버리고 디렉토리에서 다시 생성. 항목 수 반환."""
+        with self._lock:
+            self._entries = {}
+            self._loaded = True
+        self.sync()
+        with self._lock:
+            if self.directory.exists():
+                self._persist()
+            return len(self._entries)
+
+    def items(self) -> list[tuple[Path, dict]]:
+        """(파일 경로, 요약) 목록 (요약 추출에 실패한 파일 제외)"""
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            return [
+                (self.directory / name, entry["summary"])
+                for name, entry in self._entries.items()
+                if entry["summary"] is not None
+            ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI: 인덱스 재생성 / 항목 제거
+
+    python -m app.core.scenario_index rebuild [디렉토리...]
+    python -m app.core.scenario_index remove <scenario_id> [디렉토리...]
+    """
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+    args = list(sys.argv[1:] if argv is None else argv)
+    if not args or args[0] not in ("rebuild", "remove"):
+        print(main.__doc__)
+        return 1
+
+    command = args.pop(0)
+    scenario_id = None
+    if command == "remove":
+        if not args:
+            print("scenario_id가 필요합니다")
+            return 1
+        scenario_id = args.pop(0)
+
+    directories = [Path(a) for a in args] or DEFAULT_DIRECTORIES
+    for directory in directories:
+        index = ScenarioIndex(directory)
+        if command == "rebuild":
+            count = index.rebuild()
+            print(f"{directory}: {count}개 항목")
+        elif index.remove(scenario_id):
+            print(f"{directory}: {scenario_id} 제거됨")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,168 @@
+"""시나리오 목록 조회 (필터 + 정렬 + 커서 페이지네이션)
+
+- ScenarioQuery: 목록 API 파라미터
+- SummaryIndex: JSON 저장소용 인메모리 정렬 인덱스.
+  정렬 키별 (키, id) 정렬 리스트를 전체/필터 값별로 유지하여
+  bisect로 커서 위치를 찾고 필요한 만큼만 순회한다.
+  (SQLite 저장소는 같은 조건을 복합 인덱스 + keyset 쿼리로 처리)
+- 커서: 마지막 항목의 (정렬 키, id)를 base64url로 감싼 불투명 문자열
+"""
+import base64
+import bisect
+import json
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+SORT_FIELDS = ("created_at", "title")
+FILTER_FIELDS = ("phishing_type", "difficulty")
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# (정렬 키, id)
+Cursor = tuple[str, str]
+
+
+class InvalidCursorError(ValueError):
+    """디코딩할 수 없거나 다른 정렬 조건으로 만들어진 커서"""
+
+
+@dataclass
+class ScenarioQuery:
+    """목록 조회 조건 (created_from 이상, created_to 미만)"""
+    phishing_type: str | None = None
+    difficulty: str | None = None
+    created_from: str | None = None
+    created_to: str | None = None
+    sort: str = "created_at"
+    descending: bool = True
+    limit: int = DEFAULT_PAGE_SIZE
+    cursor: Cursor | None = None
+
+    def matches(self, summary: dict) -> bool:
+        if self.phishing_type and summary["phishing_type"] != self.phishing_type:
+            return False
+        if self.difficulty and summary["difficulty"] != self.difficulty:
+            return False
+        if self.created_from and summary["created_at"] < self.created_from:
+            return False
+        if self.created_to and summary["created_at"] >= self.created_to:
+            return False
+        return True
+
+
+def to_utc_iso(value: datetime) -> str:
+    """조회 경계값 → 저장된 created_at과 비교 가능한 UTC ISO 문자열 (naive는 UTC로 간주)"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat()
+
+
+def encode_cursor(query: ScenarioQuery, cursor: Cursor) -> str:
+    raw = json.dumps(
+        [query.sort, query.descending, cursor[0], cursor[1]],
+        ensure_ascii=False, separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(query: ScenarioQuery, token: str) -> Cursor:
+    """커서 디코딩. 정렬 조건이 다르면 InvalidCursorError."""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        sort, descending, key, scenario_id = json.loads(raw)
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError("Invalid cursor") from e
+    if sort != query.sort or descending != query.descending:
+        raise InvalidCursorError("Cursor does not match sort order")
+    if not isinstance(key, str) or not isinstance(scenario_id, str):
+        raise InvalidCursorError("Invalid cursor")
+    return key, scenario_id
+
+
+class SummaryIndex:
+    """요약 목록의 정렬 인덱스 (전체 + 필터 값별)"""
+
+    def __init__(self):
+        self._summaries: dict[str, dict] = {}
+        # (정렬 필드, 필터 필드 | None, 필터 값 | None) → 정렬된 (키, id) 리스트
+        self._lists: dict[tuple, list[Cursor]] = {}
+        self._lock = threading.Lock()
+
+    def replace_all(self, summaries: list[dict]) -> None:
+        lists: dict[tuple, list[Cursor]] = {}
+        for summary in summaries:
+            for list_key, entry in self._entries(summary):
+                lists.setdefault(list_key, []).append(entry)
+        for entries in lists.values():
+            entries.sort()
+        with self._lock:
+            self._summaries = {s["id"]: s for s in summaries}
+            self._lists = lists
+
+    def upsert(self, summary: dict) -> None:
+        with self._lock:
+            self._remove(summary["id"])
+            self._summaries[summary["id"]] = summary
+            for list_key, entry in self._entries(summary):
+                bisect.insort(self._lists.setdefault(list_key, []), entry)
+
+    def remove(self, scenario_id: str) -> None:
+        with self._lock:
+            self._remove(scenario_id)
+
+    def _remove(self, scenario_id: str):
+        """lock 내부에서 호출"""
+        old = self._summaries.pop(scenario_id, None)
+        if old is None:
+            return
+        for list_key, entry in self._entries(old):
+            entries = self._lists.get(list_key, [])
+            i = bisect.bisect_left(entries, entry)
+            if i < len(entries) and entries[i] == entry:
+                del entries[i]
+
+    @staticmethod
+    def _entries(summary: dict):
+        for sort in SORT_FIELDS:
+            entry = (summary[sort], summary["id"])
+            yield (sort, None, None), entry
+            for field in FILTER_FIELDS:
+                yield (sort, field, summary[field]), entry
+
+    def query(self, query: ScenarioQuery) -> tuple[list[dict], Cursor | None]:
+        """조건에 맞는 한 페이지와 다음 커서 (마지막 페이지면 None)"""
+        with self._lock:
+            candidates = [self._lists.get((query.sort, None, None), [])]
+            for field in FILTER_FIELDS:
+                value = getattr(query, field)
+                if value:
+                    candidates.append(self._lists.get((query.sort, field, value), []))
+            entries = min(candidates, key=len)  # 가장 작은 후보 리스트만 순회
+
+            lo, hi = 0, len(entries)
+            if query.sort == "created_at":
+                if query.created_from:
+                    lo = bisect.bisect_left(entries, (query.created_from, ""))
+                if query.created_to:
+                    hi = bisect.bisect_left(entries, (query.created_to, ""))
+            if query.cursor is not None:
+                if query.descending:
+                    hi = min(hi, bisect.bisect_left(entries, query.cursor))
+                else:
+                    lo = max(lo, bisect.bisect_right(entries, query.cursor))
+
+            positions = range(hi - 1, lo - 1, -1) if query.descending else range(lo, hi)
+            page: list[dict] = []
+            has_more = False
+            for i in positions:
+                summary = self._summaries[entries[i][1]]
+                if not query.matches(summary):
+                    continue
+                if len(page) == query.limit:
+                    has_more = True
+                    break
+                page.append(summary)
+
+        next_cursor = (page[-1][query.sort], page[-1]["id"]) if has_more else None
+        return page, next_cursor
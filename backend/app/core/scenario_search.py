@@ -0,0 +1,158 @@
+"""시나리오 전문 검색 (인메모리 역색인)
+
+검색 대상: 제목, 설명, 노드 본문, 선택지 본문, 위험 선택 피드백.
+한국어는 형태소 분석 없이도 조사/어미 변화에 강하도록 문자 bigram으로 색인한다.
+(한 글자 단어는 unigram으로 함께 색인)
+
+질의의 각 단어는 그 단어의 모든 gram을 포함하는 문서에만 일치하며(AND),
+점수는 필드 가중치를 반영한 gram 빈도 × idf의 합이다.
+"""
+import heapq
+import math
+import re
+import threading
+import unicodedata
+from collections import Counter
+
+from app.models.scenario import ScenarioTree
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+# 필드별 가중치 (제목 일치를 가장 높게)
+FIELD_WEIGHTS = {
+    "title": 3.0,
+    "description": 2.0,
+    "node": 1.0,
+    "choice": 1.0,
+    "danger_feedback": 1.0,
+}
+
+
+def _words(text: str) -> list[str]:
+    return _WORD_PATTERN.findall(unicodedata.normalize("NFKC", text).casefold())
+
+
+def _grams(word: str) -> list[str]:
+    """단어 → 문자 bigram (한 글자 단어는 unigram)"""
+    if len(word) == 1:
+        return [word]
+    return [word[i:i + 2] for i in range(len(word) - 1)]
+
+
+def tokenize(text: str) -> list[str]:
+    """텍스트 → 색인 토큰 (bigram + 모든 글자의 unigram)"""
+    tokens: list[str] = []
+    for word in _words(text):
+        tokens.extend(_grams(word))
+        if len(word) > 1:
+            tokens.extend(word)
+    return tokens
+
+
+def _scenario_fields(scenario: ScenarioTree):
+    """(필드 이름, 텍스트) 순회"""
+    yield "title", scenario.title
+    yield "description", scenario.description
+    for node in scenario.nodes.values():
+        yield "node", node.text
+        for choice in node.choices:
+            yield "choice", choice.text
+            feedback = choice.danger_feedback
+            if feedback:
+                yield "danger_feedback", " ".join(
+                    [feedback.why_dangerous, feedback.safe_alternative, *feedback.warning_signs]
+                )
+
+
+class ScenarioSearchIndex:
+    """시나리오 단위 역색인 (gram → {시나리오 ID: 가중 빈도})
+
+    add/remove는 해당 시나리오의 posting만 갱신하므로 저장 시 증분 반영된다.
+    검색은 가장 짧은 posting부터 교집합을 구하므로 말뭉치 크기보다 질의 gram의 희소도에 비례한다.
+    """
+
+    def __init__(self):
+        self._postings: dict[str, dict[str, float]] = {}
+        self._doc_grams: dict[str, set[str]] = {}
+        self._summaries: dict[str, dict] = {}
+        self._versions: dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._doc_grams)
+
+    def ids(self) -> set[str]:
+        with self._lock:
+            return set(self._doc_grams)
+
+    def version(self, scenario_id: str):
+        """색인 시점의 저장소 변경 감지 토큰 (없으면 None)"""
+        return self._versions.get(scenario_id)
+
+    def add(self, scenario: ScenarioTree, summary: dict, version=None) -> None:
+        """시나리오 색인 (기존 항목은 교체)"""
+        weighted: Counter[str] = Counter()
+        for field, text in _scenario_fields(scenario):
+            weight = FIELD_WEIGHTS[field]
+            for token in tokenize(text):
+                weighted[token] += weight
+
+        with self._lock:
+            self._remove(scenario.id)
+            for token, weight in weighted.items():
+                self._postings.setdefault(token, {})[scenario.id] = weight
+            self._doc_grams[scenario.id] = set(weighted)
+            self._summaries[scenario.id] = summary
+            self._versions[scenario.id] = version
+
+    def remove(self, scenario_id: str) -> None:
+        with self._lock:
+            self._remove(scenario_id)
+
+    def _remove(self, scenario_id: str):
+        """lock 내부에서 호출"""
+        for token in self._doc_grams.pop(scenario_id, ()):
+            posting = self._postings.get(token)
+            if posting is not None:
+                posting.pop(scenario_id, None)
+                if not posting:
+                    del self._postings[token]
+        self._summaries.pop(scenario_id, None)
+        self._versions.pop(scenario_id, None)
+
+    def search(self, query: str, limit: int = 20) -> list[dict]:
+        """질의의 모든 단어를 포함하는 시나리오 요약 (점수 내림차순)"""
+        words = _words(query)
+        if not words:
+            return []
+
+        with self._lock:
+            total = len(self._doc_grams) or 1
+            scores: dict[str, float] | None = None
+            for word in words:
+                postings = [self._postings.get(gram, {}) for gram in set(_grams(word))]
+                postings.sort(key=len)
+                docs = set(postings[0])
+                for posting in postings[1:]:
+                    if not docs:
+                        break
+                    docs.intersection_update(posting)
+                if scores is not None:
+                    docs.intersection_update(scores)
+                if not docs:
+                    return []
+
+                word_scores = dict.fromkeys(docs, 0.0)
+                for posting in postings:
+                    idf = math.log(1 + total / len(posting))
+                    for doc in docs:
+                        word_scores[doc] += posting[doc] * idf
+                scores = word_scores if scores is None else {
+                    doc: scores[doc] + word_scores[doc] for doc in docs
+                }
+
+            ranked = heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], item[0]))
+            return [
+                {**self._summaries[doc], "score": round(score, 3)}
+                for doc, score in ranked
+            ]
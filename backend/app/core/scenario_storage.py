@@ -0,0 +1,654 @@
+"""시나리오 저장소 (JSON 파일 / SQLite)
+
+`_load_scenario` / `_save_scenario` 뒤에서 동작하는 교체 가능한 저장소.
+- JsonFileStorage: 시나리오당 JSON 파일 (기존 방식, 디렉토리별 요약 인덱스 사용)
+- SqliteScenarioStorage: scenarios / nodes / choices 정규화 테이블
+
+마이그레이션: python -m app.core.scenario_storage migrate [DB 경로]
+"""
+import json
+import logging
+import re
+import sqlite3
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from app.models.scenario import ScenarioTree, ScenarioNode
+from app.core import json_codec
+from app.core.scenario_index import ScenarioIndex, SUMMARY_FIELDS
+from app.core.scenario_query import ScenarioQuery, SummaryIndex, Cursor, to_utc_iso
+
+logger = logging.getLogger("core.scenario_storage")
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+SEED_SCENARIOS_DIR = DATA_DIR / "seed_scenarios"
+SCENARIOS_DIR = DATA_DIR / "scenarios"
+DEFAULT_DB_PATH = DATA_DIR / "scenarios.db"
+
+# 파일명으로 사용 가능한 시나리오 ID (경로 탈출 및 _index 등 내부 파일 차단)
+_SCENARIO_ID_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_\-]{0,127}$")
+
+# 저장소별 변경 감지 토큰. 값이 바뀌면 캐시된 트리를 무효화한다.
+Version = tuple
+
+
+def scenario_summary(scenario: ScenarioTree) -> dict:
+    """목록 API용 요약 (인덱스 항목과 동일한 형식)"""
+    summary = {field: getattr(scenario, field) for field in SUMMARY_FIELDS}
+    summary["created_at"] = to_utc_iso(scenario.created_at)
+    return summary
+
+
+class ScenarioStorage:
+    """시나리오 저장소 인터페이스"""
+
+    def refresh(self) -> bool:
+        """외부 변경 사항을 요약 목록에 반영. 변경이 있었으면 True."""
+        return False
+
+    def summaries(self) -> list[dict]:
+        """목록용 요약 (트리 파싱 없음)"""
+        raise NotImplementedError
+
+    def query(self, query: ScenarioQuery) -> tuple[list[dict], Cursor | None]:
+        """필터/정렬된 요약 한 페이지와 다음 커서 (인덱스 기반)"""
+        raise NotImplementedError
+
+    def version(self, scenario_id: str) -> tuple[Version, int] | None:
+        """(변경 감지 토큰, 대략적 바이트 수). 없으면 None."""
+        raise NotImplementedError
+
+    def writable_version(self, scenario_id: str) -> tuple[Version, int] | None:
+        """수정 가능한 시나리오의 version (읽기 전용 시드는 None)"""
+        return self.version(scenario_id)
+
+    def load(self, scenario_id: str) -> ScenarioTree | None:
+        raise NotImplementedError
+
+    def load_writable(self, scenario_id: str) -> ScenarioTree | None:
+        """수정 가능한 시나리오만 로드 (읽기 전용 시드는 None)"""
+        return self.load(scenario_id)
+
+    def save(self, scenario: ScenarioTree) -> None:
+        raise NotImplementedError
+
+    def update_nodes(self, scenario_id: str, nodes: list[ScenarioNode]) -> None:
+        """일부 노드만 갱신 (예: 이미지 URL 재생성). 수정 가능한 시나리오가 없으면 KeyError."""
+        raise NotImplementedError
+
+    def delete(self, scenario_id: str) -> bool:
+        raise NotImplementedError
+
+
+class JsonFileStorage(ScenarioStorage):
+    """시나리오당 JSON 파일 저장소
+
+    읽기는 여러 디렉토리(시드 → 생성 순)를 대상으로 하며, 동일 ID는 앞선 디렉토리가 우선한다.
+    쓰기는 마지막 디렉토리(생성 시나리오)에만 한다.
+    pretty=False면 들여쓰기 없이 저장한다 (읽기는 두 형식 모두 허용).
+    """
+
+    def __init__(self, directories: list[Path], pretty: bool = False):
+        self.directories = directories
+        self.pretty = pretty
+        self.write_dir = directories[-1]
+        self.indexes = [ScenarioIndex(d) for d in directories]
+        self._summaries: dict[str, tuple[Path, dict]] = {}
+        self._sorted = SummaryIndex()
+        self._lock = threading.Lock()
+
+    def refresh(self) -> bool:
+        changed = [index.sync() for index in self.indexes]
+        if any(changed) or not self._summaries:
+            self._rebuild_summaries()
+        return any(changed)
+
+    def _rebuild_summaries(self):
+        summaries: dict[str, tuple[Path, dict]] = {}
+        for index in reversed(self.indexes):
+            # 뒤 디렉토리부터 채워서 앞 디렉토리(시드)가 덮어쓰도록 함
+            for file_path, summary in index.items():
+                summaries[summary["id"]] = (file_path, summary)
+        with self._lock:
+            self._summaries = summaries
+            self._sorted.replace_all([summary for _, summary in summaries.values()])
+        logger.debug("요약 재구성: %d개", len(summaries))
+
+    def summaries(self) -> list[dict]:
+        with self._lock:
+            return [summary for _, summary in self._summaries.values()]
+
+    def apply_file_event(self, file_path: Path) -> set[str]:
+        """파일 하나의 추가/수정/삭제를 인덱스와 요약에 반영 (디렉토리 스캔 없음)
+
+        Returns:
+            영향받은 시나리오 ID (캐시 무효화 대상)
+        """
+        for index in self.indexes:
+            if index.directory == file_path.parent:
+                change = index.sync_file(file_path)
+                break
+        else:
+            return set()
+        if change is None:
+            return set()
+
+        affected = {summary["id"] for summary in change if summary}
+        for scenario_id in affected:
+            # 우선순위가 가장 높은 디렉토리의 항목을 다시 선택
+            found = None
+            for index in self.indexes:
+                found = index.lookup(scenario_id)
+                if found is not None:
+                    break
+            with self._lock:
+                if found is None:
+                    self._summaries.pop(scenario_id, None)
+                    self._sorted.remove(scenario_id)
+                else:
+                    self._summaries[scenario_id] = found
+                    self._sorted.upsert(found[1])
+        return affected
+
+    def query(self, query: ScenarioQuery) -> tuple[list[dict], Cursor | None]:
+        return self._sorted.query(query)
+
+    def resolve(self, scenario_id: str, writable: bool = False):
+        """ID → (파일 경로, stat). 디렉토리 스캔 없이 `{id}.json` 경로를 직접 확인.
+
+        writable=True면 쓰기 디렉토리에서만 찾는다 (시드 파일은 수정 대상이 아님).
+        """
+        directories = [self.write_dir] if writable else self.directories
+        if _SCENARIO_ID_PATTERN.match(scenario_id):
+            for directory in directories:
+                file_path = directory / f"{scenario_id}.json"
+                try:
+                    return file_path, file_path.stat()
+                except OSError:
+                    continue
+
+        # 파일명이 ID와 다른 경우 (수동 배치 등) 인덱스에서 조회
+        if writable:
+            found = self.indexes[-1].lookup(scenario_id)
+        else:
+            with self._lock:
+                found = self._summaries.get(scenario_id)
+        if found is None:
+            return None
+        try:
+            return found[0], found[0].stat()
+        except OSError:
+            return None
+
+    def version(self, scenario_id: str, writable: bool = False) -> tuple[Version, int] | None:
+        resolved = self.resolve(scenario_id, writable)
+        if resolved is None:
+            return None
+        file_path, stat = resolved
+        return (str(file_path), stat.st_mtime_ns, stat.st_size), stat.st_size
+
+    def writable_version(self, scenario_id: str) -> tuple[Version, int] | None:
+        return self.version(scenario_id, writable=True)
+
+    def load(self, scenario_id: str, writable: bool = False) -> ScenarioTree | None:
+        resolved = self.resolve(scenario_id, writable)
+        if resolved is None:
+            return None
+        try:
+            return self.load_file(resolved[0])
+        except Exception as e:
+            logger.warning("시나리오 파싱 실패: %s (%s)", resolved[0].name, str(e)[:100])
+            return None
+
+    def load_writable(self, scenario_id: str) -> ScenarioTree | None:
+        return self.load(scenario_id, writable=True)
+
+    @staticmethod
+    def load_file(file_path: Path) -> ScenarioTree:
+        """JSON 파일에서 시나리오 로드"""
+        return json_codec.read_model(file_path, ScenarioTree)
+
+    def save(self, scenario: ScenarioTree) -> None:
+        self._write(self.write_dir / f"{scenario.id}.json", scenario)
+
+    def _write(self, file_path: Path, scenario: ScenarioTree):
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        json_codec.write_bytes(file_path, json_codec.dump_model(scenario, pretty=self.pretty))
+
+        summary = scenario_summary(scenario)
+        for index in self.indexes:
+            if index.directory == file_path.parent:
+                index.upsert(file_path, summary)
+        with self._lock:
+            current = self._summaries.get(scenario.id)
+            if current is None or self._rank_of(file_path) <= self._rank_of(current[0]):
+                self._summaries[scenario.id] = (file_path, summary)
+                self._sorted.upsert(summary)
+
+    def update_nodes(self, scenario_id: str, nodes: list[ScenarioNode]) -> None:
+        # 파일 저장소는 부분 갱신이 불가하므로 원래 파일을 한 번에 다시 씀 (시드 파일은 제외)
+        resolved = self.resolve(scenario_id, writable=True)
+        if resolved is None:
+            raise KeyError(scenario_id)
+        file_path = resolved[0]
+        scenario = self.load_file(file_path)
+        for node in nodes:
+            scenario.nodes[node.id] = node
+        self._write(file_path, scenario)
+
+    def delete(self, scenario_id: str) -> bool:
+        file_path = self.write_dir / f"{scenario_id}.json"
+        if not _SCENARIO_ID_PATTERN.match(scenario_id) or not file_path.exists():
+            return False
+        file_path.unlink()
+        for index in self.indexes:
+            index.remove(scenario_id)
+        self._rebuild_summaries()
+        return True
+
+    def _rank_of(self, file_path: Path) -> int:
+        for rank, directory in enumerate(self.directories):
+            if file_path.parent == directory:
+                return rank
+        return len(self.directories)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scenarios (
+    id            TEXT PRIMARY KEY,
+    title         TEXT NOT NULL,
+    description   TEXT NOT NULL,
+    phishing_type TEXT NOT NULL,
+    difficulty    TEXT NOT NULL,
+    root_node_id  TEXT NOT NULL,
+    protagonist   TEXT,
+    prologue      TEXT,
+    created_at    TEXT NOT NULL,
+    metadata      TEXT NOT NULL DEFAULT '{}',
+    revision      INTEGER NOT NULL DEFAULT 1,
+    size_bytes    INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_scenarios_phishing_type ON scenarios(phishing_type);
+CREATE INDEX IF NOT EXISTS idx_scenarios_difficulty ON scenarios(difficulty);
+CREATE INDEX IF NOT EXISTS idx_scenarios_created_at ON scenarios(created_at);
+CREATE INDEX IF NOT EXISTS idx_scenarios_title ON scenarios(title, id);
+CREATE INDEX IF NOT EXISTS idx_scenarios_type_created ON scenarios(phishing_type, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_scenarios_difficulty_created ON scenarios(difficulty, created_at, id);
+
+CREATE TABLE IF NOT EXISTS nodes (
+    scenario_id         TEXT NOT NULL REFERENCES scenarios(id) ON DELETE CASCADE,
+    id                  TEXT NOT NULL,
+    position            INTEGER NOT NULL,
+    type                TEXT NOT NULL,
+    text                TEXT NOT NULL,
+    educational_content TEXT,
+    image_url           TEXT,
+    image_prompt        TEXT,
+    depth               INTEGER NOT NULL DEFAULT 0,
+    parent_node_id      TEXT,
+    parent_choice_id    TEXT,
+    resources           TEXT,
+    PRIMARY KEY (scenario_id, id)
+);
+
+CREATE TABLE IF NOT EXISTS choices (
+    scenario_id     TEXT NOT NULL,
+    node_id         TEXT NOT NULL,
+    position        INTEGER NOT NULL,
+    id              TEXT NOT NULL,
+    text            TEXT NOT NULL,
+    next_node_id    TEXT,
+    is_dangerous    INTEGER NOT NULL DEFAULT 0,
+    resource_effect TEXT NOT NULL,
+    danger_feedback TEXT,
+    PRIMARY KEY (scenario_id, node_id, position),
+    FOREIGN KEY (scenario_id, node_id) REFERENCES nodes(scenario_id, id) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS idx_choices_next_node ON choices(scenario_id, next_node_id);
+"""
+
+
+def _dumps(value) -> str | None:
+    return None if value is None else json.dumps(value, ensure_ascii=False)
+
+
+def _loads(value: str | None):
+    return None if value is None else json.loads(value)
+
+
+class SqliteScenarioStorage(ScenarioStorage):
+    """SQLite 정규화 저장소 (scenarios / nodes / choices)"""
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA foreign_keys=ON")
+            self._conn.executescript(_SCHEMA)
+            self._migrate()
+
+    def _migrate(self):
+        """이전 스키마 DB에 추가된 컬럼 반영 (lock/트랜잭션 내부에서 호출)"""
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(nodes)")}
+        if "resources" not in columns:
+            self._conn.execute("ALTER TABLE nodes ADD COLUMN resources TEXT")
+        # created_at은 UTC로 저장 (필터/커서가 문자열로 비교하므로 이전에 저장된 오프셋 값을 정규화)
+        rows = self._conn.execute(
+            "SELECT id, created_at FROM scenarios WHERE created_at NOT LIKE '%+00:00'"
+        ).fetchall()
+        for row in rows:
+            try:
+                created_at = to_utc_iso(datetime.fromisoformat(row["created_at"]))
+            except ValueError:
+                continue
+            self._conn.execute("UPDATE scenarios SET created_at = ? WHERE id = ?", (created_at, row["id"]))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def summaries(
+        self,
+        phishing_type: str | None = None,
+        difficulty: str | None = None,
+    ) -> list[dict]:
+        clauses, params = [], []
+        if phishing_type:
+            clauses.append("phishing_type = ?")
+            params.append(phishing_type)
+        if difficulty:
+            clauses.append("difficulty = ?")
+            params.append(difficulty)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(SUMMARY_FIELDS)} FROM scenarios {where}", params
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def query(self, query: ScenarioQuery) -> tuple[list[dict], Cursor | None]:
+        # 정렬 컬럼은 SORT_FIELDS 화이트리스트 값만 사용
+        column = "title" if query.sort == "title" else "created_at"
+        clauses, params = [], []
+        for field in ("phishing_type", "difficulty"):
+            value = getattr(query, field)
+            if value:
+                clauses.append(f"{field} = ?")
+                params.append(value)
+        if query.created_from:
+            clauses.append("created_at >= ?")
+            params.append(query.created_from)
+        if query.created_to:
+            clauses.append("created_at < ?")
+            params.append(query.created_to)
+        if query.cursor is not None:
+            # keyset 페이지네이션: (정렬 키, id) 튜플 비교
+            clauses.append(f"({column}, id) {'<' if query.descending else '>'} (?, ?)")
+            params.extend(query.cursor)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        direction = "DESC" if query.descending else "ASC"
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(SUMMARY_FIELDS)} FROM scenarios {where} "
+                f"ORDER BY {column} {direction}, id {direction} LIMIT ?",
+                [*params, query.limit + 1],
+            ).fetchall()
+        page = [dict(row) for row in rows[:query.limit]]
+        if len(rows) <= query.limit:
+            return page, None
+        return page, (page[-1][column], page[-1]["id"])
+
+    def version(self, scenario_id: str) -> tuple[Version, int] | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT revision, size_bytes FROM scenarios WHERE id = ?", (scenario_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return (row["revision"],), row["size_bytes"]
+
+    def load(self, scenario_id: str) -> ScenarioTree | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM scenarios WHERE id = ?", (scenario_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            node_rows = self._conn.execute(
+                "SELECT * FROM nodes WHERE scenario_id = ? ORDER BY position", (scenario_id,)
+            ).fetchall()
+            choice_rows = self._conn.execute(
+                "SELECT * FROM choices WHERE scenario_id = ? ORDER BY node_id, position",
+                (scenario_id,),
+            ).fetchall()
+
+        choices_by_node: dict[str, list[dict]] = {}
+        for c in choice_rows:
+            choices_by_node.setdefault(c["node_id"], []).append(self._choice_dict(c))
+
+        return ScenarioTree.model_validate({
+            "id": row["id"],
+            "title": row["title"],
+            "description": row["description"],
+            "phishing_type": row["phishing_type"],
+            "difficulty": row["difficulty"],
+            "root_node_id": row["root_node_id"],
+            "protagonist": _loads(row["protagonist"]),
+            "prologue": row["prologue"],
+            "created_at": row["created_at"],
+            "metadata": _loads(row["metadata"]),
+            "nodes": {
+                n["id"]: self._node_dict(n, choices_by_node.get(n["id"], []))
+                for n in node_rows
+            },
+        })
+
+    def load_node(self, scenario_id: str, node_id: str) -> ScenarioNode | None:
+        """노드 하나만 조회 (기본 키 인덱스 사용)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM nodes WHERE scenario_id = ? AND id = ?", (scenario_id, node_id)
+            ).fetchone()
+            if row is None:
+                return None
+            choice_rows = self._conn.execute(
+                "SELECT * FROM choices WHERE scenario_id = ? AND node_id = ? ORDER BY position",
+                (scenario_id, node_id),
+            ).fetchall()
+        return ScenarioNode.model_validate(
+            self._node_dict(row, [self._choice_dict(c) for c in choice_rows])
+        )
+
+    @staticmethod
+    def _node_dict(row: sqlite3.Row, choices: list[dict]) -> dict:
+        return {
+            "id": row["id"],
+            "type": row["type"],
+            "text": row["text"],
+            "choices": choices,
+            "educational_content": _loads(row["educational_content"]),
+            "image_url": row["image_url"],
+            "image_prompt": row["image_prompt"],
+            "depth": row["depth"],
+            "parent_node_id": row["parent_node_id"],
+            "parent_choice_id": row["parent_choice_id"],
+            "resources": _loads(row["resources"]),
+        }
+
+    @staticmethod
+    def _choice_dict(row: sqlite3.Row) -> dict:
+        return {
+            "id": row["id"],
+            "text": row["text"],
+            "next_node_id": row["next_node_id"],
+            "is_dangerous": bool(row["is_dangerous"]),
+            "resource_effect": _loads(row["resource_effect"]),
+            "danger_feedback": _loads(row["danger_feedback"]),
+        }
+
+    def save(self, scenario: ScenarioTree) -> None:
+        data = scenario.model_dump(mode="json")
+        size_bytes = len(scenario.model_dump_json())
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO scenarios (
+                    id, title, description, phishing_type, difficulty, root_node_id,
+                    protagonist, prologue, created_at, metadata, revision, size_bytes
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    title = excluded.title,
+                    description = excluded.description,
+                    phishing_type = excluded.phishing_type,
+                    difficulty = excluded.difficulty,
+                    root_node_id = excluded.root_node_id,
+                    protagonist = excluded.protagonist,
+                    prologue = excluded.prologue,
+                    created_at = excluded.created_at,
+                    metadata = excluded.metadata,
+                    revision = scenarios.revision + 1,
+                    size_bytes = excluded.size_bytes
+                """,
+                (
+                    scenario.id, scenario.title, scenario.description,
+                    scenario.phishing_type, scenario.difficulty, scenario.root_node_id,
+                    _dumps(data["protagonist"]), scenario.prologue,
+                    to_utc_iso(scenario.created_at), _dumps(data["metadata"]), size_bytes,
+                ),
+            )
+            self._conn.execute("DELETE FROM nodes WHERE scenario_id = ?", (scenario.id,))
+            for position, node in enumerate(data["nodes"].values()):
+                self._insert_node(scenario.id, position, node)
+
+    def _insert_node(self, scenario_id: str, position: int, node: dict):
+        """노드 + 선택지 삽입 (lock/트랜잭션 내부에서 호출)"""
+        self._conn.execute(
+            """
+            INSERT INTO nodes (
+                scenario_id, id, position, type, text, educational_content,
+                image_url, image_prompt, depth, parent_node_id, parent_choice_id, resources
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                scenario_id, node["id"], position, node["type"], node["text"],
+                _dumps(node["educational_content"]), node["image_url"], node["image_prompt"],
+                node["depth"], node["parent_node_id"], node["parent_choice_id"],
+                _dumps(node["resources"]),
+            ),
+        )
+        self._conn.executemany(
+            """
+            INSERT INTO choices (
+                scenario_id, node_id, position, id, text, next_node_id,
+                is_dangerous, resource_effect, danger_feedback
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    scenario_id, node["id"], i, c["id"], c["text"], c["next_node_id"],
+                    int(c["is_dangerous"]), _dumps(c["resource_effect"]), _dumps(c["danger_feedback"]),
+                )
+                for i, c in enumerate(node["choices"])
+            ],
+        )
+
+    def update_nodes(self, scenario_id: str, nodes: list[ScenarioNode]) -> None:
+        with self._lock, self._conn:
+            exists = self._conn.execute(
+                "SELECT 1 FROM scenarios WHERE id = ?", (scenario_id,)
+            ).fetchone()
+            if not exists:
+                raise KeyError(scenario_id)
+            for node in nodes:
+                row = self._conn.execute(
+                    "SELECT position FROM nodes WHERE scenario_id = ? AND id = ?",
+                    (scenario_id, node.id),
+                ).fetchone()
+                if row is not None:
+                    position = row["position"]
+                else:
+                    position = self._conn.execute(
+                        "SELECT COALESCE(MAX(position) + 1, 0) FROM nodes WHERE scenario_id = ?",
+                        (scenario_id,),
+                    ).fetchone()[0]
+                self._conn.execute(
+                    "DELETE FROM nodes WHERE scenario_id = ? AND id = ?", (scenario_id, node.id)
+                )
+                self._insert_node(scenario_id, position, node.model_dump(mode="json"))
+            self._conn.execute(
+                "UPDATE scenarios SET revision = revision + 1 WHERE id = ?", (scenario_id,)
+            )
+
+    def delete(self, scenario_id: str) -> bool:
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM scenarios WHERE id = ?", (scenario_id,))
+        return cursor.rowcount > 0
+
+
+def create_storage(
+    backend: str,
+    directories: list[Path] | None = None,
+    db_path: Path | None = None,
+    pretty: bool = False,
+) -> ScenarioStorage:
+    """설정값(scenario_storage)에 따른 저장소 생성"""
+    if backend == "sqlite":
+        return SqliteScenarioStorage(db_path or DEFAULT_DB_PATH)
+    if backend == "json":
+        return JsonFileStorage(directories or [SEED_SCENARIOS_DIR, SCENARIOS_DIR], pretty=pretty)
+    raise ValueError(f"Unknown scenario storage backend: {backend}")
+
+
+def migrate_json_to_sqlite(directories: list[Path], db_path: Path) -> int:
+    """JSON 시나리오 파일을 SQLite로 일괄 이전. 이전한 시나리오 수 반환.
+
+    동일 ID는 앞선 디렉토리(시드)가 우선한다.
+    """
+    storage = SqliteScenarioStorage(db_path)
+    migrated: set[str] = set()
+    try:
+        for directory in directories:
+            if not directory.exists():
+                continue
+            for file_path in sorted(directory.glob("*.json")):
+                if file_path.name.startswith("_"):
+                    continue
+                try:
+                    scenario = JsonFileStorage.load_file(file_path)
+                except Exception as e:
+                    logger.warning("이전 건너뜀: %s (%s)", file_path.name, str(e)[:100])
+                    continue
+                if scenario.id in migrated:
+                    continue
+                storage.save(scenario)
+                migrated.add(scenario.id)
+    finally:
+        storage.close()
+    return len(migrated)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI: JSON → SQLite 마이그레이션
+
+    python -m app.core.scenario_storage migrate [DB 경로]
+    """
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+    args = list(sys.argv[1:] if argv is None else argv)
+    if not args or args[0] != "migrate":
+        print(main.__doc__)
+        return 1
+
+    db_path = Path(args[1]) if len(args) > 1 else DEFAULT_DB_PATH
+    count = migrate_json_to_sqlite([SEED_SCENARIOS_DIR, SCENARIOS_DIR], db_path)
+    print(f"{db_path}: {count}개 시나리오 이전 완료")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
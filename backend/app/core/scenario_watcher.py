@@ -0,0 +1,122 @@
+"""시나리오 디렉토리 감시 (data/seed_scenarios, data/scenarios)
+
+백그라운드 생성, scripts/generate-scenario.sh, 수동 파일 추가/삭제 등
+API 프로세스 밖에서 일어난 변경을 카탈로그와 요약 인덱스에 밀어 넣는다.
+감시가 켜져 있으면 목록 요청 경로에서 디렉토리를 재스캔하지 않는다.
+
+- inotify: watchfiles(uvicorn[standard] 의존성)로 파일 단위 이벤트 처리
+- poll: refresh_interval 간격으로 백그라운드에서 인덱스 동기화
+"""
+import asyncio
+import logging
+from pathlib import Path
+
+from app.core.atomic_io import run_io
+from app.core.scenario_catalog import ScenarioCatalog
+from app.core.scenario_index import is_scenario_file
+from app.core.scenario_storage import JsonFileStorage
+
+try:
+    import watchfiles
+except ImportError:  # watchfiles 미설치 시 polling만 사용
+    watchfiles = None
+
+logger = logging.getLogger("core.scenario_watcher")
+
+WATCH_MODES = ("auto", "inotify", "poll", "off")
+
+
+class ScenarioWatcher:
+    """시나리오 디렉토리 변경을 카탈로그에 반영하는 백그라운드 작업"""
+
+    def __init__(
+        self,
+        storage: JsonFileStorage,
+        catalog: ScenarioCatalog,
+        mode: str = "auto",
+        poll_interval: float = 2.0,
+    ):
+        if mode not in WATCH_MODES:
+            raise ValueError(f"Unknown scenario watch mode: {mode}")
+        if mode == "auto":
+            mode = "inotify" if watchfiles else "poll"
+        elif mode == "inotify" and watchfiles is None:
+            logger.warning("watchfiles 미설치: polling으로 대체")
+            mode = "poll"
+        self.storage = storage
+        self.catalog = catalog
+        self.mode = mode
+        self.poll_interval = poll_interval
+        self.events = 0
+        self._stop = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        """초기 동기화 후 감시 시작 (요청 경로 대신 시작 시점에 한 번만 스캔)"""
+        for directory in self.storage.directories:
+            directory.mkdir(parents=True, exist_ok=True)
+        await run_io(self.catalog.refresh, True)
+        self.catalog.watched = True
+        self._stop.clear()
+        runner = self._watch_inotify if self.mode == "inotify" else self._watch_poll
+        self._task = asyncio.create_task(runner())
+        logger.info("시나리오 감시 시작: mode=%s", self.mode)
+
+    async def stop(self) -> None:
+        self._stop.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+        self.catalog.watched = False
+
+    async def _watch_inotify(self):
+        try:
+            async for changes in watchfiles.awatch(
+                *self.storage.directories,
+                watch_filter=lambda _, path: is_scenario_file(Path(path)),
+                stop_event=self._stop,
+                recursive=False,
+            ):
+                paths = {Path(path) for _, path in changes}
+                await run_io(self.apply, paths)
+        except Exception as e:
+            # inotify 한도 초과 등: polling으로 계속 감시
+            logger.warning("파일 감시 실패, polling으로 전환: %s", e)
+            self.mode = "poll"
+            await self._watch_poll()
+
+    async def _watch_poll(self):
+        while not self._stop.is_set():
+            try:
+                await asyncio.wait_for(self._stop.wait(), timeout=self.poll_interval)
+                return
+            except asyncio.TimeoutError:
+                pass
+            try:
+                if await run_io(self.catalog.refresh, True):
+                    await run_io(self.catalog.sync_search)
+            except Exception as e:
+                logger.warning("시나리오 polling 실패: %s", e)
+
+    def apply(self, paths: set[Path]) -> set[str]:
+        """변경된 파일들을 인덱스/요약에 반영하고 캐시된 트리 무효화 + 검색 색인 갱신"""
+        affected: set[str] = set()
+        for path in paths:
+            affected |= self.storage.apply_file_event(path)
+        self.catalog.reindex(affected)
+        self.events += len(paths)
+        if affected:
+            logger.info("시나리오 변경 반영: %s", ", ".join(sorted(affected)))
+        return affected
+
+
+def create_watcher(
+    mode: str,
+    storage,
+    catalog: ScenarioCatalog,
+    poll_interval: float = 2.0,
+) -> ScenarioWatcher | None:
+    """설정값(scenario_watch)에 따른 감시자 생성. 파일 저장소가 아니거나 off면 None."""
+    if mode == "off" or not isinstance(storage, JsonFileStorage):
+        return None
+    return ScenarioWatcher(storage, catalog, mode=mode, poll_interval=poll_interval)
@@ -1,14 +1,20 @@
 """FastAPI 애플리케이션 엔트리포인트"""
+import asyncio
 import logging
+from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, Request
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
 from app.config import settings
-from app.api.deps import limiter
+from app.api.deps import limiter, require_metrics_access
 from app.api.routes import scenario, crawler, images, auth
+from app.core import llm, metrics
+from app.core.atomic_io import run_io
+from app.core.scenario_watcher import create_watcher
 
 # 로깅 설정
 logging.basicConfig(
@@ -23,10 +29,33 @@ _docs_kwargs = {}
 if settings.is_production:
     _docs_kwargs = {"docs_url": None, "redoc_url": None, "openapi_url": None}
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """시작 시 시나리오 디렉토리 감시 + 검색 색인 구축, 종료 시 정지"""
+    watcher = create_watcher(
+        settings.scenario_watch,
+        scenario.scenario_storage,
+        scenario.scenario_catalog,
+        poll_interval=settings.scenario_refresh_interval,
+    )
+    if watcher is not None:
+        await watcher.start()
+    # 초기 검색 색인은 백그라운드에서 구축 (구축 중에도 요청 처리)
+    search_sync = asyncio.create_task(run_io(scenario.scenario_catalog.sync_search))
+    try:
+        yield
+    finally:
+        if watcher is not None:
+            await watcher.stop()
+        await search_sync
+
+
 app = FastAPI(
     title="PhishGuard API",
     description="피싱 예방 교육 게임 시나리오 API",
     version="1.0.0",
+    lifespan=lifespan,
     **_docs_kwargs,
 )
 
@@ -41,6 +70,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "OPTIONS"],
     allow_headers=["Content-Type"],
+    expose_headers=["ETag", "X-Next-Cursor"],
 )
 
 # 라우터 등록
@@ -52,5 +82,21 @@ app.include_router(auth.router, prefix="/api/v1")
 
 @app.get("/health")
 async def health_check():
-    """헬스체크 엔드포인트"""
-    return {"status": "ok"}
+    """헬스체크 엔드포인트 (LLM 회로가 닫혀 있지 않으면 degraded, HTTP 상태는 항상 200)"""
+    circuit = llm.breaker.stats()
+    return {
+        "status": "ok" if circuit["state"] == "closed" else "degraded",
+        "llm": {"circuit": circuit, "concurrency": llm.limiter.stats()},
+    }
+
+
+@app.get(
+    "/metrics", response_class=PlainTextResponse, include_in_schema=False,
+    dependencies=[Depends(require_metrics_access)],
+)
+@limiter.limit("30/minute")
+async def metrics_endpoint(request: Request):
+    """Prometheus 스크레이프용 파이프라인 메트릭 (관리자 또는 METRICS_TOKEN)"""
+    return PlainTextResponse(
+        metrics.registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
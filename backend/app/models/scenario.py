@@ -63,6 +63,7 @@ class ScenarioNode(BaseModel):
     depth: int = 0
     parent_node_id: str | None = None
     parent_choice_id: str | None = None
+    resources: Resources | None = None  # 이 노드 도달 시점의 누적 자원 (생성 시 기록)
 
 
 class ScenarioTree(BaseModel):
@@ -1,17 +1,32 @@
 """컨텍스트 압축 관리 모듈"""
+import asyncio
 import json
 import logging
-import litellm
 
 from app.config import settings
+from app.core import llm, metrics
 from app.models.scenario import ScenarioNode, Choice
-from app.pipeline.prompts import CONTEXT_SUMMARY_PROMPT
+from app.pipeline.prompts import CONTEXT_SUMMARY_PROMPT, ROLLING_SUMMARY_PROMPT
 
 logger = logging.getLogger("pipeline.context_manager")
 
+# 예산 초과 시 요약문 자리로 남겨 두는 토큰 (요약 프롬프트: 3-4문장)
+SUMMARY_TOKEN_RESERVE = 250
 
-async def summarize_nodes(nodes_with_choices: list[tuple[ScenarioNode, Choice | None]]) -> str:
-    """노드 목록을 LLM으로 요약"""
+
+class SummaryUnavailable(Exception):
+    """요약 LLM 호출 실패. fallback은 대신 쓸 첫 문장 요약 (캐시하지 않고 다음 요청에서 다시 시도)"""
+
+    def __init__(self, fallback: str):
+        super().__init__("summary unavailable")
+        self.fallback = fallback
+
+
+async def summarize_nodes(
+    nodes_with_choices: list[tuple[ScenarioNode, Choice | None]],
+    fallback: bool = True,
+) -> str:
+    """노드 목록을 LLM으로 요약 (fallback=False면 실패 시 SummaryUnavailable)"""
     if not nodes_with_choices:
         return ""
 
@@ -23,72 +38,202 @@ async def summarize_nodes(nodes_with_choices: list[tuple[ScenarioNode, Choice |
             text_parts.append(f"[선택] {choice.text}")
 
     full_text = "\n".join(text_parts)
+    messages = [
+        {"role": "system", "content": CONTEXT_SUMMARY_PROMPT},
+        {"role": "user", "content": full_text},
+    ]
+    logger.debug("경로 요약 호출: 노드 %d개, 입력≈%d 토큰", len(nodes_with_choices), estimate_message_tokens(messages))
 
     try:
-        response = await litellm.acompletion(
-            model=settings.llm_model,
-            messages=[
-                {"role": "system", "content": CONTEXT_SUMMARY_PROMPT},
-                {"role": "user", "content": full_text},
-            ],
-            timeout=settings.llm_timeout,
-            api_key=settings.gemini_api_key,
-        )
-        return response.choices[0].message.content.strip()
-    except Exception:
+        return await llm.complete("summary", messages, parse=str.strip)
+    except Exception as e:
+        metrics.record_fallback("summary")
         # 폴백: 첫 문장씩만 추출
-        summaries = []
-        for node, choice in nodes_with_choices:
-            first_sentence = node.text.split(".")[0] + "."
-            summaries.append(first_sentence)
-            if choice:
-                summaries.append(f"→ {choice.text}")
-        return " ".join(summaries)[:500]
+        text = " ".join(_first_sentences(nodes_with_choices))[:500]
+        if fallback:
+            return text
+        raise SummaryUnavailable(text) from e
+
+
+def _first_sentences(nodes_with_choices: list[tuple[ScenarioNode, Choice | None]]) -> list[str]:
+    summaries = []
+    for node, choice in nodes_with_choices:
+        first_sentence = node.text.split(".")[0] + "."
+        summaries.append(first_sentence)
+        if choice:
+            summaries.append(f"→ {choice.text}")
+    return summaries
+
+
+async def summarize_rolling(
+    previous_summary: str,
+    node: ScenarioNode,
+    choice: Choice | None,
+    fallback: bool = True,
+) -> str:
+    """이전 요약 + 새로 밀려난 노드 1개 → 갱신된 요약 (입력 크기가 깊이와 무관)
+
+    fallback=False면 실패 시 SummaryUnavailable
+    """
+    text_parts = [f"[이전 요약]\n{previous_summary}", "", "[새 장면]", f"[상황] {node.text[:200]}"]
+    if choice:
+        text_parts.append(f"[선택] {choice.text}")
+
+    messages = [
+        {"role": "system", "content": ROLLING_SUMMARY_PROMPT},
+        {"role": "user", "content": "\n".join(text_parts)},
+    ]
+    logger.debug("누적 요약 호출: node=%s, 입력≈%d 토큰", node.id, estimate_message_tokens(messages))
+
+    try:
+        return await llm.complete("rolling_summary", messages, parse=str.strip)
+    except Exception as e:
+        metrics.record_fallback("rolling_summary")
+        text = _rolling_fallback(previous_summary, node, choice)
+        if fallback:
+            return text
+        raise SummaryUnavailable(text) from e
+
+
+def _rolling_fallback(previous_summary: str, node: ScenarioNode, choice: Choice | None) -> str:
+    # 폴백: 이전 요약 뒤에 첫 문장을 붙이고 최근 내용 위주로 자름
+    return " ".join([previous_summary, *_first_sentences([(node, choice)])])[-500:]
+
+
+class SummaryCache:
+    """빌드 단위 접두 경로 요약 캐시 (키: 요약 대상 노드 ID 튜플)
+
+    형제 브랜치는 같은 path[:-2]를 공유하므로 같은 요약을 재사용한다.
+    진행 중인 요약이 있으면 같은 Task를 기다려 LLM 호출을 한 번으로 합친다.
+
+    mode="rolling"이면 접두 경로마다(= 경로 마지막 노드마다) 요약을 보관하고,
+    한 단계 긴 접두 경로의 요약은 부모 요약 + 새로 밀려난 노드 1개로 만든다.
+    mode="full"이면 접두 경로 전체를 매번 처음부터 요약한다.
+
+    LLM 호출이 실패하면 폴백 요약을 캐시하지 않고 SummaryUnavailable(폴백 포함)을 올리며,
+    그 키는 비워서 이후 요청(다른 브랜치, 자식 접두 경로)이 다시 시도하게 한다.
+    rolling 모드에서 부모 요약이 실패하면 자식도 폴백 위에 요약을 쌓지 않고 실패로 처리한다.
+    """
+
+    def __init__(self, mode: str = "full"):
+        if mode not in ("rolling", "full"):
+            raise ValueError(f"Unknown context summary mode: {mode}")
+        self.mode = mode
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0  # 진행 중인 호출을 기다린 횟수 (hits에 포함)
+        self._tasks: dict[tuple[str, ...], asyncio.Task] = {}
+
+    async def get(self, nodes_with_choices: list[tuple[ScenarioNode, Choice | None]]) -> str:
+        key = tuple(node.id for node, _ in nodes_with_choices)
+        task = self._tasks.get(key)
+        if task is not None:
+            self.hits += 1
+            if not task.done():
+                self.coalesced += 1
+        else:
+            self.misses += 1
+            task = asyncio.ensure_future(self._summarize(nodes_with_choices))
+            self._tasks[key] = task
+        try:
+            # shield: 기다리던 브랜치가 취소되어도 다른 브랜치가 공유하는 호출은 유지
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # 실패한 호출만 제거 (그 사이 다른 요청이 새로 시작한 재시도는 유지)
+            if self._tasks.get(key) is task:
+                del self._tasks[key]
+            raise
+
+    async def _summarize(self, nodes_with_choices: list[tuple[ScenarioNode, Choice | None]]) -> str:
+        if self.mode == "full" or len(nodes_with_choices) == 1:
+            return await summarize_nodes(nodes_with_choices, fallback=False)
+        # 부모 접두 경로의 요약 (캐시/진행 중 호출 재사용) + 마지막 노드만 반영
+        node, choice = nodes_with_choices[-1]
+        try:
+            previous = await self.get(nodes_with_choices[:-1])
+        except SummaryUnavailable as e:
+            raise SummaryUnavailable(_rolling_fallback(e.fallback, node, choice)) from e
+        return await summarize_rolling(previous, node, choice, fallback=False)
+
+    def stats(self) -> str:
+        total = self.hits + self.misses
+        rate = self.hits / total * 100 if total else 0.0
+        return (
+            f"mode={self.mode}, hit={self.hits} (coalesced={self.coalesced}), "
+            f"miss={self.misses}, hit_rate={rate:.0f}%"
+        )
+
+
+def _segment_text(node: ScenarioNode, choice: Choice | None) -> str:
+    """경로의 노드 1개 → 원문 텍스트 (노드 본문 + 직전 선택)"""
+    if choice:
+        return f'{node.text}\n\n→ 선택: "{choice.text}"'
+    return node.text
+
+
+def _segment_tokens(segment: str) -> int:
+    # 구분자("\n\n") 몫으로 1토큰 추가
+    return estimate_tokens(segment) + 1
 
 
 async def build_story_path(
     path: list[tuple[ScenarioNode, Choice | None]],
     current_depth: int,
-    choice_taken: Choice | None = None
+    choice_taken: Choice | None = None,
+    summary_cache: SummaryCache | None = None,
+    token_budget: int | None = None,
 ) -> str:
-    """경로를 스토리 텍스트로 변환 (Progressive Compression)"""
+    """경로를 스토리 텍스트로 변환 (토큰 예산 기반 Progressive Compression)
+
+    전체 경로가 예산(context_token_budget) 안에 들어가면 요약 호출 없이 원문 그대로 사용한다.
+    넘치면 요약 자리(SUMMARY_TOKEN_RESERVE)를 남기고 최근 노드부터 들어가는 만큼 원문으로 두고,
+    나머지 초기 경로만 요약한다. (직전 노드 1개는 예산과 무관하게 항상 원문)
+    """
     if not path:
         return ""
 
-    if current_depth <= 2:
-        # 깊이 0-2: 전체 텍스트 포함
-        parts = []
-        for node, choice in path:
-            parts.append(node.text)
-            if choice:
-                parts.append(f'→ 선택: "{choice.text}"')
-        result = "\n\n".join(parts)
+    budget = settings.context_token_budget if token_budget is None else token_budget
+    segments = [_segment_text(node, choice) for node, choice in path]
+    tokens = [_segment_tokens(segment) for segment in segments]
+    # 현재 선택을 별도로 추가 (텍스트 중복 방지)
+    suffix = f'\n\n→ 선택: "{choice_taken.text}"' if choice_taken else ""
+    suffix_tokens = estimate_tokens(suffix)
 
+    if sum(tokens) + suffix_tokens <= budget:
+        result = "\n\n".join(segments)
+        summarized = 0
     else:
-        # 깊이 3+: 초기 노드 요약 + 최근 2개 노드 전체
-        early_nodes = path[:-2]
-        recent_nodes = path[-2:]
-
-        summary = await summarize_nodes(early_nodes) if early_nodes else ""
-        logger.debug("컨텍스트 압축: depth=%d, 요약 길이=%d", current_depth, len(summary))
-
-        recent_parts = []
-        for node, choice in recent_nodes:
-            recent_parts.append(node.text)
-            if choice:
-                recent_parts.append(f'→ 선택: "{choice.text}"')
-
-        recent_text = "\n\n".join(recent_parts)
+        available = budget - SUMMARY_TOKEN_RESERVE - suffix_tokens
+        keep = 1
+        used = tokens[-1]
+        while keep < len(path) - 1 and used + tokens[-keep - 1] <= available:
+            keep += 1
+            used += tokens[-keep]
+
+        early_nodes = path[:-keep]
+        summarized = len(early_nodes)
+        if summary_cache is not None:
+            try:
+                summary = await summary_cache.get(early_nodes)
+            except SummaryUnavailable as e:
+                # 이번 요청만 폴백 요약 사용 (캐시되지 않으므로 다음 요청은 다시 시도)
+                summary = e.fallback
+        else:
+            summary = await summarize_nodes(early_nodes)
 
+        recent_text = "\n\n".join(segments[-keep:])
         if summary:
             result = f"[이전 경과 요약]\n{summary}\n\n[최근 상황]\n{recent_text}"
         else:
             result = recent_text
 
-    # 현재 선택을 별도로 추가 (텍스트 중복 방지)
-    if choice_taken:
-        result += f'\n\n→ 선택: "{choice_taken.text}"'
-
+    result += suffix
+    logger.debug(
+        "컨텍스트 구성: depth=%d, 원문 %d개 + 요약 %d개, 추정 %d/%d 토큰",
+        current_depth, len(path) - summarized, summarized, estimate_tokens(result), budget,
+    )
     return result
 
 
@@ -96,3 +241,8 @@ def estimate_tokens(text: str) -> int:
     """텍스트 토큰 수 추정 (한국어 기준 대략적)"""
     # 한국어는 대략 1.5-2글자당 1토큰
     return len(text) // 2
+
+
+def estimate_message_tokens(messages: list[dict]) -> int:
+    """LLM 호출 메시지 전체의 입력 토큰 추정 (호출별 로그용)"""
+    return sum(estimate_tokens(message["content"]) for message in messages)
@@ -1,9 +1,9 @@
 """교육 콘텐츠 생성 모듈"""
 import json
 import logging
-import litellm
 
 from app.config import settings
+from app.core import llm, metrics
 
 logger = logging.getLogger("pipeline.enrichment")
 from app.models.scenario import EducationalContent
@@ -20,27 +20,24 @@ async def enrich_node_with_education(
 
     for attempt in range(settings.retry_count + 1):
         try:
-            response = await litellm.acompletion(
-                model=settings.llm_model,
-                messages=[
+            result = await llm.complete(
+                "education",
+                [
                     {"role": "system", "content": EDUCATIONAL_SYSTEM_PROMPT},
                     {"role": "user", "content": user_prompt},
                 ],
                 response_format={"type": "json_object"},
-                timeout=settings.llm_timeout,
-                api_key=settings.gemini_api_key,
+                parse=lambda content: EducationalContent.model_validate(json.loads(content)),
             )
-
-            content = response.choices[0].message.content
-            data = json.loads(content)
-            result = EducationalContent.model_validate(data)
             logger.info("교육 콘텐츠 생성 성공: %s", result.title)
             return result
 
         except Exception as e:
-            if attempt == settings.retry_count:
+            # 회로 차단 중이면 재시도/백오프 없이 바로 폴백
+            if attempt == settings.retry_count or isinstance(e, llm.CircuitOpenError):
                 # 폴백: 기본 교육 콘텐츠
                 logger.warning("교육 콘텐츠 생성 실패, 폴백 사용: %s", str(e)[:100])
+                metrics.record_fallback("education")
                 return EducationalContent(
                     title="주의하세요",
                     explanation=f"이것은 {phishing_type}의 전형적인 수법입니다. 항상 의심하고 확인하세요.",
@@ -53,5 +50,6 @@ async def enrich_node_with_education(
                         "개인정보나 금전 요구",
                     ],
                 )
+            metrics.record_retry("education")
 
     return None
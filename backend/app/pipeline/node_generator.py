@@ -3,17 +3,19 @@ import json
 import asyncio
 import logging
 from pydantic import BaseModel
-import litellm
 
 from app.config import settings
+from app.core import llm, metrics
 
 logger = logging.getLogger("pipeline.node_generator")
 from app.models.scenario import Resources, ResourceDelta, ScenarioNode, Choice, ProtagonistProfile, DangerFeedback
+from app.pipeline.context_manager import estimate_message_tokens
 from app.pipeline.prompts import (
     ROOT_SYSTEM_PROMPT,
     NODE_SYSTEM_PROMPT,
     build_root_prompt,
     build_node_prompt,
+    build_sibling_prompt,
 )
 
 
@@ -36,6 +38,10 @@ class GenerationResult(BaseModel):
     reasoning: str
 
 
+def _parse_generation(content: str) -> GenerationResult:
+    return GenerationResult.model_validate(json.loads(content))
+
+
 class GenerationContext(BaseModel):
     """노드 생성 컨텍스트"""
     phishing_type: str
@@ -63,30 +69,31 @@ async def generate_root_node(
 ) -> GenerationResult:
     """루트 노드 생성"""
     user_prompt = build_root_prompt(phishing_type, difficulty, seed_info)
+    messages = [
+        {"role": "system", "content": ROOT_SYSTEM_PROMPT},
+        {"role": "user", "content": user_prompt},
+    ]
+    input_tokens = estimate_message_tokens(messages)
 
     for attempt in range(settings.retry_count + 1):
         try:
-            response = await litellm.acompletion(
-                model=settings.llm_model,
-                messages=[
-                    {"role": "system", "content": ROOT_SYSTEM_PROMPT},
-                    {"role": "user", "content": user_prompt},
-                ],
+            result = await llm.complete(
+                "root", messages,
                 response_format={"type": "json_object"},
-                timeout=settings.llm_timeout,
-                api_key=settings.gemini_api_key,
+                parse=_parse_generation,
+            )
+            logger.info(
+                "Root 노드 생성 성공: type=%s, choices=%d, 입력≈%d 토큰",
+                result.node_type, len(result.choices), input_tokens
             )
-
-            content = response.choices[0].message.content
-            data = json.loads(content)
-            result = GenerationResult.model_validate(data)
-            logger.info("Root 노드 생성 성공: type=%s, choices=%d", result.node_type, len(result.choices))
             return result
 
         except Exception as e:
-            if attempt == settings.retry_count:
+            # 회로 차단 중이면 재시도/백오프 없이 바로 폴백
+            if attempt == settings.retry_count or isinstance(e, llm.CircuitOpenError):
                 # 폴백: 기본 루트 노드
                 logger.warning("Root 생성 실패, 폴백 사용: %s", str(e)[:100])
+                metrics.record_fallback("root")
                 return GenerationResult(
                     node_type="narrative",
                     narrative_text=f"당신의 휴대폰에 알 수 없는 번호로 연락이 왔습니다. {phishing_type} 관련 의심스러운 내용입니다.",
@@ -100,6 +107,7 @@ async def generate_root_node(
             # 지수 백오프: 1s, 2s, 4s
             delay = 1 * (2 ** attempt)
             logger.warning("Root 생성 attempt %d 실패, %ds 후 재시도...", attempt + 1, delay)
+            metrics.record_retry("root")
             await asyncio.sleep(delay)
 
 
@@ -118,31 +126,29 @@ async def generate_node(context: GenerationContext) -> GenerationResult:
         ending_type_hint=context.ending_type_hint,
         protagonist=context.protagonist,
     )
+    messages = [
+        {"role": "system", "content": NODE_SYSTEM_PROMPT},
+        {"role": "user", "content": user_prompt},
+    ]
+    input_tokens = estimate_message_tokens(messages)
 
     for attempt in range(settings.retry_count + 1):
         try:
-            response = await litellm.acompletion(
-                model=settings.llm_model,
-                messages=[
-                    {"role": "system", "content": NODE_SYSTEM_PROMPT},
-                    {"role": "user", "content": user_prompt},
-                ],
+            result = await llm.complete(
+                "node", messages,
                 response_format={"type": "json_object"},
-                timeout=settings.llm_timeout,
-                api_key=settings.gemini_api_key,
+                parse=_parse_generation,
             )
-
-            content = response.choices[0].message.content
-            data = json.loads(content)
-            result = GenerationResult.model_validate(data)
             logger.info(
-                "노드 생성 성공: depth=%d, type=%s, choices=%d",
-                context.current_depth, result.node_type, len(result.choices)
+                "노드 생성 성공: depth=%d, type=%s, choices=%d, 입력≈%d 토큰",
+                context.current_depth, result.node_type, len(result.choices), input_tokens
             )
             return result
 
         except Exception as e:
-            if attempt == settings.retry_count:
+            # 회로 차단 중이면 재시도/백오프 없이 바로 폴백
+            if attempt == settings.retry_count or isinstance(e, llm.CircuitOpenError):
+                metrics.record_fallback("node")
                 # 폴백: 강제 종료가 필요하거나 최대 깊이에 도달한 경우에만 엔딩 노드 생성
                 if context.force_end or context.current_depth >= context.max_depth - 1:
                     ending_type = infer_ending_from_hint(context.ending_type_hint)
@@ -192,9 +198,69 @@ async def generate_node(context: GenerationContext) -> GenerationResult:
             # 지수 백오프: 1s, 2s, 4s
             delay = 1 * (2 ** attempt)
             logger.warning("노드 생성 attempt %d 실패 (depth=%d), %ds 후 재시도...", attempt + 1, context.current_depth, delay)
+            metrics.record_retry("node")
             await asyncio.sleep(delay)
 
 
+async def generate_sibling_nodes(contexts: list[GenerationContext]) -> list[GenerationResult | None]:
+    """한 부모의 형제 노드들을 LLM 호출 1회로 생성
+
+    이야기/주인공/시스템 프롬프트를 한 번만 보내고 선택지 키별 노드를 받는다.
+    contexts는 같은 부모의 선택지별 컨텍스트(story_path 공유)이며,
+    검증에 실패했거나 누락된 자식은 None으로 반환한다 (호출부가 선택지별 호출로 대체).
+    """
+    first = contexts[0]
+    keys = [f"choice_{i + 1}" for i in range(len(contexts))]
+    user_prompt = build_sibling_prompt(
+        phishing_type=first.phishing_type,
+        difficulty=first.difficulty,
+        story_path=first.story_path,
+        children=[
+            {
+                "key": key,
+                "choice_taken": context.choice_taken,
+                "current_resources": context.current_resources.model_dump(),
+                "should_end": context.should_end,
+                "force_end": context.force_end,
+                "ending_type_hint": context.ending_type_hint,
+            }
+            for key, context in zip(keys, contexts)
+        ],
+        current_depth=first.current_depth,
+        max_depth=first.max_depth,
+        protagonist=first.protagonist,
+    )
+    messages = [
+        {"role": "system", "content": NODE_SYSTEM_PROMPT},
+        {"role": "user", "content": user_prompt},
+    ]
+
+    try:
+        data = await llm.complete(
+            "siblings", messages,
+            response_format={"type": "json_object"},
+            parse=json.loads,
+        )
+        children = data.get("children", data) if isinstance(data, dict) else {}
+    except Exception as e:
+        logger.warning("형제 노드 일괄 생성 실패 (depth=%d): %s", first.current_depth, str(e)[:100])
+        return [None] * len(contexts)
+
+    results: list[GenerationResult | None] = []
+    for key in keys:
+        try:
+            results.append(GenerationResult.model_validate(children[key]))
+        except Exception as e:
+            logger.warning("형제 노드 검증 실패: %s (%s)", key, str(e)[:100])
+            results.append(None)
+    logger.info(
+        "형제 노드 일괄 생성: depth=%d, 성공 %d/%d, 입력≈%d 토큰",
+        first.current_depth, sum(r is not None for r in results), len(results),
+        estimate_message_tokens(messages),
+    )
+    return results
+
+
 def result_to_node(
     result: GenerationResult,
     node_id: str,
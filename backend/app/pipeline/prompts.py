@@ -99,6 +99,9 @@ EDUCATIONAL_SYSTEM_PROMPT = """당신은 피싱 예방 교육 전문가입니다
 CONTEXT_SUMMARY_PROMPT = """다음 피싱 시나리오 경과를 3-4문장으로 요약하세요.
 핵심 상황과 사용자의 선택만 간결하게 포함하세요."""
 
+ROLLING_SUMMARY_PROMPT = """[이전 요약]에 [새 장면]을 반영하여 피싱 시나리오 경과 요약을 갱신하세요.
+전체 3-4문장을 넘기지 말고, 핵심 상황과 사용자의 선택만 간결하게 포함하세요."""
+
 
 def build_root_prompt(phishing_type: str, difficulty: str, seed_info: str | None = None) -> str:
     """루트 노드 생성용 프롬프트"""
@@ -185,6 +188,76 @@ IMPORTANT:
     return prompt
 
 
+NODE_JSON_FORMAT = """{
+  "node_type": "narrative" | "ending_good" | "ending_bad",
+  "narrative_text": "2인칭 시점 나레이션 (한국어)",
+  "choices": [
+    {
+      "text": "위험한 선택지",
+      "is_dangerous": true,
+      "resource_effect": {"trust": 0, "money": 0, "awareness": 0},
+      "danger_feedback": {
+        "why_dangerous": "왜 위험한지 설명 (2-3문장)",
+        "warning_signs": ["경고 신호 1", "경고 신호 2"],
+        "safe_alternative": "안전한 대안 (1-2문장)"
+      }
+    },
+    {
+      "text": "안전한 선택지",
+      "is_dangerous": false,
+      "resource_effect": {"trust": 0, "money": 0, "awareness": 0}
+    }
+  ],
+  "image_prompt": "상세한 영문 이미지 프롬프트",
+  "reasoning": "이 장면 설계의 근거"
+}
+"""
+
+NODE_JSON_RULES = """
+danger_feedback 규칙 (중요):
+- is_dangerous=true인 선택지만 danger_feedback 필수
+- is_dangerous=false인 선택지는 danger_feedback 생략
+- 엔딩 노드(ending_good/ending_bad)의 choices는 빈 배열 []
+"""
+
+
+def _protagonist_block(protagonist) -> str:
+    """주인공 정보 (모든 이미지에 일관되게 포함)"""
+    if not protagonist:
+        return ""
+    return f"""
+주인공 정보 (모든 이미지에 일관되게 포함):
+- 나이대: {protagonist.age_group}
+- 성별: {protagonist.gender}
+- 설명: {protagonist.description}
+- 외모: {protagonist.appearance}
+
+"""
+
+
+def _node_image_guide(protagonist) -> str:
+    """노드 image_prompt 작성 예시 (주인공 유무별)"""
+    if protagonist:
+        return f"""
+CRITICAL: image_prompt 작성 시 주인공을 반드시 포함하세요:
+- 반드시 \"Korean webtoon style illustration:\" 로 시작
+- 주인공: {protagonist.description}, {protagonist.appearance}
+- 주인공의 외모와 특징을 정확히 유지하면서 다른 장면, 배경, 감정을 묘사
+- 프롬프트 끝에도 스타일 명시: \"Webtoon art style.\"
+
+image_prompt 예시 (주인공 정보 포함):
+- "Korean webtoon style illustration: {protagonist.description}, {protagonist.appearance}, sitting in a modern Korean cafe, staring at phone screen with confused expression, coffee cup on table, afternoon sunlight through window. Webtoon art style, no text, no letters."
+- "Korean webtoon style illustration: {protagonist.description}, {protagonist.appearance}, standing at ATM machine in convenience store at night, sweating nervously, harsh fluorescent lighting, tense atmosphere. Webtoon art style, no text, no letters."
+- "Korean webtoon style illustration: {protagonist.description}, {protagonist.appearance}, in a living room at home, holding smartphone, worried expression, family photos on wall, warm lamp light. Webtoon art style, no text, no letters."
+"""
+    return """
+image_prompt 예시 (이전 장면과 다르게 작성):
+- narrative: "A stressed Korean person hunched over a laptop in a dimly lit home office at midnight, multiple browser tabs open, empty coffee cups on desk, worried expression, blue screen light illuminating face, webtoon style, no text, no letters"
+- ending_good: "A relieved Korean person sitting at a police station, officer in uniform taking notes, bright fluorescent lights, certificates on wall, showing phone screen as evidence, hopeful expression, manhwa style illustration, no text, no letters"
+- ending_bad: "A devastated Korean person sitting alone on a park bench at dusk, head in hands, crumpled bank statement on the ground, autumn leaves falling, empty wallet visible, tears on cheeks, melancholic atmosphere, webtoon style, no text, no letters"
+"""
+
+
 def build_node_prompt(
     phishing_type: str,
     difficulty: str,
@@ -238,70 +311,62 @@ choices는 빈 리스트 []로 작성하세요.
 
 """
 
-    # 주인공 정보 추가
-    if protagonist:
-        prompt += f"""
-주인공 정보 (모든 이미지에 일관되게 포함):
-- 나이대: {protagonist.age_group}
-- 성별: {protagonist.gender}
-- 설명: {protagonist.description}
-- 외모: {protagonist.appearance}
+    prompt += _protagonist_block(protagonist)
+    prompt += "JSON 형식:\n" + NODE_JSON_FORMAT + NODE_JSON_RULES
+    prompt += _node_image_guide(protagonist)
+    prompt += "\nIMPORTANT: image_prompt는 필수. 이전 노드와 중복되지 않는 새로운 장면을 묘사하세요."
+    return prompt
 
-"""
 
-    prompt += """JSON 형식:
-{
-  "node_type": "narrative" | "ending_good" | "ending_bad",
-  "narrative_text": "2인칭 시점 나레이션 (한국어)",
-  "choices": [
-    {
-      "text": "위험한 선택지",
-      "is_dangerous": true,
-      "resource_effect": {"trust": 0, "money": 0, "awareness": 0},
-      "danger_feedback": {
-        "why_dangerous": "왜 위험한지 설명 (2-3문장)",
-        "warning_signs": ["경고 신호 1", "경고 신호 2"],
-        "safe_alternative": "안전한 대안 (1-2문장)"
-      }
-    },
-    {
-      "text": "안전한 선택지",
-      "is_dangerous": false,
-      "resource_effect": {"trust": 0, "money": 0, "awareness": 0}
-    }
-  ],
-  "image_prompt": "상세한 영문 이미지 프롬프트",
-  "reasoning": "이 장면 설계의 근거"
-}
+def _sibling_end_signal(child: dict) -> str:
+    if child["force_end"]:
+        return f"반드시 엔딩으로 작성 (강제, 권장 엔딩 유형: {child['ending_type_hint']}, choices는 [])"
+    if child["should_end"]:
+        return f"엔딩 권장 (선택적, 권장 엔딩 유형: {child['ending_type_hint']})"
+    return "계속 진행 (선택지 3개)"
 
-danger_feedback 규칙 (중요):
-- is_dangerous=true인 선택지만 danger_feedback 필수
-- is_dangerous=false인 선택지는 danger_feedback 생략
-- 엔딩 노드(ending_good/ending_bad)의 choices는 빈 배열 []
-"""
 
-    if protagonist:
-        prompt += f"""
-CRITICAL: image_prompt 작성 시 주인공을 반드시 포함하세요:
-- 반드시 \"Korean webtoon style illustration:\" 로 시작
-- 주인공: {protagonist.description}, {protagonist.appearance}
-- 주인공의 외모와 특징을 정확히 유지하면서 다른 장면, 배경, 감정을 묘사
-- 프롬프트 끝에도 스타일 명시: \"Webtoon art style.\"
+def build_sibling_prompt(
+    phishing_type: str,
+    difficulty: str,
+    story_path: str,
+    children: list[dict],
+    current_depth: int,
+    max_depth: int,
+    protagonist = None
+) -> str:
+    """한 부모의 모든 선택지에 대한 다음 노드를 한 번에 생성하는 프롬프트
+
+    children 항목: key, choice_taken, current_resources, should_end, force_end, ending_type_hint
+    """
+    prompt = f"""피싱 유형: {phishing_type}
+난이도: {difficulty}
+현재 깊이: {current_depth}/{max_depth}
+
+이전 이야기:
+{story_path}
+
+플레이어가 고를 수 있는 선택지 {len(children)}개 각각에 대해, 그 선택의 직접적인 결과로 시작하는 다음 장면을 하나씩 작성하세요.
+각 장면은 서로 다른 분기입니다. 다른 선택지의 결과를 언급하지 말고, 이전 이야기에서 자연스럽게 이어지게 작성하세요.
 
-image_prompt 예시 (주인공 정보 포함):
-- "Korean webtoon style illustration: {protagonist.description}, {protagonist.appearance}, sitting in a modern Korean cafe, staring at phone screen with confused expression, coffee cup on table, afternoon sunlight through window. Webtoon art style, no text, no letters."
-- "Korean webtoon style illustration: {protagonist.description}, {protagonist.appearance}, standing at ATM machine in convenience store at night, sweating nervously, harsh fluorescent lighting, tense atmosphere. Webtoon art style, no text, no letters."
-- "Korean webtoon style illustration: {protagonist.description}, {protagonist.appearance}, in a living room at home, holding smartphone, worried expression, family photos on wall, warm lamp light. Webtoon art style, no text, no letters."
 """
-    else:
-        prompt += """
-image_prompt 예시 (이전 장면과 다르게 작성):
-- narrative: "A stressed Korean person hunched over a laptop in a dimly lit home office at midnight, multiple browser tabs open, empty coffee cups on desk, worried expression, blue screen light illuminating face, webtoon style, no text, no letters"
-- ending_good: "A relieved Korean person sitting at a police station, officer in uniform taking notes, bright fluorescent lights, certificates on wall, showing phone screen as evidence, hopeful expression, manhwa style illustration, no text, no letters"
-- ending_bad: "A devastated Korean person sitting alone on a park bench at dusk, head in hands, crumpled bank statement on the ground, autumn leaves falling, empty wallet visible, tears on cheeks, melancholic atmosphere, webtoon style, no text, no letters"
+    for child in children:
+        resources = child["current_resources"]
+        prompt += f"""[{child['key']}] 플레이어의 선택: "{child['choice_taken']}"
+- 자원 상태: 신뢰도(trust) {resources['trust']}/5, 자산(money) {resources['money']}/5, 경각심(awareness) {resources['awareness']}/5
+- 종료 신호: {_sibling_end_signal(child)}
+
 """
 
-    prompt += "\nIMPORTANT: image_prompt는 필수. 이전 노드와 중복되지 않는 새로운 장면을 묘사하세요."
+    prompt += _protagonist_block(protagonist)
+    keys = ", ".join(f'"{child["key"]}": {{...}}' for child in children)
+    prompt += f"""JSON 형식 (선택지 키마다 노드 하나):
+{{"children": {{{keys}}}}}
+
+각 노드 형식:
+""" + NODE_JSON_FORMAT + NODE_JSON_RULES
+    prompt += _node_image_guide(protagonist)
+    prompt += "\nIMPORTANT: 모든 노드에 image_prompt는 필수. 분기마다 서로 다른 새로운 장면을 묘사하세요."
     return prompt
 
 
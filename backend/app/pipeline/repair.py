@@ -7,15 +7,20 @@ from app.pipeline.validation import ValidationError, ErrorType
 logger = logging.getLogger("pipeline.repair")
 
 
-def repair_tree(tree: ScenarioTree, errors: list[ValidationError]) -> ScenarioTree:
-    """검증 오류 복구"""
+def repair_tree(tree: ScenarioTree, errors: list[ValidationError]) -> set[str]:
+    """검증 오류 복구 (tree를 직접 수정)
+
+    반환: 추가/변경/삭제한 노드 ID 집합 (scan_structure의 재검증 범위)
+    """
     logger.info("복구 시작: %d건의 오류", len(errors))
+    touched: set[str] = set()
     for error in errors:
         if error.error_type == ErrorType.ORPHAN_NODE:
             # 고아 노드 제거
             if error.node_id and error.node_id in tree.nodes:
                 logger.info("고아 노드 제거: %s", error.node_id)
                 del tree.nodes[error.node_id]
+                touched.add(error.node_id)
 
         elif error.error_type == ErrorType.BROKEN_LINK:
             # 끊어진 링크 → 폴백 엔딩 연결
@@ -34,6 +39,7 @@ def repair_tree(tree: ScenarioTree, errors: list[ValidationError]) -> ScenarioTr
                             )
                             tree.nodes[fallback.id] = fallback
                             choice.next_node_id = fallback.id
+                            touched.update((node.id, fallback.id))
                             logger.info("끊어진 링크 복구: %s → %s", choice.id, fallback.id)
 
         elif error.error_type == ErrorType.NO_GOOD_ENDING:
@@ -46,8 +52,9 @@ def repair_tree(tree: ScenarioTree, errors: list[ValidationError]) -> ScenarioTr
                 ending_type="good"
             )
             tree.nodes[fallback.id] = fallback
+            touched.add(fallback.id)
             # 아무 리프 노드에 연결
-            _connect_to_leaf(tree, fallback.id)
+            touched.update(_connect_to_leaf(tree, fallback.id))
 
         elif error.error_type == ErrorType.NO_BAD_ENDING:
             # BAD 엔딩 추가
@@ -59,8 +66,9 @@ def repair_tree(tree: ScenarioTree, errors: list[ValidationError]) -> ScenarioTr
                 ending_type="bad"
             )
             tree.nodes[fallback.id] = fallback
+            touched.add(fallback.id)
             # 아무 리프 노드에 연결
-            _connect_to_leaf(tree, fallback.id)
+            touched.update(_connect_to_leaf(tree, fallback.id))
 
         elif error.error_type == ErrorType.LEAF_NOT_ENDING:
             # 리프 노드를 엔딩으로 변환
@@ -70,9 +78,10 @@ def repair_tree(tree: ScenarioTree, errors: list[ValidationError]) -> ScenarioTr
                     logger.info("리프→엔딩 변환: %s", error.node_id)
                     node.type = "ending_bad"
                     node.choices = []
+                    touched.add(node.id)
 
-    logger.info("복구 완료: 최종 노드=%d", len(tree.nodes))
-    return tree
+    logger.info("복구 완료: 최종 노드=%d, 변경 노드=%d", len(tree.nodes), len(touched))
+    return touched
 
 
 def _create_fallback_ending(
@@ -109,11 +118,12 @@ def _create_fallback_ending(
     )
 
 
-def _connect_to_leaf(tree: ScenarioTree, ending_id: str):
-    """폴백 엔딩을 리프 노드에 연결"""
+def _connect_to_leaf(tree: ScenarioTree, ending_id: str) -> list[str]:
+    """폴백 엔딩을 리프 노드에 연결 (연결한 노드 ID, 연결할 곳이 없으면 빈 목록)"""
     for node in tree.nodes.values():
         if node.type == "narrative" and node.choices:
             for choice in node.choices:
                 if not choice.next_node_id:
                     choice.next_node_id = ending_id
-                    return
+                    return [node.id]
+    return []
@@ -1,7 +1,7 @@
 """시나리오 트리 빌더 (메인 오케스트레이터)"""
 import asyncio
-import json
 import logging
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from uuid import uuid4
@@ -11,27 +11,91 @@ from app.config import settings
 logger = logging.getLogger("pipeline.tree_builder")
 
 SCENARIOS_DIR = Path(__file__).parent.parent / "data" / "scenarios"
-from app.models.scenario import ScenarioTree, ScenarioNode, Choice, Resources
+from app.models.scenario import ScenarioTree, ScenarioNode, Choice, Resources, ResourceDelta
 from app.pipeline.node_generator import (
     generate_root_node,
     generate_node,
+    generate_sibling_nodes,
     result_to_node,
     GenerationContext,
+    GenerationResult,
 )
-from app.pipeline.context_manager import build_story_path
+from app.pipeline.context_manager import build_story_path, SummaryCache
 from app.pipeline.end_sequence import compute_end_signal
 from app.pipeline.enrichment import enrich_node_with_education
-from app.pipeline.validation import validate_structure, ValidationError
+from app.pipeline.validation import scan_structure
 from app.pipeline.repair import repair_tree
-from app.core.image_generator import generate_image
+from app.core.image_generator import generate_image, image_limiter
+from app.core import cassette, json_codec, llm, metrics
+from app.core.atomic_io import CoalescingWriter
+
+# 진행 상황 저장 (시나리오별로 최신 스냅샷만 기록)
+progress_writer = CoalescingWriter()
+
+
+def apply_resource_effect(resources: Resources, effect: ResourceDelta) -> Resources:
+    """자원에 선택지 변동값 적용 (0~5 범위로 제한, 새 객체 반환)"""
+    return Resources(
+        trust=max(0, min(5, resources.trust + effect.trust)),
+        money=max(0, min(5, resources.money + effect.money)),
+        awareness=max(0, min(5, resources.awareness + effect.awareness)),
+    )
+
+
+@dataclass(frozen=True)
+class BranchState:
+    """BFS 프론티어 항목의 경로 상태
+
+    부모 상태를 가리키는 연결 구조라서 자식 상태는 O(1)로 파생된다.
+    (경로를 트리에서 역추적하거나 자원을 루트부터 재계산하지 않음)
+    """
+    node: ScenarioNode
+    choice: Choice | None  # 부모에서 이 노드로 온 선택지
+    resources: Resources  # 이 노드 도달 시점의 누적 자원
+    parent: "BranchState | None" = None
+    recent_choices: tuple[Choice, ...] = ()  # 종료 신호 판단용 최근 선택 (최대 3개)
+
+    @classmethod
+    def root(cls, node: ScenarioNode) -> "BranchState":
+        return cls(node=node, choice=None, resources=node.resources or Resources())
+
+    def child_resources(self, choice: Choice) -> Resources:
+        return apply_resource_effect(self.resources, choice.resource_effect)
+
+    def child_choices(self, choice: Choice) -> tuple[Choice, ...]:
+        return (*self.recent_choices, choice)[-3:]
+
+    def child(self, node: ScenarioNode, choice: Choice) -> "BranchState":
+        return BranchState(
+            node=node,
+            choice=choice,
+            resources=node.resources or self.child_resources(choice),
+            parent=self,
+            recent_choices=self.child_choices(choice),
+        )
+
+    def path(self) -> list[tuple[ScenarioNode, Choice | None]]:
+        """루트부터 이 노드까지 (노드, 그 노드로 온 선택지) 목록"""
+        path = []
+        state = self
+        while state is not None:
+            path.append((state.node, state.choice))
+            state = state.parent
+        path.reverse()
+        return path
+
+    def path_node_ids(self) -> list[str]:
+        return [node.id for node, _ in self.path()]
 
 
 class ScenarioTreeBuilder:
     """Agentic 시나리오 트리 빌더"""
 
     def __init__(self):
-        self.semaphore = asyncio.Semaphore(settings.semaphore_limit)
+        # LLM 호출은 app.core.llm의 프로세스 전역 적응형 한도를 사용 (빌드별 세마포어는 이미지 전용)
+        self.image_semaphore = asyncio.Semaphore(settings.semaphore_limit)
         self.node_counter = 0
+        self.summary_cache = SummaryCache(settings.context_summary_mode)
 
     def _next_node_id(self) -> str:
         self.node_counter += 1
@@ -45,12 +109,17 @@ class ScenarioTreeBuilder:
     ) -> ScenarioTree:
         """전체 시나리오 트리 생성"""
         self.node_counter = 0
+        self.summary_cache = SummaryCache(settings.context_summary_mode)  # 요약 캐시는 빌드 단위
         logger.info("=== Pipeline Start: type=%s, difficulty=%s ===", phishing_type, difficulty)
 
         try:
-            async with asyncio.timeout(settings.pipeline_timeout):
+            # 카세트: settings.cassette_mode에 따라 이 빌드의 LLM/Imagen 호출을 기록 또는 재생
+            async with asyncio.timeout(settings.pipeline_timeout), cassette.session(
+                phishing_type=phishing_type, difficulty=difficulty, seed_info=seed_info,
+            ):
                 # Phase 1: Seed (루트 노드 생성)
-                root, protagonist_data, prologue = await self._generate_root(phishing_type, difficulty, seed_info)
+                with metrics.phase("seed"):
+                    root, protagonist_data, prologue = await self._generate_root(phishing_type, difficulty, seed_info)
 
                 # 주인공 프로필 변환
                 from app.models.scenario import ProtagonistProfile
@@ -82,14 +151,18 @@ class ScenarioTreeBuilder:
                 self._save_progress(tree, "phase1_seed")
 
                 # Phase 2: BFS Expand (병렬 확장)
-                frontier = [(root, choice) for choice in root.choices]
+                root.resources = Resources()
+                root_state = BranchState.root(root)
+                frontier = [(root_state, choice) for choice in root.choices]
                 level = 0
-                while frontier:
-                    level += 1
-                    logger.info("[Phase 2/5] Level %d: %d개 브랜치 확장 중...", level, len(frontier))
-                    frontier = await self._expand_level(tree, phishing_type, difficulty, frontier)
-                    logger.info("[Phase 2/5] Level %d 완료: 총 노드=%d", level, len(tree.nodes))
-                    self._save_progress(tree, f"phase2_level{level}")
+                with metrics.phase("expand"):
+                    while frontier:
+                        level += 1
+                        logger.info("[Phase 2/5] Level %d: %d개 브랜치 확장 중...", level, len(frontier))
+                        frontier = await self._expand_level(tree, phishing_type, difficulty, frontier)
+                        logger.info("[Phase 2/5] Level %d 완료: 총 노드=%d", level, len(tree.nodes))
+                        self._save_progress(tree, f"phase2_level{level}")
+                logger.info("[Phase 2/5] 요약 캐시: %s", self.summary_cache.stats())
 
                 # Phase 3: Enrich (교육 콘텐츠) - 현재 비활성화, 폴백 교육 콘텐츠만 사용
                 logger.info("[Phase 3/5] Enrich 스킵 (폴백 교육 콘텐츠만 사용)")
@@ -97,15 +170,22 @@ class ScenarioTreeBuilder:
 
                 # Phase 4: Image 생성 (주요 노드만)
                 logger.info("[Phase 4/5] 이미지 생성 중...")
-                await self._generate_images(tree)
+                with metrics.phase("image"):
+                    await self._generate_images(tree)
                 logger.info("[Phase 4/5] Image 완료")
                 self._save_progress(tree, "phase4_image")
 
                 # Phase 5: Validate & Repair
                 logger.info("[Phase 5/5] 구조 검증 및 복구 중...")
-                tree = await self._validate_and_repair(tree)
+                with metrics.phase("validate"):
+                    tree = await self._validate_and_repair(tree)
                 logger.info("[Phase 5/5] Validate 완료: 최종 노드=%d", len(tree.nodes))
 
+                await progress_writer.flush(tree.id)
+
+                logger.info("LLM 응답 캐시 적중: %s", llm.response_cache.summary())
+                logger.info("LLM 동시 실행 한도: %s", llm.limiter.stats())
+                logger.info("Imagen 요청 속도 제한: %s", image_limiter.stats())
                 logger.info("=== Pipeline Complete: %s (nodes=%d) ===", tree.id, len(tree.nodes))
                 return tree
 
@@ -129,13 +209,23 @@ class ScenarioTreeBuilder:
         tree: ScenarioTree,
         phishing_type: str,
         difficulty: str,
-        frontier: list[tuple[ScenarioNode, Choice]]
-    ) -> list[tuple[ScenarioNode, Choice]]:
-        """BFS 레벨 확장 (병렬)"""
-        tasks = [
-            self._expand_single_branch(tree, phishing_type, difficulty, parent, choice)
-            for parent, choice in frontier
-        ]
+        frontier: list[tuple[BranchState, Choice]]
+    ) -> list[tuple[BranchState, Choice]]:
+        """BFS 레벨 확장 (병렬). 프론티어 항목은 (부모 경로 상태, 확장할 선택지)."""
+        if settings.expansion_mode == "sibling":
+            # 같은 부모의 선택지끼리 묶어 부모당 LLM 호출 1회
+            groups: dict[int, tuple[BranchState, list[Choice]]] = {}
+            for parent_state, choice in frontier:
+                groups.setdefault(id(parent_state), (parent_state, []))[1].append(choice)
+            tasks = [
+                self._expand_siblings(tree, phishing_type, difficulty, parent_state, choices)
+                for parent_state, choices in groups.values()
+            ]
+        else:
+            tasks = [
+                self._expand_single_branch(tree, phishing_type, difficulty, parent_state, choice)
+                for parent_state, choice in frontier
+            ]
 
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
@@ -143,88 +233,144 @@ class ScenarioTreeBuilder:
         for result in results:
             if isinstance(result, Exception):
                 continue
-            node, new_choices = result
-            next_frontier.extend(new_choices)
+            for node, new_choices in (result if isinstance(result, list) else [result]):
+                next_frontier.extend(new_choices)
 
         return next_frontier
 
+    def _generation_context(
+        self,
+        tree: ScenarioTree,
+        phishing_type: str,
+        difficulty: str,
+        parent_state: BranchState,
+        choice: Choice,
+        story_path: str
+    ) -> GenerationContext:
+        """선택지 하나에 대한 노드 생성 컨텍스트"""
+        # 자원: 부모의 누적 자원 + 현재 choice (O(1))
+        resources = parent_state.child_resources(choice)
+
+        # 최근 선택 목록: 부모의 최근 선택 + 현재 choice (종료 규칙은 최근 3개만 사용)
+        path_choices = list(parent_state.child_choices(choice))
+
+        # 종료 신호
+        depth = parent_state.node.depth + 1
+        end_signal = compute_end_signal(
+            resources, depth, settings.max_depth, path_choices
+        )
+
+        return GenerationContext(
+            phishing_type=phishing_type,
+            difficulty=difficulty,
+            story_path=story_path,
+            choice_taken=choice.text,
+            current_resources=resources,
+            current_depth=depth,
+            max_depth=settings.max_depth,
+            should_end=end_signal.should_end,
+            force_end=end_signal.force,
+            ending_type_hint=end_signal.ending_type,
+            protagonist=tree.protagonist,
+        )
+
+    def _attach_child(
+        self,
+        tree: ScenarioTree,
+        parent_state: BranchState,
+        choice: Choice,
+        result: GenerationResult
+    ) -> tuple[ScenarioNode, list[tuple[BranchState, Choice]]]:
+        """생성 결과를 트리에 추가하고 다음 프론티어 반환"""
+        parent = parent_state.node
+        node = result_to_node(
+            result,
+            self._next_node_id(),
+            depth=parent.depth + 1,
+            parent_node_id=parent.id,
+            parent_choice_id=choice.id,
+        )
+        node.resources = parent_state.child_resources(choice)
+
+        tree.nodes[node.id] = node
+        choice.next_node_id = node.id
+
+        if node.type == "narrative" and node.choices:
+            state = parent_state.child(node, choice)
+            return node, [(state, c) for c in node.choices]
+        return node, []
+
     async def _expand_single_branch(
         self,
         tree: ScenarioTree,
         phishing_type: str,
         difficulty: str,
-        parent: ScenarioNode,
+        parent_state: BranchState,
         choice: Choice
-    ) -> tuple[ScenarioNode, list[tuple[ScenarioNode, Choice]]]:
+    ) -> tuple[ScenarioNode, list[tuple[BranchState, Choice]]]:
         """개별 브랜치 확장"""
-        async with self.semaphore:
-            # 1. 경로 추적 (parent까지 포함, 중복 append 하지 않음)
-            path = self._trace_path_to(tree, parent.id)
-
-            # 2. 자원 계산: path의 choice + 현재 choice 별도 적용
-            resources = self._compute_resources(path)
-            resources.trust = max(0, min(5,
-                resources.trust + choice.resource_effect.trust
-            ))
-            resources.money = max(0, min(5,
-                resources.money + choice.resource_effect.money
-            ))
-            resources.awareness = max(0, min(5,
-                resources.awareness + choice.resource_effect.awareness
-            ))
-
-            # 3. 선택 목록: path의 choice + 현재 choice 명시적 추가
-            path_choices = [c for _, c in path if c is not None]
-            path_choices.append(choice)
-
-            # 4. 종료 신호
-            depth = parent.depth + 1
-            end_signal = compute_end_signal(
-                resources, depth, settings.max_depth, path_choices
-            )
+        # 1. 경로 (parent까지 포함, 중복 append 하지 않음)
+        path = parent_state.path()
+        depth = parent_state.node.depth + 1
 
-            # 5. 컨텍스트 압축 (현재 선택을 별도 전달하여 텍스트 중복 방지)
-            story_path = await build_story_path(path, depth, choice_taken=choice)
-
-            # 6. 노드 생성
-            context = GenerationContext(
-                phishing_type=phishing_type,
-                difficulty=difficulty,
-                story_path=story_path,
-                choice_taken=choice.text,
-                current_resources=resources,
-                current_depth=depth,
-                max_depth=settings.max_depth,
-                should_end=end_signal.should_end,
-                force_end=end_signal.force,
-                ending_type_hint=end_signal.ending_type,
-                protagonist=tree.protagonist,
-            )
+        # 2. 컨텍스트 압축 (현재 선택을 별도 전달하여 텍스트 중복 방지)
+        story_path = await build_story_path(
+            path, depth, choice_taken=choice, summary_cache=self.summary_cache
+        )
 
-            result = await generate_node(context)
-            node = result_to_node(
-                result,
-                self._next_node_id(),
-                depth=depth,
-                parent_node_id=parent.id,
-                parent_choice_id=choice.id,
-            )
+        # 3. 노드 생성
+        context = self._generation_context(
+            tree, phishing_type, difficulty, parent_state, choice, story_path
+        )
+        result = await generate_node(context)
+
+        # 4. 트리에 추가 + 다음 프론티어 반환
+        return self._attach_child(tree, parent_state, choice, result)
 
-            # 7. 트리에 추가
-            tree.nodes[node.id] = node
-            choice.next_node_id = node.id
+    async def _expand_siblings(
+        self,
+        tree: ScenarioTree,
+        phishing_type: str,
+        difficulty: str,
+        parent_state: BranchState,
+        choices: list[Choice]
+    ) -> list[tuple[ScenarioNode, list[tuple[BranchState, Choice]]]]:
+        """한 부모의 선택지들을 LLM 호출 1회로 확장 (검증에 실패한 자식만 선택지별 호출로 대체)"""
+        if len(choices) == 1:
+            return [await self._expand_single_branch(tree, phishing_type, difficulty, parent_state, choices[0])]
+
+        path = parent_state.path()
+        depth = parent_state.node.depth + 1
+        # 형제가 공유하는 경로 (각 선택지는 프롬프트에 따로 나열)
+        story_path = await build_story_path(path, depth, summary_cache=self.summary_cache)
+        contexts = [
+            self._generation_context(tree, phishing_type, difficulty, parent_state, choice, story_path)
+            for choice in choices
+        ]
+        results = await generate_sibling_nodes(contexts)
 
-            # 다음 프론티어 반환
-            if node.type == "narrative" and node.choices:
-                return node, [(node, c) for c in node.choices]
-            return node, []
+        expanded = [
+            self._attach_child(tree, parent_state, choice, result)
+            for choice, result in zip(choices, results)
+            if result is not None
+        ]
+        failed = [choice for choice, result in zip(choices, results) if result is None]
+        if failed:
+            logger.info("형제 일괄 생성 실패분 선택지별 재생성: %d개 (parent=%s)", len(failed), parent_state.node.id)
+            metrics.record_fallback("siblings", len(failed))
+            fallback = await asyncio.gather(*[
+                self._expand_single_branch(tree, phishing_type, difficulty, parent_state, choice)
+                for choice in failed
+            ], return_exceptions=True)
+            expanded.extend(r for r in fallback if not isinstance(r, Exception))
+        return expanded
 
     def _trace_path_to(
         self,
         tree: ScenarioTree,
         node_id: str
     ) -> list[tuple[ScenarioNode, Choice | None]]:
-        """루트에서 지정 노드까지 경로 추적"""
+        """루트에서 지정 노드까지 경로 추적 (저장된 트리용. 빌드 중에는 BranchState.path 사용)"""
         path = []
         current_id = node_id
 
@@ -253,20 +399,12 @@ class ScenarioTreeBuilder:
         self,
         path: list[tuple[ScenarioNode, Choice | None]]
     ) -> Resources:
-        """경로의 자원 변동 계산"""
+        """경로의 자원 변동 계산 (루트부터 재계산. 빌드 중에는 BranchState의 누적값 사용)"""
         resources = Resources()  # 기본값: trust=3, money=3, awareness=1
 
         for _, choice in path:
             if choice and choice.resource_effect:
-                resources.trust = max(0, min(5,
-                    resources.trust + choice.resource_effect.trust
-                ))
-                resources.money = max(0, min(5,
-                    resources.money + choice.resource_effect.money
-                ))
-                resources.awareness = max(0, min(5,
-                    resources.awareness + choice.resource_effect.awareness
-                ))
+                resources = apply_resource_effect(resources, choice.resource_effect)
 
         return resources
 
@@ -283,29 +421,28 @@ class ScenarioTreeBuilder:
 
     async def _enrich_single_node(self, node: ScenarioNode, phishing_type: str):
         """단일 노드에 교육 콘텐츠 추가"""
-        async with self.semaphore:
-            # 위험 선택지 텍스트 찾기
-            dangerous_choice_text = None
-            for choice in node.choices:
-                if choice.is_dangerous:
-                    dangerous_choice_text = choice.text
-                    break
-
-            if dangerous_choice_text or node.type.startswith("ending_"):
-                content = await enrich_node_with_education(
-                    node.text,
-                    dangerous_choice_text or "상황 종료",
-                    phishing_type
-                )
-                if content:
-                    node.educational_content = content
+        # 위험 선택지 텍스트 찾기
+        dangerous_choice_text = None
+        for choice in node.choices:
+            if choice.is_dangerous:
+                dangerous_choice_text = choice.text
+                break
+
+        if dangerous_choice_text or node.type.startswith("ending_"):
+            content = await enrich_node_with_education(
+                node.text,
+                dangerous_choice_text or "상황 종료",
+                phishing_type
+            )
+            if content:
+                node.educational_content = content
 
     async def _generate_images(self, tree: ScenarioTree):
         """
         모든 노드에 이미지 생성 (배치 처리 + 실패 시 재시도)
         
-        1차 시도: 모든 노드를 배치로 처리
-        2차 시도: 실패한 노드만 순차적으로 재시도 (더 긴 대기시간)
+        1차 시도: 모든 노드를 병렬 처리 (속도는 공유 image_limiter가 조절)
+        2차 시도: 실패한 노드만 순차적으로 재시도
         """
         nodes_to_generate = [
             node for node in tree.nodes.values()
@@ -318,7 +455,7 @@ class ScenarioTreeBuilder:
         total = len(nodes_to_generate)
         logger.info(f"이미지 생성 시작: {total}개 노드")
 
-        # 1차 시도: 배치 병렬 처리
+        # 1차 시도: 병렬 처리
         await self._generate_images_batch(nodes_to_generate, tree.id, "1차")
 
         # 실패한 노드 확인
@@ -329,23 +466,18 @@ class ScenarioTreeBuilder:
             logger.warning(f"1차 이미지 생성 결과: {success_count}/{total} 성공, {len(failed_nodes)}개 실패")
             logger.info(f"실패 노드: {[n.id for n in failed_nodes]}")
             
-            # 2차 시도: 실패한 노드만 순차 재시도 (더 긴 대기시간)
+            # 2차 시도: 실패한 노드만 순차 재시도 (요청 간격은 image_limiter가 조절)
             logger.info(f"2차 재시도 시작: {len(failed_nodes)}개 노드 (순차 처리)")
-            await asyncio.sleep(5.0)  # API 안정화 대기
-            
+
             for i, node in enumerate(failed_nodes):
                 logger.info(f"재시도 [{i+1}/{len(failed_nodes)}]: {node.id}")
                 await self._generate_single_image(node, tree.id)
-                
+
                 if node.image_url:
                     logger.info(f"재시도 성공: {node.id}")
                 else:
                     logger.error(f"재시도 실패: {node.id}")
-                
-                # 순차 처리 시 충분한 대기
-                if i < len(failed_nodes) - 1:
-                    await asyncio.sleep(2.0)
-            
+
             # 최종 결과
             final_failed = [node for node in nodes_to_generate if not node.image_url]
             final_success = total - len(final_failed)
@@ -362,29 +494,17 @@ class ScenarioTreeBuilder:
         scenario_id: str,
         pass_name: str
     ):
-        """배치 단위로 이미지 생성"""
-        total = len(nodes)
-        batch_size = settings.image_batch_size
-        
-        for i in range(0, total, batch_size):
-            batch = nodes[i:i + batch_size]
-            batch_num = i // batch_size + 1
-            total_batches = (total + batch_size - 1) // batch_size
-
-            logger.info(f"{pass_name} 배치 {batch_num}/{total_batches}: {len(batch)}개 이미지 생성 중...")
-
-            # 배치 내 병렬 생성
-            tasks = [self._generate_single_image(node, scenario_id) for node in batch]
-            await asyncio.gather(*tasks, return_exceptions=True)
-
-            # 다음 배치 전 대기
-            if i + batch_size < total:
-                logger.info(f"다음 배치 전 {settings.image_batch_wait}초 대기...")
-                await asyncio.sleep(settings.image_batch_wait)
+        """이미지 병렬 생성 (요청 속도는 image_limiter, 동시 실행은 image_semaphore가 제한)"""
+        logger.info(
+            f"{pass_name} 이미지 생성: {len(nodes)}개 (대기열 {image_limiter.queued}개, "
+            f"분당 {settings.image_requests_per_minute:g}회 제한)"
+        )
+        tasks = [self._generate_single_image(node, scenario_id) for node in nodes]
+        await asyncio.gather(*tasks, return_exceptions=True)
 
     async def _generate_single_image(self, node: ScenarioNode, scenario_id: str):
         """단일 노드에 이미지 생성"""
-        async with self.semaphore:
+        async with self.image_semaphore:
             if node.image_prompt:
                 try:
                     url = await generate_image(node.image_prompt, node.id, scenario_id)
@@ -394,9 +514,12 @@ class ScenarioTreeBuilder:
                     logger.error(f"[{node.id}] 이미지 생성 예외: {e}")
 
     def _save_progress(self, tree: ScenarioTree, phase: str):
-        """파이프라인 진행 상황을 JSON으로 중간 저장"""
+        """파이프라인 진행 상황을 JSON으로 중간 저장
+
+        직렬화(스냅샷)만 이벤트 루프에서 하고, 파일 쓰기는 I/O 스레드풀에서 원자적으로 한다.
+        이전 스냅샷이 아직 기록 대기 중이면 새 스냅샷으로 대체된다.
+        """
         progress_dir = SCENARIOS_DIR / "progress"
-        progress_dir.mkdir(parents=True, exist_ok=True)
         filepath = progress_dir / f"{tree.id}.json"
         data = tree.model_dump(mode="json")
         data["_progress"] = {
@@ -404,19 +527,21 @@ class ScenarioTreeBuilder:
             "node_count": len(tree.nodes),
             "timestamp": datetime.now(timezone.utc).isoformat(),
         }
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        logger.info("Progress saved: %s (%s, nodes=%d)", filepath.name, phase, len(tree.nodes))
+        progress_writer.submit(tree.id, filepath, json_codec.dumps(data, pretty=settings.json_pretty))
+        logger.info("Progress queued: %s (%s, nodes=%d)", filepath.name, phase, len(tree.nodes))
 
     async def _validate_and_repair(self, tree: ScenarioTree) -> ScenarioTree:
-        """구조 검증 및 복구"""
+        """구조 검증 및 복구 (복구 후에는 복구가 건드린 영역만 재검증)"""
+        report = scan_structure(tree)
         for attempt in range(3):  # 최대 3회 복구 시도
-            errors = validate_structure(tree)
-            if not errors:
+            if not report.errors:
                 logger.info("구조 검증 통과 (attempt=%d)", attempt + 1)
                 return tree
 
-            logger.warning("구조 검증 오류 %d건 발견, 복구 시도 %d/3", len(errors), attempt + 1)
-            tree = repair_tree(tree, errors)
+            logger.warning("구조 검증 오류 %d건 발견, 복구 시도 %d/3", len(report.errors), attempt + 1)
+            touched = repair_tree(tree, report.errors)
+            report = scan_structure(tree, previous=report, touched=touched)
 
+        if report.errors:
+            logger.warning("복구 후에도 구조 검증 오류 %d건 남음", len(report.errors))
         return tree
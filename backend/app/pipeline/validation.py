@@ -1,8 +1,21 @@
-"""시나리오 트리 구조 검증 모듈"""
+"""시나리오 트리 구조 검증 모듈
+
+루트에서 시작하는 BFS 한 번으로 모든 오류 유형을 수집한다.
+- 고아 노드: 루트에서 도달할 수 없는 노드 (참조만 되는 분리된 서브트리/순환 포함)
+- 끊어진 링크, 엔딩이 아닌 리프, 깊이 초과: 도달 가능한 노드마다 검사
+- GOOD/BAD 엔딩 존재: 도달 가능한 엔딩 기준
+
+복구 후에는 scan_structure(tree, previous, touched)로 복구가 건드린 영역만 다시 검사한다.
+복구는 도달 가능한 노드를 지우거나 기존 링크를 끊지 않으므로(링크 추가, 고아 삭제, 노드 변경만),
+이전 결과의 도달 집합에 건드린 노드와 거기서 새로 도달하는 노드만 반영하면 전체 검증과 같은 결과가 된다.
+이전 결과가 루트에서 출발하지 못했으면(루트 없음 등) 이 전제가 성립하지 않으므로 전체 검증을 다시 한다.
+"""
 import logging
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
 from enum import Enum
 
+from app.config import settings
 from app.models.scenario import ScenarioTree
 
 logger = logging.getLogger("pipeline.validation")
@@ -17,6 +30,12 @@ class ErrorType(Enum):
     DEPTH_EXCEEDED = "depth_exceeded"
 
 
+# 오류 보고 순서 (복구가 고아 삭제 → 링크 복구 → 엔딩 추가 → 리프 변환 순으로 처리하도록)
+_ORDER = {error_type: i for i, error_type in enumerate(ErrorType)}
+# 증분 재검증에서도 엔딩 집합으로 매번 다시 판정하는 트리 전체 오류
+_RECOMPUTED = {ErrorType.NO_GOOD_ENDING, ErrorType.NO_BAD_ENDING}
+
+
 @dataclass
 class ValidationError:
     """검증 오류"""
@@ -25,84 +44,143 @@ class ValidationError:
     message: str
 
 
+@dataclass
+class StructureReport:
+    """검증 결과와 증분 재검증에 필요한 상태"""
+    errors: list[ValidationError]
+    reachable: set[str] = field(default_factory=set)
+    good_endings: set[str] = field(default_factory=set)
+    bad_endings: set[str] = field(default_factory=set)
+    checked: int = 0  # 이번 검증에서 검사한 노드 수
+
+
 def validate_structure(tree: ScenarioTree) -> list[ValidationError]:
     """트리 구조 검증"""
-    errors = []
+    return scan_structure(tree).errors
+
+
+def scan_structure(
+    tree: ScenarioTree,
+    previous: StructureReport | None = None,
+    touched: set[str] | None = None,
+) -> StructureReport:
+    """트리 구조 검증 (previous와 touched가 주어지면 touched 영역만 재검증)"""
+    incremental = (
+        previous is not None and touched is not None
+        and tree.root_node_id in tree.nodes and tree.root_node_id in previous.reachable
+        # 엔딩 존재 여부 외의 노드 없는 오류(루트 없음)는 증분으로 다시 판정할 수 없음
+        and all(e.node_id is not None or e.error_type in _RECOMPUTED for e in previous.errors)
+    )
+    errors: list[ValidationError] = []
+
+    if incremental:
+        report = StructureReport(
+            errors,
+            reachable={i for i in previous.reachable if i in tree.nodes},
+            good_endings={i for i in previous.good_endings if i in tree.nodes},
+            bad_endings={i for i in previous.bad_endings if i in tree.nodes},
+        )
+        # 건드리지 않은 노드의 오류는 그대로 유지 (엔딩 존재 여부는 아래에서 다시 판정)
+        errors.extend(
+            e for e in previous.errors
+            if e.node_id is not None and e.node_id not in touched and e.node_id in tree.nodes
+            and (e.error_type != ErrorType.ORPHAN_NODE or e.node_id not in report.reachable)
+        )
+        seeds = [node_id for node_id in touched if node_id in report.reachable]
+    elif tree.root_node_id in tree.nodes:
+        report = StructureReport(errors, reachable={tree.root_node_id})
+        seeds = [tree.root_node_id]
+    else:
+        # 루트가 없으면 도달 판정이 무의미하므로 고아 검사는 하지 않음 (전체 삭제 방지)
+        errors.append(ValidationError(
+            ErrorType.BROKEN_LINK,
+            None,
+            f"Root node {tree.root_node_id} does not exist"
+        ))
+        _log(errors, tree)
+        return StructureReport(errors)
 
-    # 참조되는 노드 ID 수집
-    referenced_ids = {tree.root_node_id}
-    for node in tree.nodes.values():
-        for choice in node.choices:
-            if choice.next_node_id:
-                referenced_ids.add(choice.next_node_id)
+    _walk(tree, seeds, report)
 
-    # 1. 고아 노드 검사 (루트가 아닌데 참조되지 않는 노드)
-    for node_id, node in tree.nodes.items():
-        if node_id != tree.root_node_id and node_id not in referenced_ids:
+    # 도달하지 못한 노드 = 고아 (증분 검증에서는 건드린 노드만 확인)
+    candidates = touched if incremental else tree.nodes.keys()
+    for node_id in candidates:
+        if node_id in tree.nodes and node_id not in report.reachable:
             errors.append(ValidationError(
                 ErrorType.ORPHAN_NODE,
                 node_id,
-                f"Node {node_id} is not referenced by any parent"
+                f"Node {node_id} is not reachable from root"
             ))
 
-    # 2. 끊어진 링크 검사 (존재하지 않는 노드 참조)
-    for node in tree.nodes.values():
-        for choice in node.choices:
-            if choice.next_node_id and choice.next_node_id not in tree.nodes:
-                errors.append(ValidationError(
-                    ErrorType.BROKEN_LINK,
-                    node.id,
-                    f"Choice {choice.id} references non-existent node {choice.next_node_id}"
-                ))
-
-    # 3. GOOD ending 존재 확인
-    has_good_ending = any(
-        node.type == "ending_good" for node in tree.nodes.values()
-    )
-    if not has_good_ending:
+    if not report.good_endings:
         errors.append(ValidationError(
             ErrorType.NO_GOOD_ENDING,
             None,
             "No good ending found in tree"
         ))
-
-    # 4. BAD ending 존재 확인
-    has_bad_ending = any(
-        node.type == "ending_bad" for node in tree.nodes.values()
-    )
-    if not has_bad_ending:
+    if not report.bad_endings:
         errors.append(ValidationError(
             ErrorType.NO_BAD_ENDING,
             None,
             "No bad ending found in tree"
         ))
 
-    # 5. 리프 노드가 엔딩인지 확인
-    for node in tree.nodes.values():
-        is_leaf = len(node.choices) == 0 or all(
-            c.next_node_id is None for c in node.choices
-        )
+    errors.sort(key=lambda e: _ORDER[e.error_type])
+    _log(errors, tree, report.checked if incremental else None)
+    return report
+
+
+def _walk(tree: ScenarioTree, seeds: list[str], report: StructureReport) -> None:
+    """seeds에서 BFS. 방문한 노드를 검사하고 새로 도달한 노드를 report.reachable에 추가"""
+    max_depth = settings.max_depth
+    errors = report.errors
+    queue = deque(seeds)
+    while queue:
+        node = tree.nodes[queue.popleft()]
+        report.checked += 1
+
+        report.good_endings.discard(node.id)
+        report.bad_endings.discard(node.id)
+        if node.type == "ending_good":
+            report.good_endings.add(node.id)
+        elif node.type == "ending_bad":
+            report.bad_endings.add(node.id)
+
+        is_leaf = True
+        for choice in node.choices:
+            next_id = choice.next_node_id
+            if not next_id:
+                continue
+            is_leaf = False
+            if next_id not in tree.nodes:
+                errors.append(ValidationError(
+                    ErrorType.BROKEN_LINK,
+                    node.id,
+                    f"Choice {choice.id} references non-existent node {next_id}"
+                ))
+            elif next_id not in report.reachable:
+                report.reachable.add(next_id)
+                queue.append(next_id)
+
         if is_leaf and not node.type.startswith("ending_"):
             errors.append(ValidationError(
                 ErrorType.LEAF_NOT_ENDING,
                 node.id,
                 f"Leaf node {node.id} is not an ending type"
             ))
-
-    # 6. 깊이 제한 초과 검사
-    from app.config import settings
-    for node in tree.nodes.values():
-        if node.depth > settings.max_depth:
+        if node.depth > max_depth:
             errors.append(ValidationError(
                 ErrorType.DEPTH_EXCEEDED,
                 node.id,
-                f"Node {node.id} exceeds max depth {settings.max_depth}"
+                f"Node {node.id} exceeds max depth {max_depth}"
             ))
 
+
+def _log(errors: list[ValidationError], tree: ScenarioTree, checked: int | None = None) -> None:
     if errors:
         for err in errors:
             logger.warning("검증 오류: %s - %s", err.error_type.value, err.message)
+    elif checked is not None:
+        logger.info("구조 재검증 통과: 노드 %d개 중 %d개 검사", len(tree.nodes), checked)
     else:
         logger.info("구조 검증 통과: 노드 %d개", len(tree.nodes))
-
-    return errors
@@ -0,0 +1,33 @@
+"""전체 벤치마크 실행 (트리 알고리즘/저장소 + 읽기 API), 결과를 JSON 하나로 출력
+
+실행: cd backend && python -m benchmarks [--quick] [--output results.json]
+"""
+import argparse
+import json
+import logging
+from pathlib import Path
+
+from benchmarks import bench_api, bench_tree
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="작은 크기로 빠르게 (10 ~ 1,000 노드, 시나리오 50개)")
+    parser.add_argument("--output", type=Path, help="결과 JSON 파일 (생략 시 stdout)")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    sizes = [10, 100, 1000] if args.quick else bench_tree.DEFAULT_SIZES
+    report = {
+        "tree": bench_tree.run(sizes, branching=3, text_repeat=12, repeat=5),
+        "api": bench_api.run(50 if args.quick else 200, node_count=150, repeat=20),
+    }
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""읽기 API 벤치마크 (ASGI 앱 경유, 합성 시나리오 코퍼스)
+
+임시 JSON 저장소에 --scenarios개의 합성 시나리오를 저장한 뒤 측정한다.
+- list_scenarios: 첫 페이지 / 피싱 유형 필터 / 커서로 전체 순회
+- get_scenario: 카탈로그 캐시가 빈 상태(cold) / 반복 조회(warm, identity·gzip) / If-None-Match(304)
+
+실행: cd backend && python -m benchmarks.bench_api [--scenarios 200] [--nodes 150] [--repeat 20]
+      [--output results.json]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import tempfile
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from benchmarks.synthetic import build_tree, environment, measure
+
+BASE = "/api/v1/scenarios"
+
+
+def run(scenario_count: int, node_count: int, repeat: int) -> dict:
+    from app.main import app
+    from app.api.routes import scenario as scenario_routes
+    from app.core.scenario_catalog import ScenarioCatalog
+    from app.core.scenario_storage import JsonFileStorage
+
+    original = scenario_routes.scenario_storage, scenario_routes.scenario_catalog
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = JsonFileStorage([Path(tmp) / "seed", Path(tmp) / "generated"])
+        for i in range(scenario_count):
+            storage.save(build_tree(node_count, scenario_id=f"bench_{i:05d}", index=i))
+
+        def fresh_catalog() -> ScenarioCatalog:
+            catalog = ScenarioCatalog(storage)
+            scenario_routes.scenario_catalog = catalog
+            return catalog
+
+        scenario_routes.scenario_storage = storage
+        app.state.limiter.enabled = False
+        try:
+            client = TestClient(app)
+            meta = {"scenarios": scenario_count, "nodes": node_count}
+            ids = [f"bench_{i:05d}" for i in range(scenario_count)]
+
+            def get(path: str, **headers):
+                res = client.get(path, headers=headers)
+                assert res.status_code in (200, 304), res.status_code
+                return res
+
+            def walk_pages():
+                cursor, pages = None, 0
+                while True:
+                    res = get(f"{BASE}?limit=50" + (f"&cursor={cursor}" if cursor else ""))
+                    pages += 1
+                    cursor = res.headers.get("x-next-cursor")
+                    if not cursor:
+                        return pages
+
+            # 첫 목록 요청은 카탈로그 인덱스를 만든다
+            results.append({"bench": "list_scenarios_cold", **meta, **measure(
+                lambda catalog: get(f"{BASE}?limit=20"), max(1, repeat // 4), setup=fresh_catalog,
+            )})
+            results.append({"bench": "list_scenarios", **meta, **measure(lambda: get(f"{BASE}?limit=20"), repeat)})
+            results.append({"bench": "list_scenarios_filtered", **meta, **measure(
+                lambda: get(f"{BASE}?phishing_type=스미싱&difficulty=hard&limit=20"), repeat,
+            )})
+            results.append({
+                "bench": "list_scenarios_all_pages", **meta, "pages": walk_pages(),
+                **measure(walk_pages, max(1, repeat // 4)),
+            })
+
+            targets = iter(ids * (repeat // len(ids) + 2))
+            fresh_catalog()
+            results.append({"bench": "get_scenario_cold", **meta, **measure(
+                lambda scenario_id: get(f"{BASE}/{scenario_id}", **{"Accept-Encoding": "identity"}),
+                min(repeat, scenario_count), setup=lambda: next(targets),
+            )})
+            target = f"{BASE}/{ids[0]}"
+            results.append({"bench": "get_scenario_warm", **meta, **measure(
+                lambda: get(target, **{"Accept-Encoding": "identity"}), repeat,
+            )})
+            results.append({"bench": "get_scenario_warm_gzip", **meta, **measure(
+                lambda: get(target, **{"Accept-Encoding": "gzip"}), repeat,
+            )})
+            etag = get(target).headers["etag"]
+            results.append({"bench": "get_scenario_not_modified", **meta, **measure(
+                lambda: get(target, **{"If-None-Match": etag}), repeat,
+            )})
+        finally:
+            app.state.limiter.enabled = True
+            scenario_routes.scenario_storage, scenario_routes.scenario_catalog = original
+    return {"suite": "api", "environment": environment(), "results": results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenarios", type=int, default=200)
+    parser.add_argument("--nodes", type=int, default=150)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--output", type=Path, help="결과 JSON 파일 (생략 시 stdout)")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    report = run(args.scenarios, args.nodes, args.repeat)
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
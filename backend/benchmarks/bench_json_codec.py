@@ -0,0 +1,76 @@
+"""시나리오 JSON 저장/로드 벤치마크 (150노드 트리)
+
+기존 방식(json.dump indent=2 / json.load + model_validate)과
+json_codec(compact / pretty)을 비교한다.
+
+실행: cd backend && python -m benchmarks.bench_json_codec [--nodes 150] [--repeat 50]
+"""
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from app.core import json_codec
+from app.models.scenario import ScenarioTree
+from benchmarks.synthetic import build_tree
+
+
+def _timeit(fn, repeat: int) -> float:
+    """평균 소요 시간 (ms)"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def run(node_count: int, repeat: int) -> dict:
+    tree = build_tree(node_count)
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_path = Path(tmp) / "legacy.json"
+        compact_path = Path(tmp) / "compact.json"
+        pretty_path = Path(tmp) / "pretty.json"
+
+        def legacy_save():
+            with open(legacy_path, "w", encoding="utf-8") as f:
+                json.dump(tree.model_dump(mode="json"), f, ensure_ascii=False, indent=2)
+
+        def legacy_load():
+            with open(legacy_path, "r", encoding="utf-8") as f:
+                return ScenarioTree.model_validate(json.load(f))
+
+        def codec_save(path: Path, pretty: bool):
+            return lambda: json_codec.write_bytes(path, json_codec.dump_model(tree, pretty=pretty))
+
+        results = {
+            "legacy_save_ms": _timeit(legacy_save, repeat),
+            "compact_save_ms": _timeit(codec_save(compact_path, False), repeat),
+            "pretty_save_ms": _timeit(codec_save(pretty_path, True), repeat),
+            "legacy_load_ms": _timeit(legacy_load, repeat),
+            "codec_load_compact_ms": _timeit(
+                lambda: json_codec.read_model(compact_path, ScenarioTree), repeat),
+            # 기존 pretty 파일도 그대로 읽을 수 있어야 함
+            "codec_load_legacy_file_ms": _timeit(
+                lambda: json_codec.read_model(legacy_path, ScenarioTree), repeat),
+        }
+        results = {k: round(v, 3) for k, v in results.items()}
+        results.update({
+            "backend": json_codec.BACKEND,
+            "nodes": len(tree.nodes),
+            "repeat": repeat,
+            "legacy_bytes": legacy_path.stat().st_size,
+            "compact_bytes": compact_path.stat().st_size,
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=150)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    print(json.dumps(run(args.nodes, args.repeat), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""트리 알고리즘 / 저장소 벤치마크 (합성 트리 10 ~ 10,000 노드)
+
+- validate_structure: 정상 트리 / 손상 트리
+- repair_tree: 손상 트리 (검증 오류 목록은 측정 전에 계산)
+- revalidate_after_repair: 복구가 건드린 영역만 재검증 (scan_structure 증분 모드, 전체 검증과 비교)
+- _trace_path_to + _compute_resources: 모든 리프까지 경로 추적 후 자원 재계산
+- _save_scenario / _load_scenario: 라우트의 저장소 함수 (임시 디렉토리의 JSON 저장소)
+
+실행: cd backend && python -m benchmarks.bench_tree [--sizes 10 100 1000 10000] [--branching 3]
+      [--text-repeat 12] [--repeat 5] [--output results.json]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import tempfile
+from pathlib import Path
+
+from app.config import settings
+from app.pipeline.repair import repair_tree
+from app.pipeline.tree_builder import ScenarioTreeBuilder
+from app.pipeline.validation import scan_structure, validate_structure
+from benchmarks.synthetic import build_tree, damage_tree, environment, measure, tree_depth
+
+DEFAULT_SIZES = [10, 100, 1000, 10000]
+
+
+def _repeat_for(node_count: int, repeat: int) -> int:
+    # 큰 트리는 반복 수를 줄여 전체 실행 시간을 비슷하게
+    return max(1, repeat if node_count <= 1000 else repeat // 5)
+
+
+def _repaired(damaged):
+    """복구를 마친 트리와 증분 재검증 인자 (tree, 이전 결과, 변경 노드)"""
+    tree = damaged.model_copy(deep=True)
+    report = scan_structure(tree)
+    return tree, report, repair_tree(tree, report.errors)
+
+
+def bench_algorithms(node_count: int, branching: int, text_repeat: int, repeat: int) -> list[dict]:
+    tree = build_tree(node_count, branching=branching, text_repeat=text_repeat)
+    damaged = damage_tree(tree)
+    repeat = _repeat_for(node_count, repeat)
+    builder = ScenarioTreeBuilder()
+    leaves = [node.id for node in tree.nodes.values() if not node.choices]
+
+    def trace_all_leaves():
+        for leaf_id in leaves:
+            builder._compute_resources(builder._trace_path_to(tree, leaf_id))
+
+    meta = {"nodes": len(tree.nodes), "depth": tree_depth(tree), "branching": branching}
+    # 합성 트리의 깊이가 설정 한도를 넘어 DEPTH_EXCEEDED가 섞이지 않도록
+    original_max_depth = settings.max_depth
+    settings.max_depth = tree_depth(tree)
+    try:
+        results = [
+            {"bench": "validate_structure", **meta, **measure(lambda: validate_structure(tree), repeat)},
+            {
+                "bench": "validate_structure_damaged", **meta,
+                "errors": len(validate_structure(damaged)),
+                **measure(lambda: validate_structure(damaged), repeat),
+            },
+            {
+                "bench": "repair_tree", **meta,
+                **measure(
+                    lambda args: repair_tree(*args), repeat,
+                    setup=lambda: (lambda t: (t, validate_structure(t)))(damaged.model_copy(deep=True)),
+                ),
+            },
+            {
+                "bench": "revalidate_after_repair", **meta,
+                **measure(lambda args: scan_structure(*args), repeat, setup=lambda: _repaired(damaged)),
+            },
+            {
+                "bench": "trace_path_and_resources", **meta, "paths": len(leaves),
+                **measure(trace_all_leaves, repeat),
+            },
+        ]
+    finally:
+        settings.max_depth = original_max_depth
+    return results
+
+
+def bench_storage(node_count: int, branching: int, text_repeat: int, repeat: int) -> list[dict]:
+    from app.api.routes import scenario as scenario_routes
+    from app.core.scenario_catalog import ScenarioCatalog
+    from app.core.scenario_storage import JsonFileStorage
+
+    tree = build_tree(node_count, branching=branching, text_repeat=text_repeat)
+    repeat = _repeat_for(node_count, repeat)
+    meta = {"nodes": len(tree.nodes), "depth": tree_depth(tree), "branching": branching}
+    original = scenario_routes.scenario_storage, scenario_routes.scenario_catalog
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = JsonFileStorage([Path(tmp) / "seed", Path(tmp) / "generated"], pretty=settings.json_pretty)
+        scenario_routes.scenario_storage = storage
+        scenario_routes.scenario_catalog = ScenarioCatalog(storage)
+        try:
+            save = measure(lambda: asyncio.run(scenario_routes._save_scenario(tree)), repeat)
+            load = measure(lambda: scenario_routes._load_scenario(tree.id), repeat)
+            size = next((Path(tmp) / "generated").glob("*.json")).stat().st_size
+        finally:
+            scenario_routes.scenario_storage, scenario_routes.scenario_catalog = original
+    return [
+        {"bench": "save_scenario", **meta, "bytes": size, **save},
+        {"bench": "load_scenario", **meta, "bytes": size, **load},
+    ]
+
+
+def run(sizes: list[int], branching: int, text_repeat: int, repeat: int) -> dict:
+    results = []
+    for node_count in sizes:
+        results += bench_algorithms(node_count, branching, text_repeat, repeat)
+        results += bench_storage(node_count, branching, text_repeat, repeat)
+    return {"suite": "tree", "environment": environment(), "results": results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--branching", type=int, default=3)
+    parser.add_argument("--text-repeat", type=int, default=12)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="결과 JSON 파일 (생략 시 stdout)")
+    args = parser.parse_args()
+
+    # 검증/복구 로그(노드별 경고)가 측정을 지배하지 않도록
+    logging.disable(logging.WARNING)
+    report = run(args.sizes, args.branching, args.text_repeat, args.repeat)
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
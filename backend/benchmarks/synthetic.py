@@ -0,0 +1,137 @@
+"""벤치마크용 합성 시나리오 트리 / 측정 도구
+
+build_tree: BFS 순서로 노드를 채운 합성 트리 (노드 수, 분기 수, 최대 깊이, 텍스트 길이 지정)
+damage_tree: 복구 벤치마크용 손상 (끊어진 링크 + 고아 서브트리, 엔딩이 아닌 리프)
+measure: 반복 측정 통계 (ms)
+"""
+import platform
+import random
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+
+from app.core import json_codec
+from app.models.scenario import (
+    ScenarioTree, ScenarioNode, Choice, ResourceDelta, DangerFeedback, EducationalContent,
+)
+
+PHISHING_TYPES = ["보이스피싱", "스미싱", "메신저피싱", "투자사기"]
+DIFFICULTIES = ["easy", "medium", "hard"]
+
+
+def build_tree(
+    node_count: int,
+    branching: int = 3,
+    max_depth: int | None = None,
+    text_repeat: int = 12,
+    scenario_id: str = "bench_tree",
+    index: int = 0,
+) -> ScenarioTree:
+    """BFS 순서로 node_count개 노드를 가진 합성 트리 생성
+
+    max_depth에 도달한 노드와 자식을 배정받지 못한 노드는 엔딩이 된다.
+    text_repeat: 노드 본문 문장 반복 수 (12 ≈ 실제 시나리오 본문 길이)
+    index: 코퍼스 안에서의 순번 (피싱 유형/난이도/생성 시각을 다르게)
+    """
+    nodes: dict[str, ScenarioNode] = {}
+    nodes["node_001"] = ScenarioNode(id="node_001", type="narrative", text="")
+    queue = ["node_001"]
+    next_id = 2
+    while queue:
+        parent = nodes[queue.pop(0)]
+        parent.text = f"{parent.id} 상황 설명입니다. " * text_repeat
+        if max_depth is not None and parent.depth >= max_depth:
+            continue
+        for i in range(branching):
+            if next_id > node_count:
+                break
+            child_id = f"node_{next_id:03d}"
+            next_id += 1
+            dangerous = i == branching - 1
+            parent.choices.append(Choice(
+                id=f"{parent.id}_c{i + 1}",
+                text=f"선택지 {i + 1}: 상대방의 요구에 응답한다",
+                next_node_id=child_id,
+                is_dangerous=dangerous,
+                resource_effect=ResourceDelta(trust=1 if dangerous else -1, awareness=0 if dangerous else 1),
+                danger_feedback=DangerFeedback(
+                    why_dangerous="개인정보를 요구하는 전화는 의심해야 합니다.",
+                    warning_signs=["긴급함 강조", "기관 사칭"],
+                    safe_alternative="전화를 끊고 대표번호로 확인합니다.",
+                ) if dangerous else None,
+            ))
+            nodes[child_id] = ScenarioNode(
+                id=child_id, type="narrative", text="",
+                depth=parent.depth + 1, parent_node_id=parent.id,
+                parent_choice_id=f"{parent.id}_c{i + 1}",
+                image_prompt="A person holding a phone, worried expression",
+            )
+            queue.append(child_id)
+
+    # 선택지가 없는 노드는 엔딩으로 처리
+    for node in nodes.values():
+        if not node.choices:
+            node.type = "ending_bad" if node.depth % 2 else "ending_good"
+            node.text = node.text or "결말입니다. " * 10
+            node.educational_content = EducationalContent(
+                title="보이스피싱 예방", explanation="설명 " * 20,
+                prevention_tips=["대표번호로 확인"], warning_signs=["송금 요구"],
+            )
+    return ScenarioTree(
+        id=scenario_id, title=f"벤치마크 시나리오 {index}", description="합성 트리",
+        phishing_type=PHISHING_TYPES[index % len(PHISHING_TYPES)],
+        difficulty=DIFFICULTIES[index % len(DIFFICULTIES)],
+        root_node_id="node_001", nodes=nodes,
+        created_at=datetime(2025, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=index),
+    )
+
+
+def damage_tree(tree: ScenarioTree, fraction: float = 0.01, seed: int = 0) -> ScenarioTree:
+    """fraction 비율의 노드를 손상시킨 복사본
+
+    - 내부 노드 삭제: 부모 선택지는 끊어진 링크, 자식 서브트리는 고아가 된다
+    - 엔딩 타입 제거: 엔딩이 아닌 리프
+    """
+    damaged = tree.model_copy(deep=True)
+    rng = random.Random(seed)
+    count = max(1, int(len(damaged.nodes) * fraction))
+    candidates = [n for n in damaged.nodes.values() if n.id != damaged.root_node_id]
+    for node in rng.sample(candidates, min(count, len(candidates))):
+        if node.id not in damaged.nodes:
+            continue
+        if node.choices:
+            del damaged.nodes[node.id]
+        else:
+            node.type = "narrative"
+    return damaged
+
+
+def tree_depth(tree: ScenarioTree) -> int:
+    return max(node.depth for node in tree.nodes.values())
+
+
+def measure(fn, repeat: int, setup=None) -> dict:
+    """fn을 repeat번 실행한 소요 시간 통계 (ms). setup()의 반환값을 fn 인자로 넘기며 측정에서 제외"""
+    samples = []
+    for _ in range(repeat):
+        args = (setup(),) if setup else ()
+        start = time.perf_counter()
+        fn(*args)
+        samples.append((time.perf_counter() - start) * 1000)
+    return {
+        "repeat": repeat,
+        "mean_ms": round(statistics.fmean(samples), 4),
+        "median_ms": round(statistics.median(samples), 4),
+        "min_ms": round(min(samples), 4),
+        "max_ms": round(max(samples), 4),
+    }
+
+
+def environment() -> dict:
+    """결과 비교용 실행 환경"""
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "json_backend": json_codec.BACKEND,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
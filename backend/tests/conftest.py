@@ -0,0 +1,54 @@
+"""공용 테스트 픽스처"""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.core import llm
+from app.core.concurrency import AIMDLimiter, CircuitBreaker
+from app.models.scenario import ScenarioTree, ScenarioNode, Choice
+
+
+def _sample_tree(scenario_id: str) -> ScenarioTree:
+    nodes = {
+        "node_001": ScenarioNode(
+            id="node_001", type="narrative", text="검찰이라며 전화가 왔습니다.",
+            choices=[
+                Choice(id="node_001_c1", text="끊는다", next_node_id="node_002"),
+                Choice(id="node_001_c2", text="따른다", next_node_id="node_003", is_dangerous=True),
+            ],
+        ),
+        "node_002": ScenarioNode(id="node_002", type="ending_good", text="피해를 막았습니다.", depth=1),
+        "node_003": ScenarioNode(id="node_003", type="ending_bad", text="ATM으로 송금했습니다.", depth=1),
+    }
+    return ScenarioTree(
+        id=scenario_id,
+        title="검찰 사칭",
+        description="설명",
+        phishing_type="보이스피싱",
+        difficulty="easy",
+        root_node_id="node_001",
+        nodes=nodes,
+        prologue="평범한 오후였습니다.",
+        created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+@pytest.fixture
+def make_tree():
+    """루트 + 엔딩 2개로 구성된 샘플 시나리오 생성 함수"""
+    return _sample_tree
+
+
+@pytest.fixture
+def admin_token(monkeypatch):
+    """유효한 관리자 토큰 (admin_token 쿠키 값)"""
+    from app.api.routes import auth
+    monkeypatch.setitem(auth.valid_tokens, "test-admin-token", datetime.now(timezone.utc) + timedelta(hours=1))
+    return "test-admin-token"
+
+
+@pytest.fixture(autouse=True)
+def fresh_llm_controls(monkeypatch):
+    """프로세스 전역 LLM 동시 실행 한도/회로 차단기를 테스트마다 새로 만든다"""
+    monkeypatch.setattr(llm, "limiter", AIMDLimiter())
+    monkeypatch.setattr(llm, "breaker", CircuitBreaker())
@@ -0,0 +1,83 @@
+"""원자적 파일 쓰기 / 쓰기 합치기 테스트"""
+import asyncio
+import threading
+
+import pytest
+
+from app.core import atomic_io
+from app.core.atomic_io import CoalescingWriter, atomic_write_bytes
+
+
+class TestAtomicWrite:
+    def test_replaces_without_leftover_temp(self, tmp_path):
+        target = tmp_path / "sub" / "scenario.json"
+        atomic_write_bytes(target, b'{"a":1}')
+        atomic_write_bytes(target, b'{"a":2}')
+        assert target.read_bytes() == b'{"a":2}'
+        assert [p.name for p in target.parent.iterdir()] == ["scenario.json"]
+
+    def test_failed_write_keeps_original(self, tmp_path, monkeypatch):
+        target = tmp_path / "scenario.json"
+        target.write_bytes(b"original")
+
+        def broken_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(atomic_io.os, "replace", broken_replace)
+        with pytest.raises(OSError):
+            atomic_write_bytes(target, b"new")
+        assert target.read_bytes() == b"original"
+        assert [p.name for p in tmp_path.iterdir()] == ["scenario.json"]
+
+
+class TestCoalescingWriter:
+    def test_only_latest_snapshot_flushed(self, tmp_path, monkeypatch):
+        target = tmp_path / "progress.json"
+        gate = threading.Event()
+        writes = []
+        original = atomic_io.atomic_write_bytes
+
+        def slow_write(path, data):
+            gate.wait(5)
+            writes.append(data)
+            original(path, data)
+
+        monkeypatch.setattr(atomic_io, "atomic_write_bytes", slow_write)
+        writer = CoalescingWriter()
+
+        async def scenario():
+            for i in range(5):
+                writer.submit("s1", target, f"{i}".encode())
+            gate.set()
+            await writer.flush("s1")
+
+        asyncio.run(scenario())
+        # 첫 스냅샷이 기록 중일 때 들어온 1~3은 4로 대체됨
+        assert writes[-1] == b"4"
+        assert len(writes) <= 2
+        assert writer.coalesced >= 3
+        assert target.read_bytes() == b"4"
+
+    def test_write_after_failure_reaches_disk(self, tmp_path, monkeypatch):
+        target = tmp_path / "progress.json"
+        original = atomic_io.atomic_write_bytes
+        failures = [ValueError("bad snapshot")]
+
+        def flaky_write(path, data):
+            if failures:
+                raise failures.pop()
+            original(path, data)
+
+        monkeypatch.setattr(atomic_io, "atomic_write_bytes", flaky_write)
+        writer = CoalescingWriter()
+
+        async def scenario():
+            writer.submit("k", target, b"first")
+            await writer.flush("k")
+            writer.submit("k", target, b"second")
+            await writer.flush("k")
+
+        asyncio.run(scenario())
+        assert target.read_bytes() == b"second"
+        assert writer._pending == {} and writer._running == {}
+
@@ -0,0 +1,125 @@
+"""카세트 기록/재생 테스트"""
+import asyncio
+import gzip
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.config import settings
+from app.core import cassette, fake_provider, image_generator, llm
+from app.core.concurrency import TokenBucket
+from app.pipeline import tree_builder
+from app.pipeline.tree_builder import ScenarioTreeBuilder
+
+MESSAGES = [{"role": "user", "content": "요약해 주세요"}]
+
+
+@pytest.fixture
+def workspace(monkeypatch, tmp_path):
+    monkeypatch.setattr(cassette, "CASSETTES_DIR", tmp_path / "cassettes")
+    monkeypatch.setattr(tree_builder, "SCENARIOS_DIR", tmp_path / "scenarios")
+    monkeypatch.setattr(image_generator, "IMAGES_DIR", tmp_path / "images")
+    monkeypatch.setattr(image_generator, "image_limiter", TokenBucket(rate=10_000, capacity=1_000))
+    for name, value in {
+        "fake_llm_latency": 0.0, "fake_image_latency": 0.0, "fake_seed": 3,
+        "llm_cache_enabled": False, "max_depth": 3,
+    }.items():
+        monkeypatch.setattr(settings, name, value)
+    fake_provider.reset()
+    yield tmp_path
+    fake_provider.reset()
+
+
+def _recorded(tmp_path) -> list:
+    return sorted((tmp_path / "cassettes").glob("*.jsonl.gz"))
+
+
+class TestCassette:
+    def test_replay_scales_recorded_latency(self, workspace, monkeypatch):
+        async def slow_provider(purpose, messages, **kwargs):
+            await asyncio.sleep(0.1)
+            return SimpleNamespace(
+                choices=[SimpleNamespace(message=SimpleNamespace(content="요약문"))],
+                usage=SimpleNamespace(prompt_tokens=10, completion_tokens=3),
+            )
+
+        async def failing_provider(**kwargs):
+            raise AssertionError("replay must not call the provider")
+
+        monkeypatch.setattr(llm, "_litellm_acompletion", slow_provider)
+        monkeypatch.setattr(settings, "cassette_mode", "record")
+
+        async def record():
+            async with cassette.session(run="unit"):
+                return await llm.complete("summary", MESSAGES)
+
+        assert asyncio.run(record()) == "요약문"
+        [path] = _recorded(workspace)
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            header, entry = (json.loads(line) for line in f)
+        assert header["run"] == "unit" and entry["purpose"] == "summary"
+        assert entry["latency"] >= 0.09 and entry["usage"] == [10, 3]
+
+        monkeypatch.setattr(llm.litellm, "acompletion", failing_provider)
+        monkeypatch.setattr(settings, "cassette_mode", "replay")
+        monkeypatch.setattr(settings, "cassette_file", path.name)
+        monkeypatch.setattr(settings, "cassette_latency_scale", 0.3)
+
+        async def replay():
+            async with cassette.session() as tape:
+                start = time.monotonic()
+                result = await llm.complete("summary", MESSAGES)
+                elapsed = time.monotonic() - start
+                with pytest.raises(cassette.CassetteMissError):
+                    await llm.complete("summary", MESSAGES)  # 같은 요청은 기록된 횟수만큼만
+                return result, elapsed, tape
+
+        result, elapsed, tape = asyncio.run(replay())
+        assert result == "요약문"
+        assert 0.02 <= elapsed < 0.09
+        assert (tape.hits, tape.misses) == (1, 1)
+
+    def test_recorded_errors_are_replayed(self, workspace, monkeypatch):
+        async def rate_limited(purpose, messages, **kwargs):
+            raise RuntimeError("429 RESOURCE_EXHAUSTED")
+
+        monkeypatch.setattr(llm, "_litellm_acompletion", rate_limited)
+        monkeypatch.setattr(settings, "cassette_mode", "record")
+
+        async def run():
+            async with cassette.session():
+                with pytest.raises(RuntimeError):
+                    await llm.complete("summary", MESSAGES)
+
+        asyncio.run(run())
+        monkeypatch.setattr(settings, "cassette_mode", "replay")
+        monkeypatch.setattr(settings, "cassette_file", _recorded(workspace)[0].name)
+        monkeypatch.setattr(settings, "cassette_latency_scale", 0)
+        asyncio.run(run())  # 재생된 429도 실제 호출처럼 실패
+        assert llm.breaker.consecutive_failures == 2
+        assert llm.limiter.error_rate() == 1.0
+
+    def test_build_replays_offline(self, workspace, monkeypatch):
+        monkeypatch.setattr(settings, "llm_provider", "fake")
+        monkeypatch.setattr(settings, "image_provider", "fake")
+        monkeypatch.setattr(settings, "cassette_mode", "record")
+        recorded = asyncio.run(ScenarioTreeBuilder().build("보이스피싱", "easy"))
+        [path] = _recorded(workspace)
+
+        def no_network(*args, **kwargs):
+            raise AssertionError("replay must not call a provider")
+
+        monkeypatch.setattr(settings, "llm_provider", "litellm")
+        monkeypatch.setattr(settings, "image_provider", "imagen")
+        monkeypatch.setattr(llm.litellm, "acompletion", no_network)
+        monkeypatch.setattr(image_generator, "_request_imagen", no_network)
+        monkeypatch.setattr(settings, "cassette_mode", "replay")
+        monkeypatch.setattr(settings, "cassette_file", path.name)
+        monkeypatch.setattr(settings, "cassette_latency_scale", 0)
+        replayed = asyncio.run(ScenarioTreeBuilder().build("보이스피싱", "easy"))
+
+        assert len(replayed.nodes) == len(recorded.nodes)
+        assert sorted(n.text for n in replayed.nodes.values()) == sorted(n.text for n in recorded.nodes.values())
+        assert all(n.image_url for n in replayed.nodes.values() if n.image_prompt)
@@ -0,0 +1,288 @@
+"""외부 API 호출 제어 테스트 (AIMD 동시 실행 제한, 토큰 버킷 속도 제한, 회로 차단기)"""
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.core import image_generator, llm
+from app.core.concurrency import AIMDLimiter, CircuitBreaker, CircuitOpenError, TokenBucket
+from app.models.scenario import Resources
+from app.pipeline import node_generator
+
+
+def _complete(limiter: AIMDLimiter, count: int, outcome: str = "ok", latency: float = 0.1):
+    async def run():
+        for _ in range(count):
+            await limiter.acquire()
+            limiter.release(outcome, latency)
+
+    asyncio.run(run())
+
+
+class TestAIMDLimiter:
+    def test_additive_increase_up_to_ceiling(self):
+        limiter = AIMDLimiter(initial=2, max_limit=4)
+        _complete(limiter, 2)  # 2 + 1/2 + 1/2.5 ...
+        assert int(limiter.limit) == 2
+        _complete(limiter, 3)
+        assert int(limiter.limit) == 3
+        _complete(limiter, 100)
+        assert limiter.limit == 4
+
+    def test_slow_or_erroring_calls_do_not_increase(self):
+        limiter = AIMDLimiter(initial=2, latency_target=1.0)
+        _complete(limiter, 10, latency=5.0)
+        assert limiter.limit == 2
+        _complete(limiter, 3, outcome="error")
+        _complete(limiter, 5)  # 최근 오류율 3/8 > 10%
+        assert limiter.limit == 2
+
+    def test_multiplicative_decrease_once_per_cooldown(self):
+        limiter = AIMDLimiter(initial=8, cooldown=60)
+        _complete(limiter, 3, outcome="overload")
+        assert limiter.limit == 4
+        assert limiter.decreases == 1
+        limiter.cooldown = 0
+        _complete(limiter, 5, outcome="overload")
+        assert limiter.limit == 1  # min_limit 아래로 내려가지 않음
+
+    def test_concurrency_never_exceeds_limit(self):
+        limiter = AIMDLimiter(initial=3, max_limit=3)
+        peak = 0
+
+        async def call():
+            nonlocal peak
+            await limiter.acquire()
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.005)
+            limiter.release("ok", 0.005)
+
+        async def run():
+            await asyncio.gather(*[call() for _ in range(20)])
+
+        asyncio.run(run())
+        assert peak == 3
+        assert limiter.in_flight == 0 and limiter.queued == 0
+
+    def test_cancelled_waiter_does_not_leak_slot(self):
+        limiter = AIMDLimiter(initial=1, max_limit=1)
+
+        async def run():
+            await limiter.acquire()
+            waiter = asyncio.create_task(limiter.acquire())
+            await asyncio.sleep(0)
+            assert limiter.queued == 1
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+            limiter.release("ok")
+            await asyncio.wait_for(limiter.acquire(), timeout=1)
+            limiter.release("ok")
+
+        asyncio.run(run())
+        assert limiter.in_flight == 0
+
+
+class TestSharedLimiter:
+    def test_rate_limit_error_backs_off_shared_limiter(self, monkeypatch):
+        shared = AIMDLimiter(initial=8, max_limit=8)
+
+        async def rate_limited(**kwargs):
+            raise RuntimeError("429 RESOURCE_EXHAUSTED")
+
+        monkeypatch.setattr(llm, "limiter", shared)
+        monkeypatch.setattr(llm.litellm, "acompletion", rate_limited)
+        monkeypatch.setattr(settings, "llm_cache_enabled", False)
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(llm.complete("article", [{"role": "user", "content": "x"}]))
+        assert shared.limit == 4
+        assert shared.in_flight == 0
+
+    def test_is_overload(self):
+        assert llm.is_overload(asyncio.TimeoutError())
+        assert llm.is_overload(RuntimeError("RESOURCE_EXHAUSTED"))
+        assert not llm.is_overload(ValueError("bad json"))
+        assert not llm.is_overload(SimpleNamespace())
+
+
+class TestTokenBucket:
+    def test_burst_then_paced(self):
+        bucket = TokenBucket(rate=100, capacity=3)
+
+        async def run():
+            waits = []
+            for _ in range(5):
+                waits.append(await bucket.acquire())
+            return waits
+
+        waits = asyncio.run(run())
+        assert waits[:3] == [0.0, 0.0, 0.0]
+        assert all(w > 0 for w in waits[3:])
+
+    def test_concurrent_callers_are_spaced_by_rate(self):
+        bucket = TokenBucket(rate=200, capacity=1)
+
+        async def run():
+            start = time.monotonic()
+            depth = []
+
+            async def call():
+                await bucket.acquire()
+                return time.monotonic() - start
+
+            tasks = [asyncio.create_task(call()) for _ in range(5)]
+            await asyncio.sleep(0)
+            depth.append(bucket.queued)
+            return await asyncio.gather(*tasks), depth
+
+        times, depth = asyncio.run(run())
+        assert depth == [4]
+        assert times == sorted(times)
+        assert times[-1] >= 4 / 200 * 0.9
+        assert bucket.queued == 0
+
+    def test_pause_holds_all_requests(self):
+        bucket = TokenBucket(rate=1000, capacity=5)
+        bucket.pause(0.05)
+        assert bucket.stats()["paused_for"] > 0
+
+        waited = asyncio.run(bucket.acquire())
+        assert waited >= 0.04
+
+    def test_cancelled_reservation_is_refunded(self):
+        bucket = TokenBucket(rate=1, capacity=1)
+
+        async def run():
+            await bucket.acquire()
+            waiter = asyncio.create_task(bucket.acquire())
+            await asyncio.sleep(0)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+
+        asyncio.run(run())
+        assert bucket.queued == 0
+        assert bucket.stats()["tokens"] > -1
+
+
+class TestImageRateLimit:
+    def test_retry_after_hint(self):
+        error = RuntimeError("429 RESOURCE_EXHAUSTED {'retryDelay': '7s'}")
+        assert image_generator._retry_after(error) == 7.0
+        response = SimpleNamespace(headers={"retry-after": "3"})
+        assert image_generator._retry_after(SimpleNamespace(response=response)) == 3.0
+        assert image_generator._retry_after(RuntimeError("boom")) is None
+
+    def test_quota_error_pauses_shared_bucket(self, monkeypatch):
+        bucket = TokenBucket(rate=1000, capacity=10)
+        calls = []
+
+        def fake_generate(prompt, node_id, scenario_id, seed):
+            calls.append(time.monotonic())
+            if len(calls) == 1:
+                raise RuntimeError("429 RESOURCE_EXHAUSTED retry after 0.05s")
+            return f"/api/v1/images/{node_id}.png"
+
+        monkeypatch.setattr(image_generator, "image_limiter", bucket)
+        monkeypatch.setattr(image_generator, "_prepare_environment", lambda: True)
+        monkeypatch.setattr(image_generator, "_generate_image_sync", fake_generate)
+
+        url = asyncio.run(image_generator.generate_image("prompt", "n1"))
+        assert url == "/api/v1/images/n1.png"
+        assert calls[1] - calls[0] >= 0.04
+
+
+class TestCircuitBreaker:
+    def test_trips_after_consecutive_failures(self):
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+        for _ in range(2):
+            breaker.before_call()
+            breaker.record_failure()
+        breaker.before_call()
+        breaker.record_success()  # 성공하면 연속 실패 초기화
+        for _ in range(3):
+            breaker.before_call()
+            breaker.record_failure()
+
+        assert breaker.is_open()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+        assert breaker.stats()["state"] == "open"
+        assert breaker.rejected == 1
+
+    def test_half_open_probe_closes_or_reopens(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+
+        breaker.before_call()  # 시험 호출 1개만 허용
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+        breaker.record_failure()
+        assert breaker.opened == 2
+
+        breaker.before_call()
+        breaker.record_success()
+        assert breaker.state == "closed"
+        breaker.before_call()
+
+    def test_cancelled_probe_frees_slot(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+        breaker.before_call()
+        breaker.record_cancelled()
+        breaker.before_call()
+
+
+class TestSharedBreaker:
+    def test_open_circuit_skips_retries_and_falls_back(self, monkeypatch):
+        calls = []
+        sleeps = []
+
+        async def failing(**kwargs):
+            calls.append(kwargs)
+            raise RuntimeError("503 Service Unavailable")
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        monkeypatch.setattr(llm, "breaker", CircuitBreaker(failure_threshold=2, reset_timeout=60))
+        monkeypatch.setattr(llm.litellm, "acompletion", failing)
+        monkeypatch.setattr(settings, "llm_cache_enabled", False)
+        monkeypatch.setattr(settings, "retry_count", 2)
+        monkeypatch.setattr(node_generator.asyncio, "sleep", fake_sleep)
+        context = node_generator.GenerationContext(
+            phishing_type="보이스피싱", difficulty="easy", story_path="이야기", choice_taken="끊는다",
+            current_resources=Resources(), current_depth=1, max_depth=5,
+            should_end=False, force_end=False, ending_type_hint=None,
+        )
+
+        async def run():
+            first = await node_generator.generate_node(context)
+            second = await node_generator.generate_node(context)
+            return first, second
+
+        first, second = asyncio.run(run())
+        # 첫 노드: 2회 실패로 회로 open → 세 번째 시도는 호출 없이 폴백
+        assert len(calls) == 2 and sleeps == [1, 2]
+        # 두 번째 노드: LLM 호출/백오프 없이 바로 폴백
+        assert second.node_type == first.node_type == "narrative"
+        assert len(calls) == 2 and sleeps == [1, 2]
+        assert llm.breaker.rejected == 2
+
+    def test_health_reports_circuit_state(self, monkeypatch):
+        from app.main import app
+
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+        monkeypatch.setattr(llm, "breaker", breaker)
+        client = TestClient(app)
+        assert client.get("/health").json()["status"] == "ok"
+
+        breaker.record_failure()
+        body = client.get("/health").json()
+        assert body["status"] == "degraded"
+        assert body["llm"]["circuit"]["state"] == "open"
+        assert body["llm"]["concurrency"]["limit"] >= 1
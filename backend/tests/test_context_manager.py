@@ -0,0 +1,178 @@
+"""컨텍스트 압축 테스트 (요약 LLM 호출은 가짜로 대체)"""
+import asyncio
+
+import pytest
+
+from app.models.scenario import ScenarioNode, Choice
+from app.pipeline import context_manager
+from app.pipeline.context_manager import (
+    SUMMARY_TOKEN_RESERVE,
+    SummaryCache,
+    build_story_path,
+    estimate_message_tokens,
+    _segment_text,
+    _segment_tokens,
+)
+
+
+def _path(length: int) -> list[tuple[ScenarioNode, Choice | None]]:
+    path = []
+    for i in range(length):
+        node = ScenarioNode(id=f"node_{i:03d}", type="narrative", text=f"상황 {i}." + " 전개" * 300, depth=i)
+        choice = Choice(id=f"node_{i - 1:03d}_c1", text=f"선택 {i}") if i else None
+        path.append((node, choice))
+    return path
+
+
+def _budget(keep: int) -> int:
+    """최근 노드 keep개가 원문으로 들어가고 그 이전은 요약되는 예산 (노드 1개 이후 세그먼트 길이는 동일)"""
+    node, choice = _path(2)[1]
+    return SUMMARY_TOKEN_RESERVE + keep * _segment_tokens(_segment_text(node, choice)) + 8
+
+
+# 최근 2개 노드만 원문 (기존 depth 3+ 동작과 같은 분할)
+BUDGET = _budget(2)
+
+
+@pytest.fixture
+def summarize_calls(monkeypatch):
+    calls = []
+
+    async def fake_summarize(nodes_with_choices, fallback=True):
+        calls.append([node.id for node, _ in nodes_with_choices])
+        await asyncio.sleep(0.01)
+        return "요약:" + ",".join(node.id for node, _ in nodes_with_choices)
+
+    monkeypatch.setattr(context_manager, "summarize_nodes", fake_summarize)
+    return calls
+
+
+class TestSummaryCache:
+    def test_siblings_share_one_call(self, summarize_calls):
+        cache = SummaryCache()
+        path = _path(4)
+        siblings = [Choice(id=f"c{i}", text=f"형제 {i}") for i in range(3)]
+
+        async def run():
+            return await asyncio.gather(*[
+                build_story_path(path, 4, choice_taken=c, summary_cache=cache, token_budget=BUDGET) for c in siblings
+            ])
+
+        results = asyncio.run(run())
+        assert summarize_calls == [["node_000", "node_001"]]
+        assert all("요약:node_000,node_001" in r for r in results)
+        assert (cache.misses, cache.hits, cache.coalesced) == (1, 2, 2)
+        assert "hit=2" in cache.stats()
+
+    def test_different_prefixes_not_shared(self, summarize_calls):
+        cache = SummaryCache()
+
+        async def run():
+            await build_story_path(_path(4), 4, summary_cache=cache, token_budget=BUDGET)
+            await build_story_path(_path(5), 5, summary_cache=cache, token_budget=BUDGET)
+            await build_story_path(_path(4), 4, summary_cache=cache, token_budget=BUDGET)
+
+        asyncio.run(run())
+        assert len(summarize_calls) == 2
+        assert (cache.misses, cache.hits, cache.coalesced) == (2, 1, 0)
+
+    def test_path_within_budget_skips_summary(self, summarize_calls):
+        path = _path(6)
+        result = asyncio.run(build_story_path(path, 6, summary_cache=SummaryCache(), token_budget=10_000))
+        assert summarize_calls == []
+        assert "[이전 경과 요약]" not in result
+        assert all(node.text in result for node, _ in path)
+
+
+class TestTokenBudget:
+    def test_keeps_as_many_recent_nodes_as_fit(self, summarize_calls):
+        result = asyncio.run(build_story_path(_path(6), 6, token_budget=_budget(3)))
+        assert summarize_calls == [["node_000", "node_001", "node_002"]]
+        assert "[최근 상황]\n상황 3." in result
+
+    def test_last_node_kept_even_over_budget(self, summarize_calls):
+        result = asyncio.run(build_story_path(_path(4), 4, token_budget=1))
+        assert summarize_calls == [["node_000", "node_001", "node_002"]]
+        assert result.endswith('전개\n\n→ 선택: "선택 3"')
+        assert "상황 2." not in result
+
+    def test_message_token_estimate(self):
+        messages = [{"role": "system", "content": "가" * 100}, {"role": "user", "content": "나" * 40}]
+        assert estimate_message_tokens(messages) == 70
+
+
+class TestRollingSummary:
+    def test_child_prefix_adds_one_rolling_call(self, summarize_calls, monkeypatch):
+        rolling_calls = []
+
+        async def fake_rolling(previous, node, choice, fallback=True):
+            rolling_calls.append((previous, node.id))
+            return f"{previous}+{node.id}"
+
+        monkeypatch.setattr(context_manager, "summarize_rolling", fake_rolling)
+        cache = SummaryCache(mode="rolling")
+
+        async def run():
+            first = await build_story_path(_path(6), 6, summary_cache=cache, token_budget=BUDGET)
+            second = await build_story_path(_path(7), 7, summary_cache=cache, token_budget=BUDGET)
+            return first, second
+
+        first, second = asyncio.run(run())
+        # 첫 노드만 일반 요약, 이후 노드는 부모 요약 + 노드 1개
+        assert summarize_calls == [["node_000"]]
+        assert [node_id for _, node_id in rolling_calls] == [
+            "node_001", "node_002", "node_003", "node_004",
+        ]
+        assert rolling_calls[-1][0] == "요약:node_000+node_001+node_002+node_003"
+        assert "요약:node_000+node_001+node_002+node_003+node_004" in second
+
+    def test_unknown_mode_rejected(self):
+        with pytest.raises(ValueError):
+            SummaryCache(mode="weekly")
+
+
+class TestSummaryFailure:
+    @pytest.fixture
+    def flaky_llm(self, monkeypatch):
+        """첫 요약 호출만 실패하는 LLM"""
+        calls = []
+
+        async def fake_complete(purpose, messages, **kwargs):
+            calls.append(purpose)
+            if len(calls) == 1:
+                raise RuntimeError("rate limited")
+            return f"{purpose}#{len(calls)}"
+
+        monkeypatch.setattr(context_manager.llm, "complete", fake_complete)
+        return calls
+
+    def test_fallback_not_cached(self, flaky_llm):
+        cache = SummaryCache()
+
+        async def run():
+            first = await build_story_path(_path(5), 5, summary_cache=cache, token_budget=BUDGET)
+            second = await build_story_path(_path(5), 5, summary_cache=cache, token_budget=BUDGET)
+            return first, second
+
+        first, second = asyncio.run(run())
+        # 실패한 첫 요청은 폴백, 같은 접두 경로의 다음 요청은 다시 호출해 성공
+        assert "상황 0." in first and "summary#" not in first
+        assert "summary#2" in second
+        assert flaky_llm == ["summary", "summary"]
+        assert cache.misses == 2
+
+    def test_rolling_does_not_build_on_failed_parent(self, flaky_llm):
+        cache = SummaryCache(mode="rolling")
+
+        async def run():
+            first = await build_story_path(_path(4), 4, summary_cache=cache, token_budget=BUDGET)
+            second = await build_story_path(_path(5), 5, summary_cache=cache, token_budget=BUDGET)
+            return first, second
+
+        first, second = asyncio.run(run())
+        # 루트 요약 실패 → 자식 접두 경로도 폴백 (폴백 위에 누적 요약을 호출하지 않음)
+        assert flaky_llm[0] == "summary" and "summary#" not in first
+        # 다음 요청은 루트부터 다시 요약한 뒤 누적
+        assert flaky_llm[1:] == ["summary", "rolling_summary", "rolling_summary"]
+        assert "rolling_summary#4" in second
+
@@ -0,0 +1,112 @@
+"""가짜 제공자로 전체 파이프라인 오프라인 실행 테스트"""
+import asyncio
+import json
+
+import pytest
+
+from app.config import settings
+from app.core import fake_provider, image_generator, llm, metrics, news_crawler
+from app.core.concurrency import TokenBucket
+from app.models.scenario import EducationalContent
+from app.pipeline import tree_builder
+from app.pipeline.node_generator import GenerationResult
+from app.pipeline.tree_builder import ScenarioTreeBuilder
+
+
+@pytest.fixture
+def offline(monkeypatch, tmp_path):
+    """LLM/Imagen/뉴스 모두 가짜 제공자 (지연 0), 산출물은 tmp_path로"""
+    for name, value in {
+        "llm_provider": "fake", "image_provider": "fake", "news_provider": "fake",
+        "fake_llm_latency": 0.0, "fake_image_latency": 0.0, "fake_seed": 7,
+        "llm_cache_enabled": False, "max_depth": 3,
+    }.items():
+        monkeypatch.setattr(settings, name, value)
+    monkeypatch.setattr(tree_builder, "SCENARIOS_DIR", tmp_path / "scenarios")
+    monkeypatch.setattr(image_generator, "IMAGES_DIR", tmp_path / "images")
+    monkeypatch.setattr(image_generator, "image_limiter", TokenBucket(rate=10_000, capacity=1_000))
+    fake_provider.reset()
+    yield tmp_path
+    fake_provider.reset()
+
+
+class TestFakeResponses:
+    def test_responses_match_schemas(self, offline):
+        fake = fake_provider.llm()
+        root = GenerationResult.model_validate_json(fake.respond("root", "현재 깊이: 0/3"))
+        assert root.protagonist and len(root.choices) == 3
+        ending = GenerationResult.model_validate_json(fake.respond(
+            "node", "현재 깊이: 3/3\n종료 신호: 반드시 엔딩으로 작성 (강제)\n권장 엔딩 유형: bad\n"
+        ))
+        assert ending.node_type == "ending_bad" and ending.choices == []
+        EducationalContent.model_validate_json(fake.respond("education", "x"))
+        assert json.loads(fake.respond("article", "x"))["is_phishing_related"] is True
+
+    def test_sibling_response_follows_each_end_signal(self, offline):
+        prompt = (
+            "현재 깊이: 2/3\n\n"
+            '[choice_1] 플레이어의 선택: "끊는다"\n- 자원 상태: ...\n- 종료 신호: 계속 진행 (선택지 3개)\n\n'
+            '[choice_2] 플레이어의 선택: "따른다"\n- 자원 상태: ...\n'
+            "- 종료 신호: 반드시 엔딩으로 작성 (강제, 권장 엔딩 유형: bad, choices는 [])\n"
+        )
+        children = json.loads(fake_provider.llm().respond("siblings", prompt))["children"]
+        assert GenerationResult.model_validate(children["choice_1"]).node_type == "narrative"
+        assert GenerationResult.model_validate(children["choice_2"]).node_type == "ending_bad"
+
+    def test_error_and_rate_limit_rates(self):
+        fake = fake_provider.FakeLLMProvider(fake_provider.FakeProfile(
+            llm_latency=0, rate_limit_rate=0.5, error_rate=0.5, seed=1,
+        ))
+        errors = []
+
+        async def run():
+            for _ in range(20):
+                try:
+                    await fake.acompletion("summary", [{"role": "user", "content": "x"}])
+                except RuntimeError as e:
+                    errors.append(llm.is_overload(e))
+
+        asyncio.run(run())
+        assert len(errors) == 20
+        assert 0 < sum(errors) < 20
+
+    def test_tiny_png(self):
+        png = fake_provider.tiny_png()
+        assert png.startswith(b"\x89PNG\r\n\x1a\n") and len(png) < 200
+
+
+class TestOfflinePipeline:
+    def test_build_runs_without_network(self, offline, monkeypatch):
+        registry = metrics.Metrics()
+        monkeypatch.setattr(metrics, "registry", registry)
+        tree = asyncio.run(ScenarioTreeBuilder().build("보이스피싱", "easy"))
+
+        assert tree.protagonist is not None
+        assert registry.counter(metrics.LLM_FALLBACKS) == 0
+        assert registry.counter(metrics.LLM_REQUESTS, purpose="node", outcome="ok") > 0
+        leaves = [n for n in tree.nodes.values() if not n.choices]
+        assert leaves and all(n.type.startswith("ending_") for n in leaves)
+        assert all(n.image_url for n in tree.nodes.values() if n.image_prompt)
+        assert any((offline / "images" / tree.id).glob("*.png"))
+
+    def test_crawl_and_analyze_runs_without_network(self, offline):
+        articles = asyncio.run(news_crawler.crawl_and_analyze(["신종사기"]))
+        assert articles
+        assert all(a.source == "fake" and a.phishing_type for a in articles)
+
+    def test_crawler_task_reports_metrics(self, offline, monkeypatch):
+        from fastapi.testclient import TestClient
+        from app.main import app
+        from app.api.routes import crawler
+
+        monkeypatch.setattr(crawler, "NEWS_CACHE_DIR", offline / "news_cache")
+        (offline / "news_cache").mkdir()
+        monkeypatch.setattr(crawler, "analyzed_articles", {})
+        monkeypatch.setitem(crawler.crawler_tasks, "crawl_test", {"status": "pending", "metrics": metrics.Metrics()})
+
+        asyncio.run(crawler._run_in_task_scope("crawl_test", crawler._run_refresh, ["신종사기"]))
+
+        status = TestClient(app).get("/api/v1/crawler/status/crawl_test").json()
+        assert status["status"] == "completed"
+        assert status["metrics"]["llm"]["article"]["calls"] > 0
+
@@ -0,0 +1,34 @@
+"""JSON 코덱 테스트"""
+import json
+
+from app.core import json_codec
+from app.core.scenario_storage import JsonFileStorage
+from app.models.scenario import ScenarioTree
+
+
+class TestJsonCodec:
+    def test_compact_and_pretty_roundtrip(self):
+        data = {"title": "검찰 사칭", "nodes": [1, 2]}
+        compact = json_codec.dumps(data)
+        assert b"\n" not in compact
+        assert "검찰".encode("utf-8") in compact  # ensure_ascii 아님
+        assert b"\n  " in json_codec.dumps(data, pretty=True)
+        assert json_codec.loads(compact) == data
+
+    def test_reads_legacy_pretty_file(self, tmp_path, make_tree):
+        legacy = tmp_path / "legacy.json"
+        legacy.write_text(
+            json.dumps(make_tree("legacy").model_dump(mode="json"), ensure_ascii=False, indent=2),
+            encoding="utf-8",
+        )
+        assert json_codec.read_model(legacy, ScenarioTree) == make_tree("legacy")
+
+    def test_storage_writes_compact_by_default(self, tmp_path, make_tree):
+        storage = JsonFileStorage([tmp_path])
+        storage.save(make_tree("compact"))
+        raw = (tmp_path / "compact.json").read_bytes()
+        assert b"\n" not in raw
+        assert storage.load("compact") == make_tree("compact")
+
+        JsonFileStorage([tmp_path], pretty=True).save(make_tree("pretty"))
+        assert b"\n  " in (tmp_path / "pretty.json").read_bytes()
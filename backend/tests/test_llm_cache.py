@@ -0,0 +1,127 @@
+"""LLM 응답 캐시 테스트 (litellm 호출은 가짜로 대체)"""
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.config import settings
+from app.core import llm
+from app.core.llm_cache import LLMResponseCache, cache_key
+
+MESSAGES = [{"role": "system", "content": "요약하세요"}, {"role": "user", "content": "상황"}]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = LLMResponseCache(tmp_path / "llm_cache.db", ttl=60, max_bytes=1024)
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def llm_calls(monkeypatch, cache):
+    calls = []
+
+    async def fake_acompletion(**kwargs):
+        calls.append(kwargs)
+        content = kwargs["messages"][-1]["content"]
+        if kwargs.get("response_format"):
+            content = json.dumps({"echo": content, "n": len(calls)})
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=f" {content} "))])
+
+    monkeypatch.setattr(llm.litellm, "acompletion", fake_acompletion)
+    monkeypatch.setattr(llm, "response_cache", cache)
+    monkeypatch.setattr(settings, "llm_cache_enabled", True)
+    monkeypatch.setattr(settings, "llm_cache_disabled", [])
+    monkeypatch.setattr(settings, "llm_cache_bypass", ["node"])
+    return calls
+
+
+class TestCacheKey:
+    def test_stable_across_dict_order(self):
+        a = cache_key("m", [{"role": "user", "content": "x"}], {"type": "json_object"}, None)
+        b = cache_key("m", [{"content": "x", "role": "user"}], {"type": "json_object"}, None)
+        assert a == b
+
+    @pytest.mark.parametrize("change", [
+        {"model": "other"},
+        {"response_format": None},
+        {"temperature": 0.2},
+    ])
+    def test_each_field_changes_key(self, change):
+        base = {"model": "m", "messages": MESSAGES, "response_format": {"type": "json_object"}, "temperature": None}
+        assert cache_key(**base) != cache_key(**{**base, **change})
+
+
+class TestLLMResponseCache:
+    def test_ttl_expiry(self, cache):
+        cache.put("k", "summary", "응답")
+        assert cache.get("k") == "응답"
+        cache.ttl = -1
+        assert cache.get("k") is None
+
+    def test_lru_eviction_by_size(self, cache):
+        for key in ("a", "b", "c"):
+            cache.put(key, "summary", "x" * 300)
+            time.sleep(0.01)
+        cache.get("a")  # a를 최근 사용으로
+        cache.put("d", "summary", "x" * 300)
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        count, total = cache.usage()
+        assert count == 3 and total <= cache.max_bytes
+
+    def test_oversized_entry_not_stored(self, cache):
+        cache.put("big", "summary", "x" * 2048)
+        assert cache.usage() == (0, 0)
+
+
+class TestComplete:
+    def test_second_call_hits_cache(self, llm_calls, cache):
+        async def run():
+            first = await llm.complete("summary", MESSAGES, parse=str.strip)
+            second = await llm.complete("summary", MESSAGES, parse=str.strip)
+            return first, second
+
+        assert asyncio.run(run()) == ("상황", "상황")
+        assert len(llm_calls) == 1
+        assert cache.stats()["summary"] == {"hits": 1, "misses": 1, "bypassed": 0, "hit_rate": 0.5}
+
+    def test_bypass_stores_without_lookup(self, llm_calls, cache, monkeypatch):
+        async def run():
+            await llm.complete("node", MESSAGES)
+            await llm.complete("node", MESSAGES)
+            monkeypatch.setattr(settings, "llm_cache_bypass", [])
+            return await llm.complete("node", MESSAGES)
+
+        assert asyncio.run(run()) == " 상황 "
+        assert len(llm_calls) == 2
+        assert cache.stats()["node"]["bypassed"] == 2
+        assert cache.stats()["node"]["hits"] == 1
+
+    def test_disabled_purpose_and_per_call_flag(self, llm_calls, cache, monkeypatch):
+        monkeypatch.setattr(settings, "llm_cache_disabled", ["education"])
+
+        async def run():
+            await llm.complete("education", MESSAGES)
+            await llm.complete("summary", MESSAGES, cache=False)
+
+        asyncio.run(run())
+        assert cache.usage() == (0, 0)
+
+    def test_parse_failure_not_cached(self, llm_calls, cache):
+        def strict(content):
+            raise ValueError("bad")
+
+        with pytest.raises(ValueError):
+            asyncio.run(llm.complete("article", MESSAGES, response_format={"type": "json_object"}, parse=strict))
+        assert cache.usage() == (0, 0)
+
+        data = asyncio.run(llm.complete("article", MESSAGES, response_format={"type": "json_object"}, parse=json.loads))
+        assert data == {"echo": "상황", "n": 2}
+
+    def test_unknown_purpose_rejected(self, llm_calls):
+        with pytest.raises(ValueError):
+            asyncio.run(llm.complete("chat", MESSAGES))
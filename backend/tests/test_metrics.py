@@ -0,0 +1,101 @@
+"""파이프라인 메트릭 테스트"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.core import llm, metrics
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    fresh = metrics.Metrics()
+    monkeypatch.setattr(metrics, "registry", fresh)
+    return fresh
+
+
+class TestMetrics:
+    def test_render_prometheus_text(self, registry):
+        metrics.inc(metrics.LLM_REQUESTS, purpose="node", outcome="ok")
+        metrics.observe(metrics.LLM_SECONDS, 0.3, purpose="node")
+        metrics.observe(metrics.LLM_SECONDS, 7.0, purpose="node")
+        text = registry.render()
+        assert "# TYPE phishguard_llm_request_seconds histogram" in text
+        assert 'phishguard_llm_requests_total{outcome="ok",purpose="node"} 1' in text
+        assert 'phishguard_llm_request_seconds_bucket{purpose="node",le="0.5"} 1' in text
+        assert 'phishguard_llm_request_seconds_bucket{purpose="node",le="10"} 2' in text
+        assert 'phishguard_llm_request_seconds_bucket{purpose="node",le="+Inf"} 2' in text
+        assert 'phishguard_llm_request_seconds_count{purpose="node"} 2' in text
+
+    def test_task_scope_records_into_task_and_global(self, registry):
+        task_metrics = metrics.Metrics()
+
+        async def run():
+            with metrics.task_scope(task_metrics):
+                with metrics.phase("expand"):
+                    await asyncio.gather(*[
+                        asyncio.to_thread(metrics.record_image_call, 1.5, "ok"),
+                        asyncio.sleep(0),
+                    ])
+                    metrics.record_retry("node")
+                    metrics.record_fallback("siblings", 2)
+            metrics.record_retry("node")  # 범위 밖: 전역에만
+
+        asyncio.run(run())
+        summary = task_metrics.summary()
+        assert set(summary["phases"]) == {"expand"}
+        assert summary["llm"]["node"]["retries"] == 1
+        assert summary["llm"]["siblings"]["fallbacks"] == 2
+        assert summary["images"] == {"calls": 1, "errors": 0, "retries": 0, "seconds": 1.5}
+        assert registry.counter(metrics.LLM_RETRIES, purpose="node") == 2
+
+
+class TestLLMInstrumentation:
+    def test_complete_records_latency_tokens_and_errors(self, registry, monkeypatch):
+        async def fake_acompletion(**kwargs):
+            usage = SimpleNamespace(prompt_tokens=120, completion_tokens=30)
+            return SimpleNamespace(
+                choices=[SimpleNamespace(message=SimpleNamespace(content="not json"))], usage=usage
+            )
+
+        monkeypatch.setattr(llm.litellm, "acompletion", fake_acompletion)
+        monkeypatch.setattr(settings, "llm_cache_enabled", False)
+        messages = [{"role": "user", "content": "x"}]
+
+        async def run():
+            await llm.complete("summary", messages)
+            with pytest.raises(ValueError):
+                await llm.complete("article", messages, parse=lambda c: int(c))
+
+        asyncio.run(run())
+        assert registry.counter(metrics.LLM_REQUESTS, purpose="summary", outcome="ok") == 1
+        assert registry.counter(metrics.LLM_REQUESTS, purpose="article", outcome="error") == 1
+        assert registry.counter(metrics.LLM_TOKENS, purpose="summary", kind="prompt") == 120
+        assert registry.histogram(metrics.LLM_SECONDS)[0] == 2
+
+
+def test_metrics_endpoint(registry, admin_token):
+    from app.main import app
+
+    metrics.inc(metrics.IMAGE_REQUESTS, outcome="ok")
+    client = TestClient(app)
+    assert client.get("/metrics").status_code == 403
+    client.cookies.set("admin_token", admin_token)
+    res = client.get("/metrics")
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("text/plain")
+    assert 'phishguard_image_requests_total{outcome="ok"} 1' in res.text
+
+
+def test_metrics_endpoint_bearer_token(registry, monkeypatch):
+    from app.main import app
+
+    client = TestClient(app)
+    headers = {"Authorization": "Bearer scrape-secret"}
+    # 토큰이 설정되지 않았으면 Bearer 헤더로는 조회 불가
+    assert client.get("/metrics", headers=headers).status_code == 403
+    monkeypatch.setattr(settings, "metrics_token", "scrape-secret")
+    assert client.get("/metrics", headers=headers).status_code == 200
+    assert client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 403
@@ -0,0 +1,137 @@
+"""시나리오 API 테스트 (ASGI 앱 경유)"""
+import asyncio
+import gzip
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.models.scenario import ScenarioTree
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch, make_tree):
+    from app.main import app
+    from app.api.routes import scenario as scenario_routes
+    from app.core.scenario_catalog import ScenarioCatalog
+    from app.core.scenario_storage import JsonFileStorage
+
+    storage = JsonFileStorage([tmp_path / "seed", tmp_path / "generated"])
+    monkeypatch.setattr(scenario_routes, "scenario_storage", storage)
+    monkeypatch.setattr(scenario_routes, "scenario_catalog", ScenarioCatalog(storage))
+    app.state.limiter.enabled = False
+    asyncio.run(scenario_routes._save_scenario(make_tree("scenario_api")))
+    yield TestClient(app)
+    app.state.limiter.enabled = True
+
+
+class TestGetScenarioCaching:
+    def test_identity_response_matches_model(self, client):
+        res = client.get("/api/v1/scenarios/scenario_api", headers={"Accept-Encoding": "identity"})
+        assert res.status_code == 200
+        assert "content-encoding" not in res.headers
+        assert ScenarioTree.model_validate(res.json()).id == "scenario_api"
+        assert res.headers["etag"].startswith('"')
+
+    def test_gzip_variant(self, client):
+        res = client.get(
+            "/api/v1/scenarios/scenario_api",
+            headers={"Accept-Encoding": "gzip"},
+        )
+        assert res.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in res.headers["vary"]
+        assert res.json()["id"] == "scenario_api"  # httpx가 자동 해제
+
+    def test_if_none_match_returns_304(self, client):
+        first = client.get("/api/v1/scenarios/scenario_api")
+        etag = first.headers["etag"]
+        res = client.get("/api/v1/scenarios/scenario_api", headers={"If-None-Match": etag})
+        assert res.status_code == 304
+        assert res.content == b""
+
+    def test_etag_changes_when_scenario_saved(self, client, make_tree):
+        from app.api.routes import scenario as scenario_routes
+        etag = client.get("/api/v1/scenarios/scenario_api").headers["etag"]
+        tree = make_tree("scenario_api")
+        tree.title = "수정됨"
+        asyncio.run(scenario_routes._save_scenario(tree))
+        res = client.get("/api/v1/scenarios/scenario_api", headers={"If-None-Match": etag})
+        assert res.status_code == 200
+        assert res.json()["title"] == "수정됨"
+
+    def test_missing_scenario_404(self, client):
+        assert client.get("/api/v1/scenarios/nope").status_code == 404
+
+
+class TestListScenarios:
+    def test_cursor_pagination_via_header(self, client, make_tree):
+        from app.api.routes import scenario as scenario_routes
+        asyncio.run(scenario_routes._save_scenario(make_tree("scenario_api_2")))
+
+        res = client.get("/api/v1/scenarios?limit=1&sort=title&order=asc")
+        assert res.status_code == 200
+        assert len(res.json()) == 1
+        cursor = res.headers["x-next-cursor"]
+
+        res = client.get(f"/api/v1/scenarios?limit=1&sort=title&order=asc&cursor={cursor}")
+        assert len(res.json()) == 1
+        assert "x-next-cursor" not in res.headers
+
+    def test_invalid_cursor_400(self, client):
+        assert client.get("/api/v1/scenarios?cursor=garbage").status_code == 400
+
+    def test_filters(self, client):
+        assert client.get("/api/v1/scenarios?difficulty=hard").json() == []
+        res = client.get("/api/v1/scenarios?created_from=2024-12-31T00:00:00Z&difficulty=easy")
+        assert [s["id"] for s in res.json()] == ["scenario_api"]
+
+
+class TestScenarioNodes:
+    def test_root_with_prefetch(self, client):
+        res = client.get("/api/v1/scenarios/scenario_api/nodes/node_001?prefetch_depth=1")
+        assert res.status_code == 200
+        data = res.json()
+        assert data["root_node_id"] == "node_001"
+        assert data["prologue"] == "평범한 오후였습니다."
+        assert set(data["nodes"]) == {"node_001", "node_002", "node_003"}
+
+    def test_depth_zero_returns_only_node(self, client):
+        res = client.get("/api/v1/scenarios/scenario_api/nodes/node_001?prefetch_depth=0")
+        assert set(res.json()["nodes"]) == {"node_001"}
+
+    def test_unknown_node_404(self, client):
+        res = client.get("/api/v1/scenarios/scenario_api/nodes/node_999")
+        assert res.status_code == 404
+        res = client.get("/api/v1/scenarios/scenario_api/nodes/node_001?prefetch_depth=9")
+        assert res.status_code == 422
+
+
+class TestRegenerateImages:
+    def test_seed_scenario_is_not_writable(self, client, make_tree, tmp_path, admin_token):
+        from app.core.scenario_storage import JsonFileStorage
+        JsonFileStorage([tmp_path / "seed"]).save(make_tree("seed_only"))
+        seed_file = tmp_path / "seed" / "seed_only.json"
+        before = seed_file.read_bytes()
+        client.cookies.set("admin_token", admin_token)
+
+        assert client.get("/api/v1/scenarios/seed_only").status_code == 200
+        res = client.post("/api/v1/scenarios/seed_only/regenerate-images")
+        assert res.status_code == 404
+        assert seed_file.read_bytes() == before
+
+
+class TestEncodingHelpers:
+    def test_select_encoding_prefers_supported(self):
+        from app.core.http_cache import select_encoding, SUPPORTED_ENCODINGS
+        assert select_encoding(None) is None
+        assert select_encoding("identity") is None
+        assert select_encoding("gzip;q=0, deflate") is None
+        assert select_encoding("gzip, br") == SUPPORTED_ENCODINGS[0]
+
+    def test_gzip_roundtrip_and_weak_match(self):
+        from app.core.http_cache import EncodedPayload
+        payload = EncodedPayload(json.dumps({"a": "가"}).encode())
+        assert gzip.decompress(payload.encoded("gzip")) == payload.body
+        assert payload.matches(f"W/{payload.etag}")
+        assert payload.matches(payload.etag_for("gzip"))
+        assert not payload.matches('"other"')
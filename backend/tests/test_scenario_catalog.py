@@ -0,0 +1,176 @@
+"""시나리오 카탈로그 테스트"""
+import json
+import os
+from datetime import datetime, timezone
+
+import pytest
+
+from app.models.scenario import ScenarioTree, ScenarioNode
+
+
+def _make_tree(scenario_id: str, title: str = "테스트 시나리오", **kwargs) -> ScenarioTree:
+    fields = dict(
+        id=scenario_id,
+        title=title,
+        description="설명",
+        phishing_type="보이스피싱",
+        difficulty="easy",
+        root_node_id="node_001",
+        nodes={"node_001": ScenarioNode(id="node_001", type="ending_good", text="끝")},
+        created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+    )
+    fields.update(kwargs)
+    return ScenarioTree(**fields)
+
+
+def _write(directory, tree: ScenarioTree):
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{tree.id}.json"
+    path.write_text(json.dumps(tree.model_dump(mode="json"), ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def catalog(tmp_path, monkeypatch):
+    from app.core.scenario_catalog import ScenarioCatalog
+    from app.core.scenario_storage import JsonFileStorage
+    calls = []
+    original = JsonFileStorage.load_file
+
+    def counting_load(path):
+        calls.append(path.name)
+        return original(path)
+
+    monkeypatch.setattr(JsonFileStorage, "load_file", staticmethod(counting_load))
+    cat = ScenarioCatalog(JsonFileStorage([tmp_path / "seed", tmp_path / "generated"]))
+    cat.calls = calls
+    return cat
+
+
+class TestScenarioCatalog:
+    def test_list_served_from_index_without_parsing(self, catalog, tmp_path):
+        _write(tmp_path / "seed", _make_tree("scenario_a"))
+        _write(tmp_path / "generated", _make_tree("scenario_b"))
+
+        catalog.refresh()
+        summaries = {s["id"]: s for s in catalog.list()}
+        assert set(summaries) == {"scenario_a", "scenario_b"}
+        assert summaries["scenario_a"]["created_at"] == "2025-01-01T00:00:00+00:00"
+        assert catalog.calls == []
+        assert (tmp_path / "generated" / "_index.json").exists()
+
+    def test_get_reparses_only_changed(self, catalog, tmp_path):
+        path_b = _write(tmp_path / "generated", _make_tree("scenario_b"))
+        catalog.refresh()
+        assert catalog.get("scenario_b").title == "테스트 시나리오"
+        assert catalog.get("scenario_b").title == "테스트 시나리오"
+        assert len(catalog.calls) == 1
+
+        _write(tmp_path / "generated", _make_tree("scenario_b", title="변경된 제목"))
+        os.utime(path_b, ns=(0, 10**9))
+        catalog.refresh()
+        assert catalog.get("scenario_b").title == "변경된 제목"
+        assert catalog.list()[0]["title"] == "변경된 제목"
+        assert len(catalog.calls) == 2
+
+    def test_deleted_file_is_dropped(self, catalog, tmp_path):
+        path = _write(tmp_path / "generated", _make_tree("scenario_c"))
+        catalog.refresh()
+        path.unlink()
+        catalog.refresh()
+        assert catalog.get("scenario_c") is None
+        assert catalog.list() == []
+
+    def test_broken_file_skipped(self, catalog, tmp_path):
+        (tmp_path / "generated").mkdir(parents=True)
+        (tmp_path / "generated" / "broken.json").write_text("{", encoding="utf-8")
+        catalog.refresh()
+        assert catalog.list() == []
+
+    def test_seed_wins_on_duplicate_id(self, catalog, tmp_path):
+        _write(tmp_path / "seed", _make_tree("dup", title="시드"))
+        _write(tmp_path / "generated", _make_tree("dup", title="생성"))
+        catalog.refresh()
+        assert catalog.get("dup").title == "시드"
+        assert len(catalog.list()) == 1
+        (tmp_path / "seed" / "dup.json").unlink()
+        catalog.refresh()
+        assert catalog.get("dup").title == "생성"
+
+    def test_put_updates_without_parsing(self, catalog, tmp_path):
+        tree = _make_tree("scenario_d")
+        path = _write(tmp_path / "generated", tree)
+        catalog.put(tree)
+        catalog.refresh()
+        assert catalog.get("scenario_d") is tree
+        assert catalog.calls == []
+
+    def test_put_does_not_cache_write_shadowed_by_seed(self, catalog, tmp_path):
+        _write(tmp_path / "seed", _make_tree("dup", title="시드"))
+        generated = _make_tree("dup", title="생성")
+        _write(tmp_path / "generated", generated)
+        catalog.put(generated)
+        assert catalog.get("dup").title == "시드"
+        assert catalog.search_index.version("dup") is None
+
+    def test_get_uses_direct_path_without_refresh(self, catalog, tmp_path):
+        _write(tmp_path / "generated", _make_tree("scenario_g"))
+        # refresh() 없이도 {id}.json 경로로 바로 조회
+        assert catalog.get("scenario_g").id == "scenario_g"
+        assert catalog.get("../generated/scenario_g") is None
+        assert catalog.get("_index") is None
+
+
+class TestTreeCache:
+    def _entry(self, size):
+        from app.core.scenario_catalog import _CachedTree
+        return _CachedTree(version=(1,), size=size, scenario=_make_tree("x"))
+
+    def test_evicts_by_entry_count(self, tmp_path):
+        from app.core.scenario_catalog import TreeCache
+        cache = TreeCache(max_entries=2, max_bytes=10_000)
+        for name in ("a", "b", "c"):
+            cache.put(tmp_path / name, self._entry(10))
+        assert cache.keys() == [tmp_path / "b", tmp_path / "c"]
+
+    def test_evicts_by_bytes_and_keeps_recent(self, tmp_path):
+        from app.core.scenario_catalog import TreeCache
+        cache = TreeCache(max_entries=10, max_bytes=100)
+        cache.put(tmp_path / "a", self._entry(40))
+        cache.put(tmp_path / "b", self._entry(40))
+        assert cache.get(tmp_path / "a", (1,)) is not None  # a를 최근 사용으로
+        cache.put(tmp_path / "c", self._entry(40))
+        assert cache.keys() == [tmp_path / "a", tmp_path / "c"]
+        assert cache.total_bytes == 80
+
+    def test_stale_entry_invalidated(self, tmp_path):
+        from app.core.scenario_catalog import TreeCache
+        cache = TreeCache(max_entries=10, max_bytes=100)
+        cache.put(tmp_path / "a", self._entry(40))
+        assert cache.get(tmp_path / "a", (2,)) is None
+        assert len(cache) == 0
+
+
+class TestScenarioIndex:
+    def test_persisted_index_reused_on_cold_start(self, tmp_path, monkeypatch):
+        from app.core import scenario_index
+        _write(tmp_path, _make_tree("scenario_e"))
+        scenario_index.ScenarioIndex(tmp_path).sync()
+
+        # 새 프로세스 가정: 변경 없는 파일은 다시 읽지 않아야 함
+        def fail(_data):
+            raise AssertionError("요약을 다시 추출하면 안 됨")
+        monkeypatch.setattr(scenario_index, "summarize", fail)
+        index = scenario_index.ScenarioIndex(tmp_path)
+        assert index.sync() is False
+        assert [s["id"] for _, s in index.items()] == ["scenario_e"]
+
+    def test_cli_rebuild_and_remove(self, tmp_path):
+        from app.core.scenario_index import main, ScenarioIndex
+        _write(tmp_path, _make_tree("scenario_f"))
+        assert main(["rebuild", str(tmp_path)]) == 0
+        assert [s["id"] for _, s in ScenarioIndex(tmp_path).items()] == ["scenario_f"]
+
+        assert main(["remove", "scenario_f", str(tmp_path)]) == 0
+        data = json.loads((tmp_path / "_index.json").read_text(encoding="utf-8"))
+        assert data["entries"] == {}
@@ -0,0 +1,102 @@
+"""시나리오 목록 조회 (필터/정렬/커서) 테스트"""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.core.scenario_query import (
+    ScenarioQuery, InvalidCursorError, encode_cursor, decode_cursor,
+)
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def storage(request, tmp_path, make_tree):
+    from app.core.scenario_storage import JsonFileStorage, SqliteScenarioStorage
+    if request.param == "json":
+        store = JsonFileStorage([tmp_path / "seed", tmp_path / "generated"])
+    else:
+        store = SqliteScenarioStorage(tmp_path / "scenarios.db")
+
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    for i in range(7):
+        tree = make_tree(f"scenario_{i}")
+        tree.title = f"시나리오 {6 - i}"
+        tree.difficulty = "hard" if i % 2 else "easy"
+        tree.created_at = base + timedelta(days=i)
+        store.save(tree)
+    yield store
+    if request.param == "sqlite":
+        store.close()
+
+
+def _collect(storage, **kwargs) -> list[str]:
+    """커서를 따라 모든 페이지 수집"""
+    query = ScenarioQuery(**kwargs)
+    ids = []
+    while True:
+        page, cursor = storage.query(query)
+        assert len(page) <= query.limit
+        ids.extend(s["id"] for s in page)
+        if cursor is None:
+            return ids
+        query.cursor = decode_cursor(query, encode_cursor(query, cursor))
+
+
+class TestScenarioQuery:
+    def test_pages_newest_first(self, storage):
+        ids = _collect(storage, limit=3)
+        assert ids == [f"scenario_{i}" for i in range(6, -1, -1)]
+
+    def test_sort_by_title_ascending(self, storage):
+        ids = _collect(storage, sort="title", descending=False, limit=2)
+        assert ids == [f"scenario_{i}" for i in range(6, -1, -1)]
+
+    def test_filters_and_created_range(self, storage):
+        ids = _collect(
+            storage, difficulty="hard", limit=1,
+            created_from="2025-01-02T00:00:00+00:00",
+            created_to="2025-01-06T00:00:00+00:00",
+        )
+        assert ids == ["scenario_3", "scenario_1"]
+        assert _collect(storage, phishing_type="없는유형") == []
+
+    def test_resave_moves_entry(self, storage, make_tree):
+        tree = make_tree("scenario_0")
+        tree.created_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        storage.save(tree)
+        page, _ = storage.query(ScenarioQuery(limit=2))
+        assert [s["id"] for s in page] == ["scenario_0", "scenario_6"]
+        assert len(_collect(storage)) == 7
+
+    def test_non_utc_offsets_compare_as_instants(self, storage, make_tree):
+        kst = timezone(timedelta(hours=9))
+        # 2025-01-07T08:00+09:00 = 2025-01-06T23:00Z (scenario_6과 scenario_5 사이)
+        tree = make_tree("scenario_kst")
+        tree.created_at = datetime(2025, 1, 7, 8, tzinfo=kst)
+        storage.save(tree)
+        assert _collect(storage, limit=2)[:3] == ["scenario_6", "scenario_kst", "scenario_5"]
+        assert _collect(storage, created_from="2025-01-07T00:00:00+00:00") == ["scenario_6"]
+
+    def test_seed_file_offsets_normalized_in_index(self, tmp_path, make_tree):
+        import json
+        from app.core.scenario_storage import JsonFileStorage
+        (tmp_path / "seed").mkdir()
+        data = make_tree("seed_kst").model_dump(mode="json")
+        data["created_at"] = "2025-01-01T08:00:00+09:00"
+        (tmp_path / "seed" / "seed_kst.json").write_text(json.dumps(data), encoding="utf-8")
+        storage = JsonFileStorage([tmp_path / "seed", tmp_path / "generated"])
+        later = make_tree("generated_utc")
+        later.created_at = datetime(2025, 1, 1, 1, tzinfo=timezone.utc)
+        storage.save(later)
+        storage.refresh()
+
+        assert _collect(storage, descending=False) == ["seed_kst", "generated_utc"]
+        assert _collect(storage, created_from="2025-01-01T00:00:00+00:00") == ["generated_utc"]
+        assert {s["id"]: s["created_at"] for s in storage.summaries()}["seed_kst"] == "2024-12-31T23:00:00+00:00"
+
+    def test_cursor_bound_to_sort_order(self):
+        query = ScenarioQuery(sort="title")
+        token = encode_cursor(query, ("제목", "scenario_1"))
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(ScenarioQuery(sort="created_at"), token)
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(query, "not-a-cursor")
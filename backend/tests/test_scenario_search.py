@@ -0,0 +1,83 @@
+"""시나리오 전문 검색 테스트"""
+import asyncio
+
+import pytest
+
+from app.core.scenario_search import ScenarioSearchIndex, tokenize
+from app.core.scenario_storage import scenario_summary
+from app.models.scenario import DangerFeedback
+
+
+@pytest.fixture
+def index(make_tree):
+    idx = ScenarioSearchIndex()
+    for scenario_id, title in [("s1", "검찰 사칭"), ("s2", "택배 문자"), ("s3", "검찰청 안내")]:
+        tree = make_tree(scenario_id)
+        tree.title = title
+        if scenario_id != "s1":
+            tree.nodes["node_001"].text = "안내 문자가 왔습니다."
+            tree.nodes["node_003"].text = "링크를 눌렀습니다."
+        idx.add(tree, scenario_summary(tree))
+    return idx
+
+
+class TestTokenize:
+    def test_bigrams_survive_particles(self):
+        assert "검찰" in tokenize("검찰이라며")
+        assert {"at", "tm"} <= set(tokenize("ATM으로"))
+        assert "돈" in tokenize("돈을 보내")
+
+
+class TestScenarioSearchIndex:
+    def test_all_words_must_match(self, index):
+        ids = [r["id"] for r in index.search("검찰 사칭 ATM")]
+        assert ids == ["s1"]
+        assert {r["id"] for r in index.search("검찰")} == {"s1", "s3"}
+        assert index.search("보험") == []
+        assert index.search("  ") == []
+
+    def test_title_ranks_higher_than_body(self, index, make_tree):
+        tree = make_tree("s4")
+        tree.title = "기타"
+        tree.nodes["node_001"].text = "택배가 도착했습니다."
+        index.add(tree, scenario_summary(tree))
+        assert [r["id"] for r in index.search("택배")] == ["s2", "s4"]
+
+    def test_choice_feedback_indexed_and_reindex_replaces(self, index, make_tree):
+        tree = make_tree("s1")
+        tree.nodes["node_001"].choices[1].danger_feedback = DangerFeedback(
+            why_dangerous="원격제어 앱 설치 유도", warning_signs=[], safe_alternative="끊기",
+        )
+        tree.nodes["node_003"].text = "현금을 건넸습니다."
+        index.add(tree, scenario_summary(tree))
+        assert [r["id"] for r in index.search("원격제어")] == ["s1"]
+        assert index.search("ATM") == []
+
+        index.remove("s1")
+        assert index.search("원격제어") == []
+        assert len(index) == 2
+
+
+class TestSearchApi:
+    def test_requires_admin_and_updates_on_save(self, tmp_path, monkeypatch, make_tree):
+        from fastapi.testclient import TestClient
+        from app.main import app
+        from app.api.deps import require_admin
+        from app.api.routes import scenario as scenario_routes
+        from app.core.scenario_catalog import ScenarioCatalog
+        from app.core.scenario_storage import JsonFileStorage
+
+        storage = JsonFileStorage([tmp_path / "seed", tmp_path / "generated"])
+        monkeypatch.setattr(scenario_routes, "scenario_storage", storage)
+        monkeypatch.setattr(scenario_routes, "scenario_catalog", ScenarioCatalog(storage))
+        client = TestClient(app)
+        assert client.get("/api/v1/scenarios/search?q=검찰").status_code == 403
+
+        app.dependency_overrides[require_admin] = lambda: None
+        try:
+            asyncio.run(scenario_routes._save_scenario(make_tree("scenario_find")))
+            data = client.get("/api/v1/scenarios/search?q=검찰 ATM").json()
+            assert [r["id"] for r in data["results"]] == ["scenario_find"]
+            assert data["indexed"] == 1
+        finally:
+            app.dependency_overrides.clear()
@@ -0,0 +1,152 @@
+"""시나리오 저장소 테스트 (JSON / SQLite)"""
+import json
+
+import pytest
+
+from app.models.scenario import Choice, DangerFeedback, EducationalContent, Resources
+
+
+@pytest.fixture
+def sqlite_storage(tmp_path):
+    from app.core.scenario_storage import SqliteScenarioStorage
+    storage = SqliteScenarioStorage(tmp_path / "scenarios.db")
+    yield storage
+    storage.close()
+
+
+class TestSqliteStorage:
+    def test_roundtrip_preserves_tree(self, sqlite_storage, make_tree):
+        tree = make_tree("scenario_sql")
+        tree.nodes["node_001"].choices[1].danger_feedback = DangerFeedback(
+            why_dangerous="사칭", warning_signs=["송금 요구"], safe_alternative="끊기"
+        )
+        tree.nodes["node_003"].educational_content = EducationalContent(
+            title="주의", explanation="설명", prevention_tips=["a"], warning_signs=["b"]
+        )
+        tree.nodes["node_003"].resources = Resources(trust=5, money=1, awareness=0)
+        sqlite_storage.save(tree)
+        loaded = sqlite_storage.load("scenario_sql")
+        assert loaded.model_dump() == tree.model_dump()
+        assert list(loaded.nodes) == list(tree.nodes)
+
+    def test_adds_resources_column_to_old_db(self, tmp_path, make_tree):
+        import sqlite3
+        from app.core.scenario_storage import SqliteScenarioStorage, _SCHEMA
+        db_path = tmp_path / "old.db"
+        conn = sqlite3.connect(db_path)
+        conn.executescript(_SCHEMA.replace("    resources           TEXT,\n", ""))
+        conn.close()
+
+        storage = SqliteScenarioStorage(db_path)
+        storage.save(make_tree("scenario_old"))
+        assert storage.load("scenario_old").nodes["node_001"].resources is None
+        storage.close()
+
+    def test_offset_created_at_normalized_on_open(self, tmp_path, make_tree):
+        import sqlite3
+        from app.core.scenario_storage import SqliteScenarioStorage
+        db_path = tmp_path / "offsets.db"
+        storage = SqliteScenarioStorage(db_path)
+        storage.save(make_tree("scenario_kst"))
+        storage.close()
+        conn = sqlite3.connect(db_path)
+        with conn:
+            conn.execute("UPDATE scenarios SET created_at = '2025-01-01T09:00:00+09:00'")
+        conn.close()
+
+        storage = SqliteScenarioStorage(db_path)
+        assert storage.summaries()[0]["created_at"] == "2025-01-01T00:00:00+00:00"
+        storage.close()
+
+    def test_summaries_filter_by_indexed_columns(self, sqlite_storage, make_tree):
+        sqlite_storage.save(make_tree("scenario_a"))
+        other = make_tree("scenario_b")
+        other.difficulty = "hard"
+        sqlite_storage.save(other)
+        assert [s["id"] for s in sqlite_storage.summaries(difficulty="hard")] == ["scenario_b"]
+        assert len(sqlite_storage.summaries(phishing_type="보이스피싱")) == 2
+        assert sqlite_storage.summaries()[0]["created_at"] == "2025-01-01T00:00:00+00:00"
+
+    def test_update_single_node_bumps_revision(self, sqlite_storage, make_tree):
+        tree = make_tree("scenario_c")
+        sqlite_storage.save(tree)
+        version_before, _ = sqlite_storage.version("scenario_c")
+
+        node = tree.nodes["node_002"].model_copy()
+        node.image_url = "/api/v1/images/scenario_c/node_002.png"
+        sqlite_storage.update_nodes("scenario_c", [node])
+
+        assert sqlite_storage.version("scenario_c")[0] != version_before
+        assert sqlite_storage.load_node("scenario_c", "node_002").image_url == node.image_url
+        assert list(sqlite_storage.load("scenario_c").nodes) == list(tree.nodes)
+
+    def test_update_node_replaces_choices(self, sqlite_storage, make_tree):
+        tree = make_tree("scenario_d")
+        sqlite_storage.save(tree)
+        node = tree.nodes["node_001"].model_copy()
+        node.choices = [Choice(id="node_001_c9", text="새 선택", next_node_id="node_002")]
+        sqlite_storage.update_nodes("scenario_d", [node])
+        assert [c.id for c in sqlite_storage.load_node("scenario_d", "node_001").choices] == ["node_001_c9"]
+
+    def test_delete(self, sqlite_storage, make_tree):
+        sqlite_storage.save(make_tree("scenario_e"))
+        assert sqlite_storage.delete("scenario_e") is True
+        assert sqlite_storage.load("scenario_e") is None
+        assert sqlite_storage.version("scenario_e") is None
+
+
+class TestJsonStorage:
+    def test_update_nodes_rewrites_source_file(self, tmp_path, make_tree):
+        from app.core.scenario_storage import JsonFileStorage
+        storage = JsonFileStorage([tmp_path / "seed", tmp_path / "generated"])
+        tree = make_tree("scenario_f")
+        storage.save(tree)
+        node = tree.nodes["node_002"].model_copy()
+        node.image_url = "/img.png"
+        storage.update_nodes("scenario_f", [node])
+        data = json.loads((tmp_path / "generated" / "scenario_f.json").read_text(encoding="utf-8"))
+        assert data["nodes"]["node_002"]["image_url"] == "/img.png"
+
+    def test_update_nodes_never_touches_seed_file(self, tmp_path, make_tree):
+        from app.core.scenario_storage import JsonFileStorage
+        seed_only = JsonFileStorage([tmp_path / "seed"])
+        seed_only.save(make_tree("seed_only"))
+        seed_only.save(make_tree("dup"))
+        seed_bytes = {p.name: p.read_bytes() for p in (tmp_path / "seed").glob("*.json")}
+        storage = JsonFileStorage([tmp_path / "seed", tmp_path / "generated"], pretty=True)
+        storage.save(make_tree("dup"))
+        node = make_tree("dup").nodes["node_002"]
+        node.image_url = "/img.png"
+
+        # 시드에만 있는 ID: 읽기는 되지만 수정 대상이 아님
+        assert storage.load("seed_only") is not None
+        assert storage.load_writable("seed_only") is None
+        with pytest.raises(KeyError):
+            storage.update_nodes("seed_only", [node])
+
+        # 시드와 생성 디렉토리에 모두 있는 ID: 생성 파일만 갱신
+        storage.update_nodes("dup", [node])
+        data = json.loads((tmp_path / "generated" / "dup.json").read_text(encoding="utf-8"))
+        assert data["nodes"]["node_002"]["image_url"] == "/img.png"
+        assert {p.name: p.read_bytes() for p in (tmp_path / "seed").glob("*.json")} == seed_bytes
+
+
+class TestMigration:
+    def test_migrate_json_to_sqlite_seed_wins(self, tmp_path, make_tree):
+        from app.core.scenario_storage import JsonFileStorage, SqliteScenarioStorage, migrate_json_to_sqlite
+        seed = JsonFileStorage([tmp_path / "seed"])
+        gen = JsonFileStorage([tmp_path / "generated"])
+        seed_tree = make_tree("dup")
+        seed_tree.title = "시드"
+        seed.save(seed_tree)
+        gen.save(make_tree("dup"))
+        gen.save(make_tree("only_generated"))
+
+        count = migrate_json_to_sqlite([tmp_path / "seed", tmp_path / "generated"], tmp_path / "db.sqlite")
+        assert count == 2
+        storage = SqliteScenarioStorage(tmp_path / "db.sqlite")
+        try:
+            assert storage.load("dup").title == "시드"
+            assert storage.load("only_generated") is not None
+        finally:
+            storage.close()
@@ -0,0 +1,82 @@
+"""시나리오 디렉토리 감시 테스트"""
+import asyncio
+import json
+
+import pytest
+
+from app.core.scenario_catalog import ScenarioCatalog
+from app.core.scenario_query import ScenarioQuery
+from app.core.scenario_storage import JsonFileStorage
+from app.core.scenario_watcher import ScenarioWatcher
+
+
+def _drop(path, tree):
+    """스크립트/수동 배치처럼 저장소를 거치지 않고 파일 작성"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(tree.model_dump(mode="json"), ensure_ascii=False), encoding="utf-8")
+
+
+@pytest.fixture
+def watcher(tmp_path):
+    storage = JsonFileStorage([tmp_path / "seed", tmp_path / "generated"])
+    catalog = ScenarioCatalog(storage)
+    catalog.refresh(force=True)
+    catalog.watched = True
+    return ScenarioWatcher(storage, catalog, mode="poll")
+
+
+class TestScenarioWatcher:
+    def test_add_modify_delete_events(self, watcher, tmp_path, make_tree):
+        path = tmp_path / "generated" / "scenario_w.json"
+        _drop(path, make_tree("scenario_w"))
+        assert watcher.apply({path}) == {"scenario_w"}
+        assert [s["id"] for s in watcher.catalog.list()] == ["scenario_w"]
+        assert watcher.catalog.get("scenario_w").title == "검찰 사칭"
+
+        tree = make_tree("scenario_w")
+        tree.title = "수정됨"
+        _drop(path, tree)
+        watcher.apply({path})
+        assert watcher.catalog.list()[0]["title"] == "수정됨"
+        assert watcher.catalog.get("scenario_w").title == "수정됨"
+
+        path.unlink()
+        assert watcher.apply({path}) == {"scenario_w"}
+        assert watcher.catalog.list() == []
+        assert watcher.storage.query(ScenarioQuery())[0] == []
+
+    def test_seed_keeps_precedence(self, watcher, tmp_path, make_tree):
+        seed = make_tree("dup")
+        seed.title = "시드"
+        _drop(tmp_path / "seed" / "dup.json", seed)
+        _drop(tmp_path / "generated" / "dup.json", make_tree("dup"))
+        watcher.apply({tmp_path / "generated" / "dup.json", tmp_path / "seed" / "dup.json"})
+        assert watcher.catalog.list()[0]["title"] == "시드"
+
+        (tmp_path / "seed" / "dup.json").unlink()
+        watcher.apply({tmp_path / "seed" / "dup.json"})
+        assert watcher.catalog.list()[0]["title"] == "검찰 사칭"
+
+    def test_request_path_refresh_disabled_while_watching(self, watcher, tmp_path, make_tree):
+        _drop(tmp_path / "generated" / "late.json", make_tree("late"))
+        watcher.catalog.refresh()
+        assert watcher.catalog.list() == []
+
+    def test_poll_mode_picks_up_changes(self, tmp_path, make_tree):
+        storage = JsonFileStorage([tmp_path / "seed", tmp_path / "generated"])
+        catalog = ScenarioCatalog(storage)
+        watcher = ScenarioWatcher(storage, catalog, mode="poll", poll_interval=0.01)
+
+        async def scenario():
+            await watcher.start()
+            assert catalog.watched
+            _drop(tmp_path / "generated" / "polled.json", make_tree("polled"))
+            for _ in range(100):
+                if catalog.list():
+                    break
+                await asyncio.sleep(0.01)
+            await watcher.stop()
+
+        asyncio.run(scenario())
+        assert [s["id"] for s in catalog.list()] == ["polled"]
+        assert not catalog.watched
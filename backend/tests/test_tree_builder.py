@@ -0,0 +1,129 @@
+"""트리 빌더 BFS 확장 테스트 (LLM 호출은 가짜 결과로 대체)"""
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from app.models.scenario import ScenarioTree, Resources
+from app.pipeline import node_generator, tree_builder
+from app.pipeline.node_generator import GenerationResult, ChoiceResult, result_to_node
+from app.pipeline.tree_builder import ScenarioTreeBuilder, BranchState
+
+
+def _result(depth: int) -> GenerationResult:
+    if depth >= 3:
+        return GenerationResult(node_type="ending_bad", narrative_text="끝", choices=[], reasoning="")
+    return GenerationResult(
+        node_type="narrative",
+        narrative_text=f"깊이 {depth}",
+        choices=[
+            ChoiceResult(text="의심한다", is_dangerous=False, resource_effect={"awareness": 2, "trust": -1}),
+            ChoiceResult(text="송금한다", is_dangerous=True, resource_effect={"money": -2, "trust": 2}),
+        ],
+        reasoning="",
+    )
+
+
+@pytest.fixture
+def fake_generation(monkeypatch):
+    contexts = []
+
+    async def fake_generate_node(context):
+        contexts.append(context)
+        return _result(context.current_depth)
+
+    async def fake_story_path(path, depth, choice_taken=None, summary_cache=None):
+        return " / ".join(node.text for node, _ in path)
+
+    monkeypatch.setattr(tree_builder, "generate_node", fake_generate_node)
+    monkeypatch.setattr(tree_builder, "build_story_path", fake_story_path)
+    return contexts
+
+
+def _expand_all(builder: ScenarioTreeBuilder) -> ScenarioTree:
+    root = result_to_node(_result(0), builder._next_node_id(), depth=0)
+    root.resources = Resources()
+    tree = ScenarioTree(
+        id="scenario_bfs", title="t", description="d", phishing_type="보이스피싱",
+        difficulty="easy", root_node_id=root.id, nodes={root.id: root},
+        created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+    )
+
+    async def run():
+        state = BranchState.root(root)
+        frontier = [(state, c) for c in root.choices]
+        while frontier:
+            frontier = await builder._expand_level(tree, "보이스피싱", "easy", frontier)
+
+    asyncio.run(run())
+    return tree
+
+
+class TestBranchState:
+    def test_frontier_state_matches_full_trace(self, fake_generation):
+        builder = ScenarioTreeBuilder()
+        tree = _expand_all(builder)
+        assert len(tree.nodes) == 1 + 2 + 4 + 8
+
+        for node in tree.nodes.values():
+            # 저장된 누적 자원 == 루트부터 재계산한 값
+            path = builder._trace_path_to(tree, node.id)
+            assert node.resources == builder._compute_resources(path)
+
+        deepest = [c for c in fake_generation if c.current_depth == 3]
+        assert all(c.story_path.count(" / ") == 2 for c in deepest)
+
+    def test_child_derivation_and_recent_choices(self, fake_generation):
+        root = result_to_node(_result(0), "node_001", depth=0)
+        state = BranchState.root(root)
+        danger = root.choices[1]
+        for depth in range(1, 5):
+            child = result_to_node(_result(1), f"node_{depth + 1:03d}", depth=depth)
+            state = state.child(child, danger)
+        assert state.resources == Resources(trust=5, money=0, awareness=1)
+        assert state.recent_choices == (danger, danger, danger)
+        assert state.path_node_ids() == ["node_001", "node_002", "node_003", "node_004", "node_005"]
+
+
+class TestSiblingExpansion:
+    def test_one_call_per_parent_with_per_choice_fallback(self, fake_generation, monkeypatch):
+        sibling_calls = []
+
+        async def fake_siblings(contexts):
+            sibling_calls.append(contexts)
+            results = [_result(c.current_depth) for c in contexts]
+            if contexts[0].current_depth == 2:
+                results[-1] = None  # 마지막 자식은 검증 실패 → 선택지별 호출
+            return results
+
+        monkeypatch.setattr(tree_builder.settings, "expansion_mode", "sibling")
+        monkeypatch.setattr(tree_builder, "generate_sibling_nodes", fake_siblings)
+        builder = ScenarioTreeBuilder()
+        tree = _expand_all(builder)
+
+        assert len(tree.nodes) == 1 + 2 + 4 + 8
+        assert len(sibling_calls) == 1 + 2 + 4
+        # 형제는 같은 경로를 공유하고 선택지/자원만 다름
+        assert all(len({c.story_path for c in contexts}) == 1 for contexts in sibling_calls)
+        assert [c.current_depth for c in fake_generation] == [2, 2]
+        for node in tree.nodes.values():
+            path = builder._trace_path_to(tree, node.id)
+            assert node.resources == builder._compute_resources(path)
+
+    def test_generate_sibling_nodes_marks_invalid_children(self, monkeypatch):
+        async def fake_complete(purpose, messages, **kwargs):
+            assert purpose == "siblings"
+            assert "[choice_2]" in messages[1]["content"]
+            return {"children": {"choice_1": _result(1).model_dump(), "choice_2": {"node_type": "narrative"}}}
+
+        monkeypatch.setattr(node_generator.llm, "complete", fake_complete)
+        context = node_generator.GenerationContext(
+            phishing_type="보이스피싱", difficulty="easy", story_path="이야기", choice_taken="끊는다",
+            current_resources=Resources(), current_depth=1, max_depth=5,
+            should_end=False, force_end=False, ending_type_hint=None,
+        )
+        results = asyncio.run(node_generator.generate_sibling_nodes(
+            [context, context.model_copy(update={"choice_taken": "따른다"})]
+        ))
+        assert results[0].narrative_text == "깊이 1"
+        assert results[1] is None
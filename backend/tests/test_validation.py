@@ -0,0 +1,158 @@
+"""구조 검증 (BFS 도달성) / 복구 / 증분 재검증 테스트"""
+import asyncio
+
+from app.models.scenario import ScenarioNode, Choice
+from app.pipeline.repair import repair_tree
+from app.pipeline.tree_builder import ScenarioTreeBuilder
+from app.pipeline.validation import ErrorType, scan_structure, validate_structure
+
+
+def _types(errors) -> set[tuple[ErrorType, str | None]]:
+    return {(e.error_type, e.node_id) for e in errors}
+
+
+def _narrative(node_id: str, *targets: str | None, depth: int = 1) -> ScenarioNode:
+    return ScenarioNode(
+        id=node_id, type="narrative", text="상황", depth=depth,
+        choices=[Choice(id=f"{node_id}_c{i + 1}", text="선택", next_node_id=t) for i, t in enumerate(targets)],
+    )
+
+
+class TestValidateStructure:
+    def test_valid_tree(self, make_tree):
+        assert validate_structure(make_tree("s")) == []
+
+    def test_detached_cycle_is_orphan(self, make_tree):
+        tree = make_tree("s")
+        # 서로만 참조하는 순환 (참조는 되지만 루트에서 도달 불가)
+        tree.nodes["loop_a"] = _narrative("loop_a", "loop_b")
+        tree.nodes["loop_b"] = _narrative("loop_b", "loop_a")
+        assert _types(validate_structure(tree)) == {
+            (ErrorType.ORPHAN_NODE, "loop_a"), (ErrorType.ORPHAN_NODE, "loop_b"),
+        }
+
+    def test_detached_subtree_is_orphan_entirely(self, make_tree):
+        tree = make_tree("s")
+        tree.nodes["lost"] = _narrative("lost", "lost_end")
+        tree.nodes["lost_end"] = ScenarioNode(id="lost_end", type="ending_good", text="끝", depth=2)
+        # 끊어진 서브트리 안의 오류는 고아로만 보고
+        tree.nodes["lost_end"].choices = [Choice(id="x", text="x", next_node_id="missing")]
+        assert _types(validate_structure(tree)) == {
+            (ErrorType.ORPHAN_NODE, "lost"), (ErrorType.ORPHAN_NODE, "lost_end"),
+        }
+
+    def test_all_error_classes_in_one_pass(self, make_tree, monkeypatch):
+        from app.config import settings
+        monkeypatch.setattr(settings, "max_depth", 1)
+        tree = make_tree("s")
+        tree.nodes["node_002"] = _narrative("node_002", "node_004", None)
+        tree.nodes["node_004"] = _narrative("node_004", "gone", depth=2)
+        tree.nodes["node_005"] = _narrative("node_005", None, depth=2)
+        tree.nodes["node_006"] = ScenarioNode(id="node_006", type="ending_good", text="끝")
+        tree.nodes["node_003"].type = "narrative"
+
+        errors = validate_structure(tree)
+        assert _types(errors) == {
+            (ErrorType.ORPHAN_NODE, "node_005"),
+            (ErrorType.ORPHAN_NODE, "node_006"),
+            (ErrorType.BROKEN_LINK, "node_004"),
+            (ErrorType.NO_GOOD_ENDING, None),  # 도달 가능한 GOOD 엔딩 없음 (node_006은 고아)
+            (ErrorType.NO_BAD_ENDING, None),
+            (ErrorType.LEAF_NOT_ENDING, "node_003"),
+            (ErrorType.DEPTH_EXCEEDED, "node_004"),
+        }
+        # 복구 순서대로 정렬
+        order = list(ErrorType)
+        assert [order.index(e.error_type) for e in errors] == sorted(order.index(e.error_type) for e in errors)
+
+    def test_missing_root_does_not_orphan_everything(self, make_tree):
+        tree = make_tree("s")
+        del tree.nodes["node_001"]
+        assert _types(validate_structure(tree)) == {(ErrorType.BROKEN_LINK, None)}
+
+
+class TestIncrementalRevalidation:
+    def _damaged(self, make_tree):
+        tree = make_tree("s")
+        tree.nodes["node_002"] = _narrative("node_002", "gone", None)
+        tree.nodes["lost"] = _narrative("lost", "lost")
+        tree.nodes["node_003"].type = "narrative"
+        return tree
+
+    def test_repair_reports_touched_nodes(self, make_tree):
+        tree = self._damaged(make_tree)
+        touched = repair_tree(tree, validate_structure(tree))
+        assert "lost" in touched and "lost" not in tree.nodes
+        assert {"node_002", "fallback_node_002_c1", "node_003", "fallback_good"} <= touched
+        assert "node_001" not in touched
+
+    def test_incremental_matches_full_validation(self, make_tree):
+        tree = self._damaged(make_tree)
+        report = scan_structure(tree)
+        for _ in range(3):
+            touched = repair_tree(tree, report.errors)
+            report = scan_structure(tree, previous=report, touched=touched)
+            assert _types(report.errors) == _types(validate_structure(tree))
+            assert report.reachable == scan_structure(tree).reachable
+        assert report.errors == []
+
+    def test_incremental_checks_only_affected_region(self, make_tree):
+        tree = make_tree("s")
+        for i in range(50):
+            node_id = f"extra_{i}"
+            tree.nodes["node_001"].choices.append(Choice(id=f"c_{i}", text="선택", next_node_id=node_id))
+            tree.nodes[node_id] = ScenarioNode(id=node_id, type="ending_bad", text="끝", depth=1)
+        tree.nodes["extra_0"].type = "narrative"
+
+        report = scan_structure(tree)
+        assert report.checked == len(tree.nodes)
+        touched = repair_tree(tree, report.errors)
+        report = scan_structure(tree, previous=report, touched=touched)
+        assert report.errors == [] and report.checked == 1
+
+    def test_unconnected_fallback_becomes_orphan(self, make_tree):
+        tree = make_tree("s")
+        tree.nodes["node_002"].type = "ending_bad"
+        report = scan_structure(tree)
+        assert _types(report.errors) == {(ErrorType.NO_GOOD_ENDING, None)}
+        # 빈 선택지가 없어 폴백 GOOD 엔딩을 연결할 곳이 없음
+        touched = repair_tree(tree, report.errors)
+        report = scan_structure(tree, previous=report, touched=touched)
+        assert _types(report.errors) == {(ErrorType.ORPHAN_NODE, "fallback_good"), (ErrorType.NO_GOOD_ENDING, None)}
+
+    def test_incremental_falls_back_to_full_without_root(self, make_tree):
+        tree = make_tree("s")
+        tree.root_node_id = "missing"
+        tree.nodes = {
+            "a": _narrative("a", "b", None, depth=0),
+            "b": ScenarioNode(id="b", type="ending_good", text="끝", depth=1),
+        }
+        report = scan_structure(tree)
+        touched = repair_tree(tree, report.errors)
+        report = scan_structure(tree, previous=report, touched=touched)
+        assert _types(report.errors) == _types(validate_structure(tree)) == {(ErrorType.BROKEN_LINK, None)}
+
+        # 복구가 실제 노드를 고아로 오인해 지우지 않음
+        tree = asyncio.run(ScenarioTreeBuilder()._validate_and_repair(tree))
+        assert set(tree.nodes) == {"a", "b"}
+
+    def test_incremental_matches_full_for_detached_subtree(self, make_tree):
+        tree = make_tree("s")
+        tree.nodes["node_002"].type = "narrative"
+        tree.nodes["node_002"].choices = [Choice(id="node_002_c1", text="선택", next_node_id=None)]
+        tree.nodes["lost"] = _narrative("lost", "lost_end")
+        tree.nodes["lost_end"] = ScenarioNode(id="lost_end", type="ending_good", text="끝", depth=2)
+        report = scan_structure(tree)
+        assert (ErrorType.NO_GOOD_ENDING, None) in _types(report.errors)
+        for _ in range(3):
+            touched = repair_tree(tree, report.errors)
+            report = scan_structure(tree, previous=report, touched=touched)
+            full = scan_structure(tree)
+            assert _types(report.errors) == _types(full.errors)
+            assert report.reachable == full.reachable
+            assert (report.good_endings, report.bad_endings) == (full.good_endings, full.bad_endings)
+
+    def test_builder_validate_and_repair(self, make_tree):
+        tree = self._damaged(make_tree)
+        tree = asyncio.run(ScenarioTreeBuilder()._validate_and_repair(tree))
+        assert validate_structure(tree) == []
@@ -71,6 +71,8 @@ export default function ScenarioSelectPage() {
   const [scenarios, setScenarios] = useState<ScenarioListItem[]>([]);
   const [error, setError] = useState<string | null>(null);
   const [isLoading, setIsLoading] = useState(true);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
   const [isLoginModalOpen, setIsLoginModalOpen] = useState(false);
 
   const { isAdmin, isLoading: isAdminLoading } = useAdminStore();
@@ -78,8 +80,9 @@ export default function ScenarioSelectPage() {
   useEffect(() => {
     const loadScenarios = async () => {
       try {
-        const data = await fetchScenarios();
-        setScenarios(data);
+        const page = await fetchScenarios();
+        setScenarios(page.items);
+        setNextCursor(page.nextCursor);
       } catch (e) {
         setError(e instanceof Error ? e.message : "시나리오를 불러올 수 없습니다");
       } finally {
@@ -90,6 +93,20 @@ export default function ScenarioSelectPage() {
     loadScenarios();
   }, []);
 
+  const loadMore = async () => {
+    if (!nextCursor) return;
+    setIsLoadingMore(true);
+    try {
+      const page = await fetchScenarios({ cursor: nextCursor });
+      setScenarios((prev) => [...prev, ...page.items]);
+      setNextCursor(page.nextCursor);
+    } catch (e) {
+      setError(e instanceof Error ? e.message : "시나리오를 불러올 수 없습니다");
+    } finally {
+      setIsLoadingMore(false);
+    }
+  };
+
   if (isLoading || isAdminLoading) {
     return (
       <main className="min-h-screen p-6 flex items-center justify-center">
@@ -165,6 +182,19 @@ export default function ScenarioSelectPage() {
           </div>
         )}
 
+        {/* 더 보기 (커서 페이지네이션) */}
+        {!error && nextCursor && (
+          <div className="mt-6 text-center">
+            <button
+              onClick={loadMore}
+              disabled={isLoadingMore}
+              className="px-4 py-2 bg-gray-700 hover:bg-gray-600 disabled:opacity-50 text-gray-200 rounded-lg transition-colors"
+            >
+              {isLoadingMore ? "불러오는 중..." : "더 보기"}
+            </button>
+          </div>
+        )}
+
         {/* 하단 관리자 로그인 링크 (비관리자만 표시) */}
         {!isAdmin && (
           <div className="mt-8 text-center">
@@ -62,26 +62,74 @@ export async function verifyAdmin(): Promise<VerifyResponse> {
   return res.json();
 }
 
-/** 시나리오 목록 조회 */
-export async function fetchScenarios(): Promise<ScenarioListItem[]> {
-  const res = await fetch(`${BACKEND_URL}/api/v1/scenarios`, {
+export interface ScenarioListParams {
+  phishing_type?: string;
+  difficulty?: "easy" | "medium" | "hard";
+  created_from?: string;
+  created_to?: string;
+  sort?: "created_at" | "title";
+  order?: "asc" | "desc";
+  limit?: number;
+  cursor?: string;
+}
+
+export interface ScenarioListPage {
+  items: ScenarioListItem[];
+  nextCursor: string | null;
+}
+
+/** 시나리오 목록 조회 (한 페이지, 다음 페이지 커서는 X-Next-Cursor 헤더) */
+export async function fetchScenarios(
+  params: ScenarioListParams = {}
+): Promise<ScenarioListPage> {
+  const query = new URLSearchParams();
+  for (const [key, value] of Object.entries(params)) {
+    if (value !== undefined && value !== "") {
+      query.set(key, String(value));
+    }
+  }
+  const qs = query.toString();
+  const res = await fetch(`${BACKEND_URL}/api/v1/scenarios${qs ? `?${qs}` : ""}`, {
     cache: "no-store",
   });
   if (!res.ok) {
     throw new Error(`Failed to fetch scenarios: ${res.status}`);
   }
-  return res.json();
+  return {
+    items: await res.json(),
+    nextCursor: res.headers.get("X-Next-Cursor"),
+  };
 }
 
-/** 시나리오 상세 조회 */
+// 시나리오 상세 응답 캐시 (ETag 재검증용, id -> { etag, body })
+const scenarioCache = new Map<string, { etag: string; body: string }>();
+const SCENARIO_CACHE_MAX = 50;
+
+/** 시나리오 상세 조회 (ETag로 재검증, 304면 캐시된 본문 재사용) */
 export async function fetchScenario(id: string): Promise<ScenarioTree> {
+  const cached = scenarioCache.get(id);
   const res = await fetch(`${BACKEND_URL}/api/v1/scenarios/${id}`, {
     cache: "no-store",
+    headers: cached ? { "If-None-Match": cached.etag } : undefined,
   });
+  if (res.status === 304 && cached) {
+    return JSON.parse(cached.body);
+  }
   if (!res.ok) {
     throw new Error(`Failed to fetch scenario: ${res.status}`);
   }
-  return res.json();
+
+  const body = await res.text();
+  const etag = res.headers.get("ETag");
+  if (etag) {
+    scenarioCache.delete(id);
+    scenarioCache.set(id, { etag, body });
+    if (scenarioCache.size > SCENARIO_CACHE_MAX) {
+      const oldest = scenarioCache.keys().next().value;
+      if (oldest !== undefined) scenarioCache.delete(oldest);
+    }
+  }
+  return JSON.parse(body);
 }
 
 // ==================== 크롤러 API ====================
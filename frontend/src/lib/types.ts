@@ -57,6 +57,8 @@ export interface ScenarioNode {
   depth: number;
   parent_node_id: string | null;
   parent_choice_id: string | null;
+  /** 이 노드 도달 시점의 누적 자원 (생성 시 기록, 이전 시나리오는 없음) */
+  resources?: Resources | null;
 }
 
 /** 시나리오 트리 */
@@ -27,7 +27,12 @@ while IFS= read -r file; do
             SCENARIOS+=("$file|$id|$title")
         fi
     fi
-done < <(find "$SCENARIOS_DIR" -name "*.json" -type f 2>/dev/null | sort)
+done < <(find "$SCENARIOS_DIR" -name "*.json" ! -name "_*" -type f 2>/dev/null | sort)
+
+# 요약 인덱스(_index.json)에서 항목 제거
+remove_from_index() {
+    (cd "$BACKEND_DIR" && python3 -m app.core.scenario_index remove "$1" "$SCENARIOS_DIR" >/dev/null 2>&1)
+}
 
 # 시나리오가 없는 경우
 if [ ${#SCENARIOS[@]} -eq 0 ]; then
@@ -73,6 +78,7 @@ if [ "$choice" = "0" ]; then
         IFS='|' read -r file id title <<< "$scenario"
         # 시나리오 파일 삭제
         rm -f "$file"
+        remove_from_index "$id"
         # 관련 이미지 삭제
         rm -f "$IMAGES_DIR/${id}_"*.png 2>/dev/null
         echo "삭제됨: $id ($title)"
@@ -121,6 +127,7 @@ echo "삭제 중..."
 
 # 시나리오 파일 삭제
 rm -f "$file"
+remove_from_index "$id"
 echo "  - 시나리오 파일 삭제됨"
 
 # 관련 이미지 삭제